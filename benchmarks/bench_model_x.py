@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""Suite de benchmarks micro/macro para o Modelo X Framework
+
+Mede os caminhos críticos do pacote model_x em curvas de escala (10² a 10⁷
+elementos), com sementes fixas, e salva os tempos como baseline JSON. O
+comando `compare` aponta regressões acima de um limiar relativo.
+
+Uso:
+    python benchmarks/bench_model_x.py run --output benchmarks/results/baseline.json
+    python benchmarks/bench_model_x.py run --max-size 100000 --output benchmarks/results/atual.json
+    python benchmarks/bench_model_x.py compare benchmarks/results/baseline.json benchmarks/results/atual.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from model_x import (
+    EntropySyntropyCalculator,
+    EnergyModulationEngine,
+    SimulationEngine,
+    ModelXVisualizer,
+    ValidationUtils
+)
+
+SEED = 42
+DEFAULT_SIZES = [10**k for k in range(2, 8)]
+DEFAULT_THRESHOLD = 0.20
+
+
+# ==================== Dados sintéticos ====================
+
+def _rng(size):
+    """Gerador com semente fixa por tamanho (reprodutível entre execuções)"""
+    return np.random.default_rng(SEED + int(np.log10(size)))
+
+
+def _history(size, rng):
+    """Histórico sintético no formato de SimulationEngine.history"""
+    dilations = (1.0 + 0.1 * rng.standard_normal(size)).tolist()
+    entropies = rng.uniform(0, 1, size).tolist()
+    return [
+        {
+            'step': i,
+            'time': i * 0.01,
+            'state': {'entropy': e, 'syntropy': 1.0 - e, 'energy': 1.0},
+            'dilation': d
+        }
+        for i, (e, d) in enumerate(zip(entropies, dilations))
+    ]
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Suprime os prints de progresso dos métodos de exportação"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+# ==================== Definição dos benchmarks ====================
+# Cada setup recebe (size, rng, workdir) e devolve a função a ser cronometrada.
+
+def _setup_shannon_entropy(size, rng, workdir):
+    calc = EntropySyntropyCalculator()
+    data = rng.integers(0, 64, size)
+    return lambda: calc.calculate_shannon_entropy(data)
+
+
+def _setup_shannon_entropy_batch(size, rng, workdir):
+    calc = EntropySyntropyCalculator()
+    data = rng.integers(0, 64, (max(1, size // 100), min(size, 100)))
+    return lambda: calc.calculate_shannon_entropy_batch(data)
+
+
+def _setup_syntropy(size, rng, workdir):
+    calc = EntropySyntropyCalculator()
+    data = rng.integers(0, 64, size)
+    return lambda: calc.calculate_syntropy(data)
+
+
+def _setup_modulate_energy(size, rng, workdir):
+    engine = EnergyModulationEngine()
+    states = list(zip(rng.uniform(0, 1, size).tolist(),
+                      rng.uniform(0, 1, size).tolist(),
+                      rng.uniform(0.1, 2, size).tolist()))
+
+    def run():
+        for entropy, syntropy, energy in states:
+            engine.modulate_energy(entropy, syntropy, energy)
+    return run
+
+
+def _setup_run_simulation(size, rng, workdir):
+    """Lote de size // 100 simulações (≈ size passos no total)
+
+    A simulação determinística para sempre no passo 100, qualquer que seja
+    max_steps; o que cresce com `size` é o número de estados iniciais.
+    """
+    engine = SimulationEngine(dt=0.01)
+    initial_states = [
+        {'entropy': e, 'syntropy': s, 'energy': energy}
+        for e, s, energy in zip(rng.uniform(0, 0.5, max(1, size // 100)).tolist(),
+                                rng.uniform(0.5, 1, max(1, size // 100)).tolist(),
+                                rng.uniform(1, 2, max(1, size // 100)).tolist())
+    ]
+
+    def run():
+        for initial_state in initial_states:
+            engine.run_simulation(initial_state)
+    return run
+
+
+def _setup_get_statistics(size, rng, workdir):
+    engine = SimulationEngine()
+    engine.history = _history(size, rng)
+    return engine.get_statistics
+
+
+def _setup_ascii_plot(size, rng, workdir):
+    viz = ModelXVisualizer()
+    data = np.cumsum(rng.standard_normal(size)).tolist()
+    return lambda: viz.ascii_plot(data, "benchmark")
+
+
+def _setup_export_simulation_data(size, rng, workdir):
+    viz = ModelXVisualizer()
+    history = _history(size, rng)
+    filename = os.path.join(workdir, 'export_simulation_data.json')
+
+    def run():
+        with _quiet():
+            viz.export_simulation_data(history, filename)
+    return run
+
+
+def _setup_export_simulation_results(size, rng, workdir):
+    history = _history(size, rng)
+    filename = os.path.join(workdir, 'export_simulation_results.json')
+
+    def run():
+        with _quiet():
+            ValidationUtils.export_simulation_results(history, filename)
+    return run
+
+
+def _setup_pipeline(size, rng, workdir):
+    """Macro: dados → entropia/sintropia → simulação → estatísticas → gráfico → exportação"""
+    calc = EntropySyntropyCalculator()
+    viz = ModelXVisualizer()
+    data = rng.integers(0, 64, size)
+    filename = os.path.join(workdir, 'pipeline.json')
+
+    def run():
+        entropy = calc.calculate_shannon_entropy(data)
+        syntropy = calc.calculate_syntropy(data)
+        engine = SimulationEngine(max_steps=1000)
+        history = engine.run_simulation({'entropy': entropy, 'syntropy': syntropy, 'energy': 1.0})
+        engine.get_statistics()
+        viz.ascii_plot([h['dilation'] for h in history])
+        with _quiet():
+            viz.export_simulation_data(history, filename)
+    return run
+
+
+# nome → (tipo, setup, tamanho máximo razoável em memória/tempo)
+BENCHMARKS = {
+    'calculate_shannon_entropy': ('micro', _setup_shannon_entropy, 10**7),
+    'calculate_shannon_entropy_batch': ('micro', _setup_shannon_entropy_batch, 10**7),
+    'calculate_syntropy': ('micro', _setup_syntropy, 10**7),
+    'modulate_energy': ('micro', _setup_modulate_energy, 10**6),
+    'run_simulation': ('micro', _setup_run_simulation, 10**6),
+    'get_statistics': ('micro', _setup_get_statistics, 10**4),  # desvio padrão atual é O(n²)
+    'ascii_plot': ('micro', _setup_ascii_plot, 10**7),
+    'export_simulation_data': ('micro', _setup_export_simulation_data, 10**5),
+    'export_simulation_results': ('micro', _setup_export_simulation_results, 10**5),
+    'pipeline': ('macro', _setup_pipeline, 10**7),
+}
+
+
+# ==================== Execução e comparação ====================
+
+def _time(func, repeat, number=None):
+    """Melhor e mediana do tempo por chamada (timeit com autorange)"""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return number, min(times), float(np.median(times))
+
+
+def run_benchmarks(sizes=None, names=None, repeat=3, number=None, max_size=None, verbose=True):
+    """Executa os benchmarks e retorna o dicionário serializável em JSON"""
+    sizes = sorted(sizes or DEFAULT_SIZES)
+    names = names or list(BENCHMARKS)
+
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Benchmarks desconhecidos: {', '.join(sorted(unknown))}")
+
+    results = []
+    workdir = tempfile.mkdtemp(prefix='modelx_bench_')
+    try:
+        for name in names:
+            kind, setup, bench_max_size = BENCHMARKS[name]
+            for size in sizes:
+                if size > bench_max_size or (max_size is not None and size > max_size):
+                    continue
+
+                func = setup(size, _rng(size), workdir)
+                calls, best, median = _time(func, repeat, number)
+                results.append({
+                    'benchmark': name,
+                    'kind': kind,
+                    'size': size,
+                    'number': calls,
+                    'best': best,
+                    'median': median,
+                    'per_item': best / size
+                })
+                if verbose:
+                    print(f"{name:<34} n={size:<10} best={best:.6e}s  median={median:.6e}s")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'seed': SEED,
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Compara dois resultados e retorna as regressões acima do limiar relativo
+
+    Cada regressão é um dict {benchmark, size, baseline, current, ratio}; as
+    entradas são pareadas por (benchmark, size) e comparadas pelo melhor tempo.
+    """
+    reference = {(r['benchmark'], r['size']): r['best'] for r in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        key = (result['benchmark'], result['size'])
+        if key not in reference or reference[key] <= 0:
+            continue
+
+        ratio = result['best'] / reference[key]
+        if ratio > 1.0 + threshold:
+            regressions.append({
+                'benchmark': key[0],
+                'size': key[1],
+                'baseline': reference[key],
+                'current': result['best'],
+                'ratio': ratio
+            })
+
+    return regressions
+
+
+def save_results(results, filename):
+    """Salva resultados como baseline JSON"""
+    dir_path = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(dir_path, exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return filename
+
+
+def load_results(filename):
+    """Carrega resultados salvos por save_results"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do Modelo X Framework")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Executa a suite e salva os tempos em JSON")
+    run_parser.add_argument('--output', default='benchmarks/results/latest.json')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    run_parser.add_argument('--max-size', type=int, default=None)
+    run_parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=None)
+    run_parser.add_argument('--repeat', type=int, default=3)
+
+    compare_parser = subparsers.add_parser('compare', help="Compara resultados com um baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help="Aumento relativo tolerado (0.2 = 20%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_benchmarks(args.sizes, args.only, args.repeat, max_size=args.max_size)
+        save_results(results, args.output)
+        print(f"✅ Resultados salvos em {args.output}")
+        return 0
+
+    regressions = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    if not regressions:
+        print(f"✅ Nenhuma regressão acima de {args.threshold:.0%}")
+        return 0
+
+    print(f"⚠️  {len(regressions)} regressão(ões) acima de {args.threshold:.0%}:")
+    for r in regressions:
+        print(f"   {r['benchmark']:<34} n={r['size']:<10} "
+              f"{r['baseline']:.6e}s → {r['current']:.6e}s (x{r['ratio']:.2f})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
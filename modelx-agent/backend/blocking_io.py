@@ -0,0 +1,71 @@
+"""
+Blocking I/O - Execução de chamadas bloqueantes fora do event loop.
+
+Busca web, memória em disco, SQLite das conversas e chamadas HTTP aos LLMs
+são bloqueantes; o backend async as envia para um executor limitado em vez
+de travar o event loop.
+
+Uso:
+    result = await run_blocking(func, *args)       # chamada única
+    async for item in iterate_blocking(iterator):   # iterador (ex.: stream do LLM)
+        ...
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Iterator
+
+
+# Executor limitado para I/O bloqueante (busca web, memória em disco, LLM).
+# O event loop fica livre: uma chamada lenta ao Ollama ocupa só um destes
+# workers, e no máximo IO_WORKERS chamadas bloqueantes rodam ao mesmo tempo.
+IO_WORKERS = int(os.getenv("MODELX_IO_WORKERS", "16"))
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="modelx-io")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Executa uma função bloqueante no IO_EXECUTOR sem travar o event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(IO_EXECUTOR, partial(func, *args, **kwargs))
+
+async def iterate_blocking(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """
+    Percorre um iterador bloqueante no IO_EXECUTOR e repassa os itens ao loop.
+
+    Um único worker consome o iterador inteiro; se o consumidor parar antes
+    do fim (cliente desconectou), o worker encerra o iterador no próximo item.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    end = object()
+
+    def pump():
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+        except Exception as exc:
+            loop.call_soon_threadsafe(queue.put_nowait, (end, exc))
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        loop.call_soon_threadsafe(queue.put_nowait, (end, None))
+
+    loop.run_in_executor(IO_EXECUTOR, pump)
+    try:
+        while True:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is end:
+                break
+            yield item
+    finally:
+        stop.set()
@@ -14,7 +14,8 @@ O sistema usa o Model X (X = σ - S) para:
 - Auto-avaliar a qualidade
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterator
+import json
 import time
 import logging
 import os
@@ -124,6 +125,100 @@ def _build_generation_options() -> Dict[str, Any]:
     }
 
 
+def _truncate_prompt(prompt: str) -> str:
+    """Trunca o prompt no meio se exceder MAX_PROMPT_LENGTH."""
+    original_length = len(prompt)
+    if original_length > MAX_PROMPT_LENGTH:
+        # Calcula o tamanho de cada parte considerando o texto de truncamento
+        truncation_text = "\n\n[... conteúdo truncado ...]\n\n"
+        available_length = MAX_PROMPT_LENGTH - len(truncation_text)
+        half_length = available_length // 2
+        
+        # Monta o prompt truncado garantindo que não exceda o limite
+        prompt = prompt[:half_length] + truncation_text + prompt[-half_length:]
+        logger.warning(
+            f"Prompt truncado de {original_length} para {len(prompt)} caracteres"
+        )
+    return prompt
+
+
+def _http_error_message(status_code: int, text: str) -> str:
+    return (
+        f"Erro ao chamar o modelo local (Ollama).\n\n"
+        f"Verifique se o Ollama está em execução e se o modelo \"{OLLAMA_MODEL_NAME}\" está disponível.\n\n"
+        f"Para instalar o modelo, execute:\n"
+        f"  ollama pull {OLLAMA_MODEL_NAME}\n\n"
+        f"Detalhes técnicos:\n"
+        f"  - Status HTTP: {status_code}\n"
+        f"  - Resposta: {text[:200]}"
+    )
+
+
+def _connection_error_message() -> str:
+    return (
+        f"Erro ao chamar o modelo local (Ollama).\n\n"
+        f"Não foi possível conectar ao Ollama em {OLLAMA_BASE_URL}.\n\n"
+        f"Verifique se o Ollama está em execução:\n"
+        f"  1. Instale o Ollama: https://ollama.ai/download\n"
+        f"  2. Execute: ollama serve\n"
+        f"  3. Em outro terminal: ollama pull {OLLAMA_MODEL_NAME}\n\n"
+        f"Dica: Você pode configurar a URL do Ollama com a variável de ambiente OLLAMA_URL.\n\n"
+        f"Detalhes técnicos: Conexão recusada"
+    )
+
+
+def _timeout_error_message(elapsed_time: float) -> str:
+    return (
+        f"Erro ao chamar o modelo local (Ollama).\n\n"
+        f"A requisição excedeu o tempo limite de {OLLAMA_TIMEOUT} segundos.\n\n"
+        f"Isso pode acontecer se:\n"
+        f"  - O modelo está sendo carregado pela primeira vez (aguarde e tente novamente)\n"
+        f"  - O prompt é muito longo\n"
+        f"  - O hardware não tem recursos suficientes\n\n"
+        f"Dica: Você pode aumentar o timeout com a variável de ambiente OLLAMA_TIMEOUT.\n\n"
+        f"Detalhes técnicos:\n"
+        f"  - Tempo decorrido: {elapsed_time:.2f}s\n"
+        f"  - Timeout configurado: {OLLAMA_TIMEOUT}s"
+    )
+
+
+def _request_error_message(error: Exception) -> str:
+    return (
+        f"Erro ao chamar o modelo local (Ollama).\n\n"
+        f"Ocorreu um erro de rede inesperado.\n\n"
+        f"Verifique se o Ollama está em execução e se o modelo \"{OLLAMA_MODEL_NAME}\" está disponível.\n\n"
+        f"Detalhes técnicos: {str(error)}"
+    )
+
+
+def _stream_error_message(detail: str) -> str:
+    return (
+        f"Erro ao chamar o modelo local (Ollama).\n\n"
+        f"O Ollama interrompeu a geração com um erro.\n\n"
+        f"Verifique se o Ollama está em execução e se o modelo \"{OLLAMA_MODEL_NAME}\" está disponível.\n\n"
+        f"Detalhes técnicos: {detail}"
+    )
+
+
+def _log_generation_metrics(result: Dict[str, Any], elapsed_time: float, answer: str):
+    """Loga tempo, tokens e velocidade a partir do JSON final do Ollama."""
+    # Log de métricas (com proteção completa contra divisão por zero)
+    eval_count = result.get("eval_count", 0)
+    eval_duration = result.get("eval_duration", 0)
+    
+    if eval_count > 0 and eval_duration > 0:
+        tokens_per_second = eval_count / (eval_duration / 1e9)
+    else:
+        tokens_per_second = 0.0
+    
+    logger.info(
+        f"Resposta em {elapsed_time:.2f}s - "
+        f"Tokens: {eval_count}, "
+        f"Velocidade: {tokens_per_second:.1f} tok/s - "
+        f"Preview: {answer[:80]}..."
+    )
+
+
 def call_llm(prompt: str, options: Optional[Dict[str, Any]] = None) -> str:
     """
     Chama o modelo local via Ollama.
@@ -143,19 +238,7 @@ def call_llm(prompt: str, options: Optional[Dict[str, Any]] = None) -> str:
             "Execute: pip install requests"
         )
     
-    # Trunca o prompt se necessário
-    original_length = len(prompt)
-    if original_length > MAX_PROMPT_LENGTH:
-        # Calcula o tamanho de cada parte considerando o texto de truncamento
-        truncation_text = "\n\n[... conteúdo truncado ...]\n\n"
-        available_length = MAX_PROMPT_LENGTH - len(truncation_text)
-        half_length = available_length // 2
-        
-        # Monta o prompt truncado garantindo que não exceda o limite
-        prompt = prompt[:half_length] + truncation_text + prompt[-half_length:]
-        logger.warning(
-            f"Prompt truncado de {original_length} para {len(prompt)} caracteres"
-        )
+    prompt = _truncate_prompt(prompt)
     
     # Usa opções padrão se não fornecidas
     gen_options = options or _build_generation_options()
@@ -187,79 +270,110 @@ def call_llm(prompt: str, options: Optional[Dict[str, Any]] = None) -> str:
         if response.status_code == 200:
             result = response.json()
             answer = result.get("response", "")
-            
-            # Log de métricas (com proteção completa contra divisão por zero)
-            eval_count = result.get("eval_count", 0)
-            eval_duration = result.get("eval_duration", 0)
-            
-            if eval_count > 0 and eval_duration > 0:
-                tokens_per_second = eval_count / (eval_duration / 1e9)
-            else:
-                tokens_per_second = 0.0
-            
-            logger.info(
-                f"Resposta em {elapsed_time:.2f}s - "
-                f"Tokens: {eval_count}, "
-                f"Velocidade: {tokens_per_second:.1f} tok/s - "
-                f"Preview: {answer[:80]}..."
-            )
-            
+            _log_generation_metrics(result, elapsed_time, answer)
             return answer
         else:
-            error_msg = (
-                f"Erro ao chamar o modelo local (Ollama).\n\n"
-                f"Verifique se o Ollama está em execução e se o modelo \"{OLLAMA_MODEL_NAME}\" está disponível.\n\n"
-                f"Para instalar o modelo, execute:\n"
-                f"  ollama pull {OLLAMA_MODEL_NAME}\n\n"
-                f"Detalhes técnicos:\n"
-                f"  - Status HTTP: {response.status_code}\n"
-                f"  - Resposta: {response.text[:200]}"
-            )
+            error_msg = _http_error_message(response.status_code, response.text)
             logger.error(error_msg)
             return error_msg
             
     except requests.exceptions.ConnectionError:
-        error_msg = (
-            f"Erro ao chamar o modelo local (Ollama).\n\n"
-            f"Não foi possível conectar ao Ollama em {OLLAMA_BASE_URL}.\n\n"
-            f"Verifique se o Ollama está em execução:\n"
-            f"  1. Instale o Ollama: https://ollama.ai/download\n"
-            f"  2. Execute: ollama serve\n"
-            f"  3. Em outro terminal: ollama pull {OLLAMA_MODEL_NAME}\n\n"
-            f"Dica: Você pode configurar a URL do Ollama com a variável de ambiente OLLAMA_URL.\n\n"
-            f"Detalhes técnicos: Conexão recusada"
-        )
+        error_msg = _connection_error_message()
         logger.error(error_msg)
         return error_msg
         
     except requests.exceptions.Timeout:
-        elapsed_time = time.time() - start_time
-        error_msg = (
-            f"Erro ao chamar o modelo local (Ollama).\n\n"
-            f"A requisição excedeu o tempo limite de {OLLAMA_TIMEOUT} segundos.\n\n"
-            f"Isso pode acontecer se:\n"
-            f"  - O modelo está sendo carregado pela primeira vez (aguarde e tente novamente)\n"
-            f"  - O prompt é muito longo\n"
-            f"  - O hardware não tem recursos suficientes\n\n"
-            f"Dica: Você pode aumentar o timeout com a variável de ambiente OLLAMA_TIMEOUT.\n\n"
-            f"Detalhes técnicos:\n"
-            f"  - Tempo decorrido: {elapsed_time:.2f}s\n"
-            f"  - Timeout configurado: {OLLAMA_TIMEOUT}s"
-        )
+        error_msg = _timeout_error_message(time.time() - start_time)
         logger.error(error_msg)
         return error_msg
         
     except requests.exceptions.RequestException as e:
-        error_msg = (
-            f"Erro ao chamar o modelo local (Ollama).\n\n"
-            f"Ocorreu um erro de rede inesperado.\n\n"
-            f"Verifique se o Ollama está em execução e se o modelo \"{OLLAMA_MODEL_NAME}\" está disponível.\n\n"
-            f"Detalhes técnicos: {str(e)}"
-        )
+        error_msg = _request_error_message(e)
         logger.error(error_msg)
         return error_msg
 
 
+def call_llm_stream(prompt: str, options: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    Chama o modelo local via Ollama com "stream": True.
+    
+    Produz os trechos da resposta à medida que o Ollama os gera. Como em
+    call_llm, falhas não levantam exceção: a mensagem de erro em português
+    é produzida como texto (depois de qualquer trecho já enviado).
+    
+    Args:
+        prompt: O prompt a ser enviado para o modelo.
+        options: Opções adicionais de geração (opcional).
+    
+    Yields:
+        Trechos da resposta do modelo.
+    """
+    try:
+        import requests
+    except ImportError:
+        yield (
+            "Erro: A biblioteca 'requests' não está instalada.\n"
+            "Execute: pip install requests"
+        )
+        return
+    
+    prompt = _truncate_prompt(prompt)
+    gen_options = options or _build_generation_options()
+    
+    logger.info(
+        f"Chamando Ollama em streaming ({OLLAMA_MODEL_NAME}) - "
+        f"Prompt: {len(prompt)} chars"
+    )
+    
+    start_time = time.time()
+    error_msg = None
+    
+    try:
+        response = requests.post(
+            OLLAMA_GENERATE_ENDPOINT,
+            json={
+                "model": OLLAMA_MODEL_NAME,
+                "prompt": prompt,
+                "stream": True,
+                "options": gen_options
+            },
+            timeout=OLLAMA_TIMEOUT,
+            stream=True
+        )
+        
+        with response:
+            if response.status_code != 200:
+                error_msg = _http_error_message(response.status_code, response.text)
+            else:
+                answer = []
+                for line in response.iter_lines(chunk_size=None):
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        error_msg = _stream_error_message(chunk["error"])
+                        break
+                    if chunk.get("response"):
+                        answer.append(chunk["response"])
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        _log_generation_metrics(chunk, time.time() - start_time, "".join(answer))
+                        break
+                    
+    except requests.exceptions.ConnectionError:
+        error_msg = _connection_error_message()
+        
+    except requests.exceptions.Timeout:
+        error_msg = _timeout_error_message(time.time() - start_time)
+        
+    except (requests.exceptions.RequestException, ValueError) as e:
+        error_msg = _request_error_message(e)
+    
+    if error_msg:
+        logger.error(error_msg)
+        yield error_msg
+
+
 def generate_answer(message: str,
                     energy_vector: Dict[str, float],
                     sigma_S_X: Dict[str, float],
@@ -281,8 +395,15 @@ def generate_answer(message: str,
     prompt = build_main_prompt(message, state, energy_vector, sigma_S_X)
     raw_answer = call_llm(prompt, options)
 
+    return build_answer(raw_answer, energy_vector, sigma_S_X)
+
+
+def build_answer(answer_text: str,
+                 energy_vector: Dict[str, float],
+                 sigma_S_X: Dict[str, float]) -> Dict[str, Any]:
+    """Monta o dicionário de resposta de generate_answer a partir do texto final."""
     return {
-        "answer_text": raw_answer,
+        "answer_text": answer_text,
         "energy_vector": energy_vector,
         "sigma": sigma_S_X["sigma"],
         "S": sigma_S_X["S"],
@@ -290,6 +411,21 @@ def generate_answer(message: str,
     }
 
 
+def generate_answer_stream(message: str,
+                           energy_vector: Dict[str, float],
+                           sigma_S_X: Dict[str, float],
+                           state,
+                           options: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    Versão em streaming de generate_answer: produz os trechos do texto.
+    
+    O chamador junta os trechos e usa build_answer para obter o mesmo
+    dicionário que generate_answer devolveria.
+    """
+    prompt = build_main_prompt(message, state, energy_vector, sigma_S_X)
+    yield from call_llm_stream(prompt, options)
+
+
 def get_model_info() -> Dict[str, Any]:
     """
     Retorna informações sobre a configuração atual do modelo.
@@ -1,7 +1,12 @@
-from typing import List, Optional, Any
-from dataclasses import dataclass, field
+from typing import List, Optional, Any, Dict
+from dataclasses import dataclass, field, asdict
+import os
 import time
 
+# Limites do histórico mantido em cada conversa (mensagens mais antigas são descartadas)
+MAX_MESSAGES = int(os.getenv("MODELX_MAX_MESSAGES", "200"))
+MAX_COHERENCE_HISTORY = int(os.getenv("MODELX_MAX_COHERENCE_HISTORY", "50"))
+
 
 @dataclass
 class Message:
@@ -31,6 +36,22 @@ class ConversationState:
     last_answer_vector: Optional[Any] = None
     coherence_history: List[dict] = field(default_factory=list)
     rhythm: RhythmStats = field(default_factory=RhythmStats)
+    extra_context: str = ""  # contexto de web/memória do turno atual
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversationState":
+        data = dict(data)
+        data["messages"] = [Message(**m) for m in data.get("messages", [])]
+        data["rhythm"] = RhythmStats(**data.get("rhythm", {}))
+        return cls(**data)
+
+    def add_coherence(self, feedback: dict):
+        """Registra um feedback de coerência, mantendo os MAX_COHERENCE_HISTORY mais recentes."""
+        self.coherence_history.append(feedback)
+        del self.coherence_history[:-MAX_COHERENCE_HISTORY]
 
 
 def update_rhythm_stats(state: ConversationState, new_message: str, timestamp: float) -> RhythmStats:
@@ -70,3 +91,4 @@ def append_message(state: ConversationState, role: str, content: str, timestamp:
     if timestamp is None:
         timestamp = time.time()
     state.messages.append(Message(role=role, content=content, timestamp=timestamp))
+    del state.messages[:-MAX_MESSAGES]
@@ -0,0 +1,316 @@
+"""
+Conversation Store - Armazenamento limitado das conversas ativas.
+
+Mantém em memória um LRU de ConversationState com três limites:
+- número máximo de conversas
+- tamanho aproximado total em bytes
+- TTL desde o último acesso
+
+Conversas que saem da memória (por LRU, tamanho ou TTL) são gravadas num
+arquivo SQLite local e recarregadas sob demanda no próximo acesso. Sem
+SQLite (db_path=None), conversas despejadas são descartadas. O arquivo
+também é limitado: a cada gravação saem as linhas mais antigas que
+`db_ttl` e as que passam de `max_db_rows`.
+
+Uso:
+    store = ConversationStore()
+    state = store.get("conv-1")        # memória → SQLite → None
+    store.put(state)                    # insere/atualiza e aplica os limites
+    store.stats()                       # acertos, despejos, hit rate
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .conversation_state import ConversationState
+
+logger = logging.getLogger(__name__)
+
+MEMORY_DIR = os.getenv("MODELX_MEMORY_DIR", ".modelx_memory")
+
+# Limites padrão (sobrescrevíveis por variáveis de ambiente)
+MAX_CONVERSATIONS = int(os.getenv("MODELX_MAX_CONVERSATIONS", "1000"))
+MAX_STORE_BYTES = int(os.getenv("MODELX_MAX_STORE_BYTES", str(64 * 1024 * 1024)))
+CONVERSATION_TTL = float(os.getenv("MODELX_CONVERSATION_TTL", "3600"))
+
+# Arquivo SQLite das conversas despejadas; vazio desativa a persistência
+CONVERSATION_DB = os.getenv("MODELX_CONVERSATION_DB", os.path.join(MEMORY_DIR, "conversations.sqlite3"))
+CONVERSATION_DB_TTL = float(os.getenv("MODELX_CONVERSATION_DB_TTL", str(30 * 24 * 3600)))
+MAX_DB_ROWS = int(os.getenv("MODELX_MAX_CONVERSATION_ROWS", "100000"))
+
+# Custo fixo estimado por mensagem/feedback (objetos, timestamps, dicts)
+_MESSAGE_OVERHEAD = 120
+_FEEDBACK_OVERHEAD = 400
+
+
+def estimate_size(state: ConversationState) -> int:
+    """Tamanho aproximado (bytes) de uma conversa em memória."""
+    size = 512 + len(state.root_question) + len(state.extra_context or "")
+    size += len(state.last_answer_summary or "")
+    size += sum(len(m.content) + _MESSAGE_OVERHEAD for m in state.messages)
+    size += _FEEDBACK_OVERHEAD * len(state.coherence_history)
+    return size
+
+
+def _json_default(value: Any) -> Any:
+    # Embeddings (numpy) e similares
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class ConversationStore:
+    """
+    LRU de conversas com TTL, limite de bytes e despejo para SQLite.
+
+    Seguro para uso concorrente (um lock protege memória e banco). get/put
+    podem tocar o SQLite: em código async, chame-os fora do event loop.
+    """
+
+    def __init__(
+        self,
+        max_conversations: int = MAX_CONVERSATIONS,
+        max_bytes: int = MAX_STORE_BYTES,
+        ttl: Optional[float] = CONVERSATION_TTL,
+        db_path: Optional[str] = CONVERSATION_DB,
+        db_ttl: Optional[float] = CONVERSATION_DB_TTL,
+        max_db_rows: Optional[int] = MAX_DB_ROWS
+    ):
+        """
+        Args:
+            max_conversations: Máximo de conversas em memória
+            max_bytes: Tamanho aproximado máximo das conversas em memória
+            ttl: Segundos sem acesso até a conversa sair da memória (None = sem TTL)
+            db_path: Arquivo SQLite para conversas despejadas (None ou "" = descartar)
+            db_ttl: Segundos desde a última gravação até a linha sair do SQLite (None = sem TTL)
+            max_db_rows: Máximo de conversas no SQLite; as gravadas há mais tempo saem (None = sem limite)
+        """
+        self.max_conversations = max_conversations
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.db_path = db_path or None
+        self.db_ttl = db_ttl
+        self.max_db_rows = max_db_rows
+
+        # id -> (estado, tamanho estimado, último acesso)
+        self._entries: "OrderedDict[str, Tuple[ConversationState, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.metrics = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "spilled": 0,
+            "pruned": 0,
+            "spill_errors": 0,
+        }
+
+        if self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS conversations ("
+                "id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS conversations_updated_at ON conversations (updated_at)"
+            )
+            self._db.commit()
+
+    # ========================================================================
+    # SQLITE
+    # ========================================================================
+
+    def _spill(self, items: List[Tuple[str, ConversationState]]) -> bool:
+        """
+        Grava conversas despejadas no SQLite e poda o arquivo (uma única transação).
+
+        Retorna False se o SQLite falhar: quem chama mantém as conversas em
+        memória em vez de perdê-las.
+        """
+        if self._db is None or not items:
+            return True
+        now = time.time()
+        try:
+            rows = [
+                (conversation_id, json.dumps(state.to_dict(), ensure_ascii=False, default=_json_default), now)
+                for conversation_id, state in items
+            ]
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO conversations (id, data, updated_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                pruned = self._prune(now)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.metrics["spill_errors"] += 1
+            logger.error(f"Falha ao gravar {len(items)} conversa(s) no SQLite: {e}")
+            return False
+        self.metrics["spilled"] += len(rows)
+        self.metrics["pruned"] += pruned
+        return True
+
+    def _prune(self, now: float) -> int:
+        """Remove do SQLite as linhas vencidas (db_ttl) e as que excedem max_db_rows."""
+        pruned = 0
+        if self.db_ttl is not None:
+            pruned += self._db.execute(
+                "DELETE FROM conversations WHERE updated_at < ?", (now - self.db_ttl,)
+            ).rowcount
+        if self.max_db_rows is not None:
+            pruned += self._db.execute(
+                "DELETE FROM conversations WHERE id IN ("
+                "SELECT id FROM conversations ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_db_rows,)
+            ).rowcount
+        return pruned
+
+    def _load(self, conversation_id: str) -> Optional[ConversationState]:
+        """Recarrega uma conversa do SQLite, se existir."""
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT data FROM conversations WHERE id = ?", (conversation_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return ConversationState.from_dict(json.loads(row[0]))
+        except (ValueError, TypeError) as e:
+            logger.error(f"Conversa {conversation_id} corrompida no SQLite: {e}")
+            return None
+
+    # ========================================================================
+    # MEMÓRIA
+    # ========================================================================
+
+    def _remove(self, conversation_id: str) -> ConversationState:
+        state, size, _ = self._entries.pop(conversation_id)
+        self._bytes -= size
+        return state
+
+    def _insert(self, conversation_id: str, state: ConversationState, now: float):
+        size = estimate_size(state)
+        self._entries[conversation_id] = (state, size, now)
+        self._bytes += size
+        self._enforce_limits(keep=conversation_id)
+
+    def _expire(self, now: float):
+        """Despeja as conversas sem acesso há mais de `ttl` segundos."""
+        if self.ttl is None:
+            return
+        # A ordem LRU coincide com a de último acesso: basta olhar o início
+        expired = []
+        for conversation_id, (state, _, accessed) in self._entries.items():
+            if now - accessed <= self.ttl:
+                break
+            expired.append((conversation_id, state))
+        # Só sai da memória o que foi gravado
+        if self._spill(expired):
+            for conversation_id, _ in expired:
+                self._remove(conversation_id)
+                self.metrics["expirations"] += 1
+
+    def _enforce_limits(self, keep: Optional[str] = None):
+        """Despeja as menos usadas até respeitar os limites (nunca `keep`)."""
+        evicted = []
+        count, size = len(self._entries), self._bytes
+        for conversation_id, (state, entry_size, _) in self._entries.items():
+            if count <= self.max_conversations and size <= self.max_bytes:
+                break
+            if conversation_id == keep:
+                continue
+            evicted.append((conversation_id, state))
+            count -= 1
+            size -= entry_size
+        if self._spill(evicted):
+            for conversation_id, _ in evicted:
+                self._remove(conversation_id)
+                self.metrics["evictions"] += 1
+
+    # ========================================================================
+    # API PÚBLICA
+    # ========================================================================
+
+    def get(self, conversation_id: str) -> Optional[ConversationState]:
+        """Retorna a conversa (memória, senão SQLite) ou None."""
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+
+            if conversation_id in self._entries:
+                state, size, _ = self._entries[conversation_id]
+                self._entries[conversation_id] = (state, size, now)
+                self._entries.move_to_end(conversation_id)
+                self.metrics["memory_hits"] += 1
+                return state
+
+            state = self._load(conversation_id)
+            if state is None:
+                self.metrics["misses"] += 1
+                return None
+
+            self.metrics["disk_hits"] += 1
+            self._insert(conversation_id, state, now)
+            return state
+
+    def put(self, state: ConversationState):
+        """Insere ou atualiza uma conversa (recalcula o tamanho) e aplica os limites."""
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+            if state.id in self._entries:
+                self._remove(state.id)
+            self._insert(state.id, state, now)
+
+    def __contains__(self, conversation_id: str) -> bool:
+        with self._lock:
+            return conversation_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def flush(self):
+        """Grava todas as conversas em memória no SQLite (ex.: no shutdown)."""
+        with self._lock:
+            self._spill([(conversation_id, state) for conversation_id, (state, _, _) in self._entries.items()])
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Ocupação, despejos e taxas de acerto (memória e memória + SQLite)."""
+        with self._lock:
+            m = self.metrics
+            lookups = m["memory_hits"] + m["disk_hits"] + m["misses"]
+            return {
+                **m,
+                "conversations_in_memory": len(self._entries),
+                "memory_bytes": self._bytes,
+                "max_conversations": self.max_conversations,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "sqlite": self.db_path,
+                "db_ttl": self.db_ttl,
+                "max_db_rows": self.max_db_rows,
+                "lookups": lookups,
+                "memory_hit_rate": m["memory_hits"] / lookups if lookups else 0.0,
+                "hit_rate": (m["memory_hits"] + m["disk_hits"]) / lookups if lookups else 0.0,
+            }
@@ -12,7 +12,7 @@ a lógica de reasoning do Model X com a capacidade generativa dos LLMs.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from dataclasses import dataclass
 from enum import Enum
 import os
@@ -76,6 +76,62 @@ class GenerationConfig:
         }
 
 
+class LLMStreamError(Exception):
+    """Falha de um provedor durante a geração em streaming."""
+
+
+def _iter_ollama_stream(response) -> Iterator[str]:
+    """Trechos de texto de uma resposta NDJSON do Ollama (stream=True)."""
+    for line in response.iter_lines(chunk_size=None):
+        if not line:
+            continue
+        chunk = json.loads(line)
+        if chunk.get("error"):
+            raise LLMStreamError(chunk["error"])
+        if chunk.get("response"):
+            yield chunk["response"]
+        if chunk.get("done"):
+            break
+
+
+def _iter_chat_completions_stream(response) -> Iterator[str]:
+    """Trechos de texto de um stream SSE no formato OpenAI (Groq, Together)."""
+    for line in response.iter_lines(chunk_size=None):
+        line = line.decode("utf-8")
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        delta = json.loads(data)["choices"][0].get("delta", {})
+        if delta.get("content"):
+            yield delta["content"]
+
+
+def _stream_request(url: str, payload: Dict[str, Any], parser, timeout: int,
+                    headers: Optional[Dict[str, str]] = None) -> Iterator[str]:
+    """POST com stream=True; erros de rede, HTTP ou de parsing viram LLMStreamError."""
+    try:
+        import requests
+    except ImportError:
+        raise LLMStreamError("pip install requests")
+
+    try:
+        response = requests.post(url, headers=headers, json=payload, timeout=timeout, stream=True)
+    except requests.exceptions.Timeout:
+        raise LLMStreamError(f"Timeout após {timeout}s")
+    except requests.exceptions.RequestException as e:
+        raise LLMStreamError(str(e)) from e
+
+    with response:
+        if response.status_code != 200:
+            raise LLMStreamError(f"HTTP {response.status_code}: {response.text[:200]}")
+        try:
+            yield from parser(response)
+        except (ValueError, KeyError, IndexError, requests.exceptions.RequestException) as e:
+            raise LLMStreamError(f"Stream interrompido: {e}") from e
+
+
 class BaseLLMProvider(ABC):
     """Classe base abstrata para provedores de LLM."""
 
@@ -88,6 +144,20 @@ class BaseLLMProvider(ABC):
         """Gera texto a partir de um prompt."""
         pass
 
+    def generate_stream(self, prompt: str, config: Optional[GenerationConfig] = None) -> Iterator[str]:
+        """
+        Gera texto em streaming, produzindo trechos à medida que chegam.
+
+        A implementação padrão faz a chamada completa e produz o texto de
+        uma vez; provedores com API de streaming sobrescrevem este método.
+        Falhas levantam LLMStreamError.
+        """
+        response = self.generate(prompt, config)
+        if not response.success:
+            raise LLMStreamError(response.error_message)
+        if response.text:
+            yield response.text
+
     @abstractmethod
     def is_available(self) -> bool:
         """Verifica se o provedor está disponível."""
@@ -141,6 +211,29 @@ class OllamaProvider(BaseLLMProvider):
         except Exception:
             return False
 
+    def _payload(self, prompt: str, cfg: GenerationConfig, stream: bool) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": cfg.temperature,
+                "top_p": cfg.top_p,
+                "top_k": cfg.top_k,
+                "num_predict": cfg.max_tokens,
+                "repeat_penalty": cfg.repeat_penalty
+            }
+        }
+
+    def generate_stream(self, prompt: str, config: Optional[GenerationConfig] = None) -> Iterator[str]:
+        cfg = config or self.config
+        return _stream_request(
+            f"{self.base_url}/api/generate",
+            self._payload(prompt, cfg, stream=True),
+            _iter_ollama_stream,
+            self.timeout
+        )
+
     def generate(self, prompt: str, config: Optional[GenerationConfig] = None) -> LLMResponse:
         try:
             import requests
@@ -159,18 +252,7 @@ class OllamaProvider(BaseLLMProvider):
         try:
             response = requests.post(
                 f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": cfg.temperature,
-                        "top_p": cfg.top_p,
-                        "top_k": cfg.top_k,
-                        "num_predict": cfg.max_tokens,
-                        "repeat_penalty": cfg.repeat_penalty
-                    }
-                },
+                json=self._payload(prompt, cfg, stream=False),
                 timeout=self.timeout
             )
 
@@ -386,6 +468,27 @@ class GroqProvider(BaseLLMProvider):
     def is_available(self) -> bool:
         return bool(self.api_key)
 
+    def _payload(self, prompt: str, cfg: GenerationConfig) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": cfg.temperature,
+            "max_tokens": cfg.max_tokens,
+            "top_p": cfg.top_p
+        }
+
+    def generate_stream(self, prompt: str, config: Optional[GenerationConfig] = None) -> Iterator[str]:
+        if not self.api_key:
+            raise LLMStreamError("GROQ_API_KEY não configurado. Obtenha em console.groq.com")
+        cfg = config or self.config
+        return _stream_request(
+            self.base_url,
+            {**self._payload(prompt, cfg), "stream": True},
+            _iter_chat_completions_stream,
+            self.timeout,
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        )
+
     def generate(self, prompt: str, config: Optional[GenerationConfig] = None) -> LLMResponse:
         if not self.api_key:
             return LLMResponse(
@@ -417,13 +520,7 @@ class GroqProvider(BaseLLMProvider):
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
                 },
-                json={
-                    "model": self.model_name,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": cfg.temperature,
-                    "max_tokens": cfg.max_tokens,
-                    "top_p": cfg.top_p
-                },
+                json=self._payload(prompt, cfg),
                 timeout=self.timeout
             )
 
@@ -497,6 +594,28 @@ class TogetherProvider(BaseLLMProvider):
     def is_available(self) -> bool:
         return bool(self.api_key)
 
+    def _payload(self, prompt: str, cfg: GenerationConfig) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": cfg.temperature,
+            "max_tokens": cfg.max_tokens,
+            "top_p": cfg.top_p,
+            "repetition_penalty": cfg.repeat_penalty
+        }
+
+    def generate_stream(self, prompt: str, config: Optional[GenerationConfig] = None) -> Iterator[str]:
+        if not self.api_key:
+            raise LLMStreamError("TOGETHER_API_KEY não configurado. Obtenha em together.ai")
+        cfg = config or self.config
+        return _stream_request(
+            self.base_url,
+            {**self._payload(prompt, cfg), "stream": True},
+            _iter_chat_completions_stream,
+            self.timeout,
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        )
+
     def generate(self, prompt: str, config: Optional[GenerationConfig] = None) -> LLMResponse:
         if not self.api_key:
             return LLMResponse(
@@ -528,14 +647,7 @@ class TogetherProvider(BaseLLMProvider):
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
                 },
-                json={
-                    "model": self.model_name,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": cfg.temperature,
-                    "max_tokens": cfg.max_tokens,
-                    "top_p": cfg.top_p,
-                    "repetition_penalty": cfg.repeat_penalty
-                },
+                json=self._payload(prompt, cfg),
                 timeout=self.timeout
             )
 
@@ -637,6 +749,14 @@ class UnifiedLLMProvider:
                     available.append(provider_type)
         return available
 
+    def _providers_to_try(self, preferred_provider: Optional[LLMProvider] = None) -> List[LLMProvider]:
+        """Ordem de tentativa: o preferido primeiro, depois a prioridade padrão."""
+        if preferred_provider and preferred_provider in self.providers:
+            return [preferred_provider] + [
+                p for p in self.priority if p != preferred_provider
+            ]
+        return self.priority.copy()
+
     def generate(
         self,
         prompt: str,
@@ -659,17 +779,9 @@ class UnifiedLLMProvider:
         self.metrics["total_requests"] += 1
         cfg = config or self.config
 
-        # Define ordem de tentativa
-        if preferred_provider and preferred_provider in self.providers:
-            providers_to_try = [preferred_provider] + [
-                p for p in self.priority if p != preferred_provider
-            ]
-        else:
-            providers_to_try = self.priority.copy()
-
         last_error = None
 
-        for provider_type in providers_to_try:
+        for provider_type in self._providers_to_try(preferred_provider):
             if provider_type not in self.providers:
                 continue
 
@@ -712,6 +824,68 @@ class UnifiedLLMProvider:
             error_message=f"Todos os provedores falharam. Último erro: {last_error}"
         )
 
+    def generate_stream(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        preferred_provider: Optional[LLMProvider] = None
+    ) -> Iterator[str]:
+        """
+        Gera texto em streaming usando o melhor provedor disponível.
+
+        Um provedor que falha antes do primeiro trecho é trocado pelo
+        próximo da prioridade. Depois que algum texto já foi produzido não
+        há fallback (o cliente já recebeu a resposta parcial) e a falha é
+        propagada como LLMStreamError.
+
+        Args:
+            prompt: Texto de entrada para o LLM
+            config: Configuração de geração (opcional)
+            preferred_provider: Provedor preferido (opcional)
+
+        Yields:
+            Trechos do texto gerado, na ordem em que chegam
+        """
+        self.metrics["total_requests"] += 1
+        cfg = config or self.config
+
+        last_error = None
+
+        for provider_type in self._providers_to_try(preferred_provider):
+            if provider_type not in self.providers:
+                continue
+
+            provider = self.providers[provider_type]
+
+            if not provider.is_available():
+                logger.info(f"Provider {provider_type.value} não disponível, pulando...")
+                continue
+
+            logger.info(f"Streaming via {provider_type.value}")
+            start_time = time.time()
+            chunks = 0
+            try:
+                for chunk in provider.generate_stream(prompt, cfg):
+                    chunks += 1
+                    yield chunk
+            except LLMStreamError as e:
+                if chunks:
+                    self.metrics["failed_requests"] += 1
+                    raise
+                last_error = str(e)
+                logger.warning(f"Falha no {provider_type.value}: {last_error}")
+                continue
+
+            self.metrics["successful_requests"] += 1
+            self.metrics["provider_usage"][provider_type.value] += 1
+            self.metrics["total_tokens"] += chunks  # aproximação: um trecho por token
+            self.metrics["total_latency_ms"] += (time.time() - start_time) * 1000
+            return
+
+        # Todos os provedores falharam
+        self.metrics["failed_requests"] += 1
+        raise LLMStreamError(f"Todos os provedores falharam. Último erro: {last_error}")
+
     def get_metrics(self) -> Dict[str, Any]:
         """Retorna métricas de uso."""
         metrics = self.metrics.copy()
@@ -767,3 +941,22 @@ def generate_text(
         LLMResponse com o texto gerado
     """
     return get_default_provider().generate(prompt, config, preferred_provider)
+
+
+def generate_text_stream(
+    prompt: str,
+    config: Optional[GenerationConfig] = None,
+    preferred_provider: Optional[LLMProvider] = None
+) -> Iterator[str]:
+    """
+    Função de conveniência para gerar texto em streaming.
+
+    Args:
+        prompt: Texto de entrada
+        config: Configuração de geração
+        preferred_provider: Provedor preferido
+
+    Yields:
+        Trechos do texto gerado
+    """
+    return get_default_provider().generate_stream(prompt, config, preferred_provider)
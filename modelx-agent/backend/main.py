@@ -1,18 +1,27 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Optional, List, Any
+from starlette.background import BackgroundTask
+from typing import Dict, Optional, List, Any, Tuple
+from contextlib import asynccontextmanager
+import anyio
+import asyncio
+import json
+import threading
 import time
 import os
+import weakref
 
 from .conversation_state import ConversationState, update_rhythm_stats, append_message
+from .conversation_store import ConversationStore
+from .blocking_io import run_blocking, iterate_blocking
 from .coding_engineering.interpret import classify_coding_subdomain
 from .domains import compute_energy_vector
 from .energy_model import adjust_energy_with_rhythm, compute_sigma_S_from_energy
 from .modelx_core import evaluate_system_with_model_x
-from .coding_engineering.generator import generate_answer
+from .coding_engineering.generator import generate_answer, generate_answer_stream, build_answer
 from .coding_engineering.coherence_evaluator import evaluate_coherence
 from .meta_learning import update_parameters
 
@@ -25,10 +34,40 @@ except ImportError:
     WEB_AND_LEARNING_AVAILABLE = False
 
 
+# Conversas ativas: LRU limitado (quantidade, bytes, TTL) com despejo para
+# SQLite e recarga sob demanda (ver conversation_store.py). Criado no startup
+# ou no primeiro uso, não no import (que criaria o SQLite no diretório atual).
+CONVERSATIONS: Optional[ConversationStore] = None
+_CONVERSATIONS_INIT = threading.Lock()
+
+
+def conversation_store() -> ConversationStore:
+    global CONVERSATIONS
+    with _CONVERSATIONS_INIT:
+        if CONVERSATIONS is None:
+            CONVERSATIONS = ConversationStore()
+        return CONVERSATIONS
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Abre o store de conversas no startup e grava no SQLite o que está em memória no shutdown."""
+    global CONVERSATIONS
+    store = await run_blocking(conversation_store)
+    try:
+        yield
+    finally:
+        await run_blocking(store.close)
+        with _CONVERSATIONS_INIT:
+            if CONVERSATIONS is store:
+                CONVERSATIONS = None
+
+
 app = FastAPI(
     title="Model X Agent API",
     description="Assistente de IA com reasoning baseado no Modelo X (X = σ − S), acesso à web e aprendizado contínuo",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Configuração de CORS para permitir acesso de outros domínios
@@ -43,8 +82,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Em um sistema real, isso deve ir para algum store (cache/DB)
-CONVERSATIONS: Dict[str, ConversationState] = {}
+
+# Requisições da mesma conversa são serializadas (o estado é mutável).
+# Referências fracas: o lock some quando nenhuma requisição o usa.
+_CONVERSATION_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def conversation_lock(conversation_id: str) -> asyncio.Lock:
+    lock = _CONVERSATION_LOCKS.get(conversation_id)
+    if lock is None:
+        lock = _CONVERSATION_LOCKS[conversation_id] = asyncio.Lock()
+    return lock
 
 
 class ChatRequest(BaseModel):
@@ -69,23 +117,42 @@ class ChatResponse(BaseModel):
     learning_context_used: bool = False
 
 
-def get_or_create_conversation(req: ChatRequest) -> ConversationState:
-    if req.is_new_conversation or req.conversation_id not in CONVERSATIONS:
+async def get_or_create_conversation(req: ChatRequest) -> ConversationState:
+    """Conversa do store (que pode ler/gravar o SQLite, por isso no executor) ou uma nova."""
+    state = None if req.is_new_conversation else await run_blocking(conversation_store().get, req.conversation_id)
+    if state is None:
         state = ConversationState(
             id=req.conversation_id,
             root_question=req.message,
             root_question_vector=None  # TODO: calcular embedding
         )
-        CONVERSATIONS[req.conversation_id] = state
-    else:
-        state = CONVERSATIONS[req.conversation_id]
+        await run_blocking(conversation_store().put, state)
     return state
 
 
-@app.post("/chat", response_model=ChatResponse)
-def chat(req: ChatRequest):
+async def fetch_web_context(req: ChatRequest) -> Dict[str, Any]:
+    """Busca web (bloqueante, com rate limit) no executor, se a mensagem pedir."""
+    if not (WEB_AND_LEARNING_AVAILABLE and req.enable_web_search and needs_web(req.message)):
+        return {"searched": False}
+    return await run_blocking(smart_search, req.message)
+
+
+def load_learning_context(conversation_id: str, message: str) -> Tuple[str, str]:
+    """Contexto de interações anteriores e preferências (lê a memória em disco)."""
+    memory = get_memory(conversation_id)
+    return memory.get_context_prompt(message), memory.get_preferences_prompt()
+
+
+async def fetch_learning_context(req: ChatRequest) -> Tuple[str, str]:
+    if not (WEB_AND_LEARNING_AVAILABLE and req.enable_learning):
+        return "", ""
+    return await run_blocking(load_learning_context, req.conversation_id, req.message)
+
+
+async def prepare_turn(req: ChatRequest) -> Dict[str, Any]:
+    """Passos 1–6 do /chat: ritmo, energia, σ/S/X e contexto extra (web e memória)."""
     ts = time.time()
-    state = get_or_create_conversation(req)
+    state = await get_or_create_conversation(req)
 
     # 1) atualizar ritmo e logar mensagem do usuário
     rhythm = update_rhythm_stats(state, req.message, ts)
@@ -112,76 +179,191 @@ def chat(req: ChatRequest):
     x_result = evaluate_system_with_model_x(system)
 
     # === NOVOS RECURSOS ===
+    # 6.1 e 6.2) Busca na web e contexto de interações anteriores, em paralelo
+    web_result, (learning_ctx, prefs_ctx) = await asyncio.gather(
+        fetch_web_context(req),
+        fetch_learning_context(req),
+    )
+
     web_search_used = False
     web_sources = []
-    learning_context_used = False
     extra_context = ""
+    if web_result.get("searched"):
+        web_search_used = True
+        web_sources = web_result.get("sources", [])
+        extra_context += "\n" + web_result.get("content", "")
 
-    if WEB_AND_LEARNING_AVAILABLE:
-        # 6.1) Busca na web se necessário
-        if req.enable_web_search and needs_web(req.message):
-            web_result = smart_search(req.message)
-            if web_result.get("searched"):
-                web_search_used = True
-                web_sources = web_result.get("sources", [])
-                extra_context += "\n" + web_result.get("content", "")
-
-        # 6.2) Busca contexto de interações anteriores
-        if req.enable_learning:
-            memory = get_memory(req.conversation_id)
-            learning_ctx = memory.get_context_prompt(req.message)
-            if learning_ctx:
-                learning_context_used = True
-                extra_context += "\n" + learning_ctx
-
-            # Adiciona preferências do usuário
-            prefs_ctx = memory.get_preferences_prompt()
-            if prefs_ctx:
-                extra_context += "\n" + prefs_ctx
+    if learning_ctx:
+        extra_context += "\n" + learning_ctx
+
+    # Adiciona preferências do usuário
+    if prefs_ctx:
+        extra_context += "\n" + prefs_ctx
 
     # Adiciona contexto extra ao state para o generator usar
     if extra_context:
         state.extra_context = extra_context
 
-    # 7) gerar resposta
-    answer = generate_answer(req.message, E, sigma_S_X, state)
+    return {
+        "state": state,
+        "domain_info": domain_info,
+        "E": E,
+        "sigma_S_X": sigma_S_X,
+        "x_result": x_result,
+        "web_search_used": web_search_used,
+        "web_sources": web_sources,
+        "learning_context_used": bool(learning_ctx),
+    }
+
+
+async def finish_turn(req: ChatRequest, turn: Dict[str, Any], answer: Dict[str, Any]) -> Dict[str, Any]:
+    """Passos 8–10: coerência, meta-ajuste e registro da resposta na conversa."""
+    state = turn["state"]
 
     # 8) avaliar coerência (compilação, testes, alinhamento com pergunta-raiz)
     feedback = evaluate_coherence(req.message, answer, state)
 
     # 9) meta-ajuste global
-    update_parameters(feedback, domain=domain_info["domain"])
+    update_parameters(feedback, domain=turn["domain_info"]["domain"])
 
-    # 10) logar resposta na conversa
+    # 10) logar resposta na conversa (e atualizar o tamanho no store)
     append_message(state, "assistant", answer["answer_text"], time.time())
-    state.coherence_history.append(feedback)
-
-    # 11) Salvar interação para aprendizado
-    if WEB_AND_LEARNING_AVAILABLE and req.enable_learning:
-        save_interaction(
-            question=req.message,
-            answer=answer["answer_text"],
-            feedback_score=feedback["coherence_score"],
-            user_id=req.conversation_id,
-            metadata={
-                "sigma": x_result["sigma"],
-                "S": x_result["S"],
-                "X": x_result["X"],
-                "web_used": web_search_used
-            }
-        )
+    state.add_coherence(feedback)
+    await run_blocking(conversation_store().put, state)
+    return feedback
+
+
+async def persist_turn(req: ChatRequest, turn: Dict[str, Any], answer: Dict[str, Any],
+                       feedback: Dict[str, Any]):
+    """Passo 11: salvar interação para aprendizado (escrita em disco no executor)."""
+    if not (WEB_AND_LEARNING_AVAILABLE and req.enable_learning):
+        return
+    x_result = turn["x_result"]
+    await run_blocking(
+        save_interaction,
+        question=req.message,
+        answer=answer["answer_text"],
+        feedback_score=feedback["coherence_score"],
+        user_id=req.conversation_id,
+        metadata={
+            "sigma": x_result["sigma"],
+            "S": x_result["S"],
+            "X": x_result["X"],
+            "web_used": turn["web_search_used"]
+        }
+    )
+
+
+async def abort_turn(req: ChatRequest, reason: str):
+    """Fecha um turno que falhou ou foi interrompido: registra o motivo e regrava a conversa."""
+    state = await run_blocking(conversation_store().get, req.conversation_id)
+    if state is None:
+        return
+    # A mensagem do usuário já foi logada em prepare_turn; sem resposta ela ficaria pendurada
+    if state.messages and state.messages[-1].role == "user":
+        append_message(state, "assistant", f"Erro ao gerar resposta: {reason}", time.time())
+    await run_blocking(conversation_store().put, state)
+
+
+def turn_metrics(turn: Dict[str, Any]) -> Dict[str, Any]:
+    """Campos do ChatResponse que já são conhecidos antes da geração."""
+    x_result = turn["x_result"]
+    return {
+        "sigma": x_result["sigma"],
+        "S": x_result["S"],
+        "X": x_result["X"],
+        "x_interpretation": x_result["interpretation"],
+        "energy_vector": turn["E"],
+        "web_search_used": turn["web_search_used"],
+        "web_sources": turn["web_sources"],
+        "learning_context_used": turn["learning_context_used"],
+    }
+
+
+@app.post("/chat", response_model=ChatResponse)
+async def chat(req: ChatRequest):
+    async with conversation_lock(req.conversation_id):
+        turn = await prepare_turn(req)
+
+        # 7) gerar resposta (chamada HTTP ao LLM, fora do event loop)
+        answer = await run_blocking(generate_answer, req.message, turn["E"], turn["sigma_S_X"], turn["state"])
+
+        feedback = await finish_turn(req, turn, answer)
+        await persist_turn(req, turn, answer, feedback)
 
     return ChatResponse(
         answer_text=answer["answer_text"],
-        sigma=x_result["sigma"],
-        S=x_result["S"],
-        X=x_result["X"],
-        x_interpretation=x_result["interpretation"],
-        energy_vector=E,
         coherence_score=feedback["coherence_score"],
-        web_search_used=web_search_used,
-        web_sources=web_sources,
-        learning_context_used=learning_context_used
+        **turn_metrics(turn)
+    )
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Formata um evento Server-Sent Events com dados JSON."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post("/chat/stream")
+async def chat_stream(req: ChatRequest):
+    """
+    Versão em streaming do /chat, como Server-Sent Events.
+
+    Eventos, em ordem:
+    - meta: σ, S, X, interpretação, energia e fontes web (antes da geração)
+    - token: {"text": ...} para cada trecho gerado pelo LLM
+    - done: o ChatResponse completo, com coerência, avaliada quando o
+      stream de tokens termina
+    - error: {"detail": ...} se algo falhar no meio do caminho
+
+    A interação é salva para aprendizado depois que a resposta é encerrada.
+    """
+    completed: Dict[str, Any] = {}
+
+    async def events():
+        async with conversation_lock(req.conversation_id):
+            try:
+                turn = await prepare_turn(req)
+                yield sse_event("meta", turn_metrics(turn))
+
+                chunks = []
+                stream = generate_answer_stream(req.message, turn["E"], turn["sigma_S_X"], turn["state"])
+                async for chunk in iterate_blocking(stream):
+                    chunks.append(chunk)
+                    yield sse_event("token", {"text": chunk})
+
+                answer = build_answer("".join(chunks), turn["E"], turn["sigma_S_X"])
+                feedback = await finish_turn(req, turn, answer)
+                completed.update(turn=turn, answer=answer, feedback=feedback)
+
+                response = ChatResponse(
+                    answer_text=answer["answer_text"],
+                    coherence_score=feedback["coherence_score"],
+                    **turn_metrics(turn)
+                )
+                yield sse_event("done", response.model_dump())
+            except Exception as e:
+                try:
+                    await abort_turn(req, str(e))
+                except Exception:
+                    pass
+                yield sse_event("error", {"detail": str(e)})
+            except BaseException:
+                # Cliente desconectou (GeneratorExit/CancelledError): fecha o turno
+                # mesmo com o escopo cancelado e repassa a interrupção
+                with anyio.CancelScope(shield=True):
+                    await abort_turn(req, "conexão encerrada pelo cliente")
+                raise
+
+    async def persist():
+        if completed:
+            async with conversation_lock(req.conversation_id):
+                await persist_turn(req, **completed)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(persist)
     )
 
 
@@ -248,6 +430,7 @@ def get_status():
         "model_x": True,
         "web_search": WEB_AND_LEARNING_AVAILABLE,
         "learning_memory": WEB_AND_LEARNING_AVAILABLE,
+        "conversation_store": conversation_store().stats(),
     }
 
     # Verifica provedores LLM
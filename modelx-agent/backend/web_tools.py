@@ -21,6 +21,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from urllib.parse import quote_plus, urlparse
+import threading
 import time
 
 logging.basicConfig(level=logging.INFO)
@@ -86,13 +87,15 @@ class WebSearchEngine:
         self.cache_ttl = cache_ttl
         self.last_request_time = 0
         self.min_request_interval = 1.0  # segundos entre requisições
+        self._rate_lock = threading.Lock()  # buscas concorrentes (executor do /chat)
 
     def _rate_limit(self):
         """Aplica rate limiting para não sobrecarregar o serviço."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        with self._rate_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.min_request_interval:
+                time.sleep(self.min_request_interval - elapsed)
+            self.last_request_time = time.time()
 
     def _get_cached(self, query: str) -> Optional[List[SearchResult]]:
         """Retorna resultado do cache se ainda válido."""
@@ -13,60 +13,72 @@ Acesse: http://localhost:7860
 import gradio as gr
 import requests
 import json
-from typing import Tuple, List
+from typing import Tuple, List, Iterator
+
+from sse_client import iter_sse_events
 
 # Configuração
 API_URL = "http://localhost:8000"
 
 
+def format_metrics(data: dict) -> str:
+    """Formata as métricas Model X de um ChatResponse."""
+    return f"""
+**Métricas Model X:**
+- σ (entropia): {data.get('sigma', 0):.3f}
+- S (sintropia): {data.get('S', 0):.3f}
+- X (saldo): {data.get('X', 0):.3f}
+- Coerência: {data.get('coherence_score', 0):.1%}
+
+**Interpretação:** {data.get('x_interpretation', 'N/A')}
+"""
+
+
 def chat_with_modelx(
     message: str,
     history: List[Tuple[str, str]],
     conversation_id: str,
     generation_mode: str
-) -> Tuple[str, List[Tuple[str, str]], str]:
-    """Envia mensagem para a API do Model X e retorna resposta."""
+) -> Iterator[Tuple[str, List[Tuple[str, str]], str]]:
+    """Envia mensagem para /chat/stream e atualiza a resposta a cada token."""
 
     if not message.strip():
-        return "", history, "Digite uma mensagem"
+        yield "", history, "Digite uma mensagem"
+        return
 
     try:
-        # Faz requisição para a API
-        response = requests.post(
-            f"{API_URL}/chat",
+        # Faz requisição em streaming para a API
+        with requests.post(
+            f"{API_URL}/chat/stream",
             json={
                 "conversation_id": conversation_id or "gradio-session",
                 "message": message,
                 "is_new_conversation": len(history) == 0
             },
-            timeout=120
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-
-            # Formata métricas do Model X
-            metrics = f"""
-**Métricas Model X:**
-- σ (entropia): {data.get('sigma', 0):.3f}
-- S (sintropia): {data.get('S', 0):.3f}
-- X (saldo): {data.get('X', 0):.3f}
-- Coerência: {data.get('coherence_score', 0):.1%}
-
-**Interpretação:** {data.get('x_interpretation', 'N/A')}
-"""
-
-            # Atualiza histórico
-            history.append((message, data.get('answer_text', 'Sem resposta')))
-
-            return "", history, metrics
-        else:
-            return "", history, f"Erro: {response.status_code} - {response.text[:200]}"
+            timeout=120,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                yield "", history, f"Erro: {response.status_code} - {response.text[:200]}"
+                return
+
+            history = history + [(message, "")]
+            answer = ""
+            for event, data in iter_sse_events(response):
+                if event == "token":
+                    answer += data["text"]
+                    history[-1] = (message, answer)
+                    yield "", history, "_Gerando resposta..._"
+                elif event == "done":
+                    history[-1] = (message, data.get('answer_text', answer) or 'Sem resposta')
+                    yield "", history, format_metrics(data)
+                elif event == "error":
+                    yield "", history, f"❌ Erro: {data['detail']}"
 
     except requests.exceptions.ConnectionError:
-        return "", history, "❌ Erro: Não foi possível conectar à API. Inicie o servidor com: uvicorn backend.main:app --port 8000"
+        yield "", history, "❌ Erro: Não foi possível conectar à API. Inicie o servidor com: uvicorn backend.main:app --port 8000"
     except Exception as e:
-        return "", history, f"❌ Erro: {str(e)}"
+        yield "", history, f"❌ Erro: {str(e)}"
 
 
 def clear_chat() -> Tuple[List, str]:
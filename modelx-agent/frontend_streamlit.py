@@ -16,6 +16,8 @@ import json
 import time
 from datetime import datetime
 
+from sse_client import iter_sse_events
+
 # ============================================================================
 # CONFIGURAÇÃO
 # ============================================================================
@@ -55,28 +57,43 @@ def check_api_status():
         return False
 
 
-def send_message(message: str) -> dict:
-    """Envia mensagem para a API."""
+def stream_message(message: str, result: dict):
+    """
+    Envia mensagem para /chat/stream e gera os trechos da resposta.
+
+    Ao final, `result` recebe {"success": True, "data": ChatResponse} ou
+    {"success": False, "error": ...}.
+    """
     try:
-        response = requests.post(
-            f"{API_URL}/chat",
+        with requests.post(
+            f"{API_URL}/chat/stream",
             json={
                 "conversation_id": st.session_state.conversation_id,
                 "message": message,
                 "is_new_conversation": len(st.session_state.messages) == 0
             },
-            timeout=120
-        )
-
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        else:
-            return {"success": False, "error": f"HTTP {response.status_code}"}
+            timeout=120,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                result.update(success=False, error=f"HTTP {response.status_code}")
+                return
+
+            for event, data in iter_sse_events(response):
+                if event == "token":
+                    yield data["text"]
+                elif event == "done":
+                    result.update(success=True, data=data)
+                elif event == "error":
+                    result.update(success=False, error=data["detail"])
+
+        if not result:
+            result.update(success=False, error="Stream encerrado sem resposta final")
 
     except requests.exceptions.ConnectionError:
-        return {"success": False, "error": "API não disponível"}
+        result.update(success=False, error="API não disponível")
     except Exception as e:
-        return {"success": False, "error": str(e)}
+        result.update(success=False, error=str(e))
 
 
 def interpret_x_state(x_value: float) -> tuple:
@@ -206,14 +223,20 @@ with tab_chat:
 
         # Envia para API
         with st.chat_message("assistant"):
-            with st.spinner("Pensando..."):
-                result = send_message(prompt)
+            # Renderiza os tokens à medida que chegam
+            placeholder = st.empty()
+            placeholder.markdown("_Pensando..._")
+            result = {}
+            partial = ""
+            for chunk in stream_message(prompt, result):
+                partial += chunk
+                placeholder.markdown(partial + "▌")
 
             if result["success"]:
                 data = result["data"]
                 answer = data.get("answer_text", "Sem resposta")
 
-                st.markdown(answer)
+                placeholder.markdown(answer)
 
                 # Salva métricas
                 metrics = {
@@ -241,6 +264,7 @@ with tab_chat:
                     cols[2].metric("X", f"{metrics['X']:.3f}")
                     cols[3].metric("Coerência", f"{metrics['coherence']:.1%}")
             else:
+                placeholder.markdown(partial)
                 st.error(f"❌ Erro: {result['error']}")
                 st.session_state.messages.append({
                     "role": "assistant",
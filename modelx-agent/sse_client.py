@@ -0,0 +1,37 @@
+"""
+Cliente SSE - Leitura dos eventos de /chat/stream pelos frontends Python.
+
+Compartilhado por frontend_streamlit.py e frontend_gradio.py.
+
+Uso:
+    with requests.post(f"{API_URL}/chat/stream", json=..., stream=True) as response:
+        for event, data in iter_sse_events(response):
+            ...
+"""
+
+import json
+from typing import Iterator, Tuple
+
+
+def iter_sse_events(response) -> Iterator[Tuple[str, dict]]:
+    """
+    Lê uma resposta text/event-stream e gera (evento, dados JSON).
+
+    Linhas `data:` consecutivas do mesmo evento são juntadas com "\\n",
+    como manda a especificação de Server-Sent Events; comentários (":") e
+    campos desconhecidos são ignorados.
+    """
+    event, data = "message", []
+    for raw in response.iter_lines(chunk_size=None):
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            value = line[5:]
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield event, json.loads("\n".join(data))
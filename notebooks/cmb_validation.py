@@ -1,10 +1,15 @@
-import numpy as np, camb, emcee, matplotlib.pyplot as plt, urllib.request, os
+import numpy as np, matplotlib.pyplot as plt, urllib.request, os, sys, argparse
 
 # Get script directory and set up paths
 script_dir = os.path.dirname(os.path.abspath(__file__))
 data_dir = os.path.join(os.path.dirname(script_dir), 'data')
 output_dir = script_dir
 
+sys.path.insert(0, os.path.join(os.path.dirname(script_dir), 'src'))
+from model_x.cmb import (CMBSpectrumModel, CMBLikelihood, SpectrumEmulator, COSMOLOGY_PARAMS, PRIORS,
+                         FIDUCIAL, initial_walkers, run_sampler, verify_exact)
+from model_x.data_cache import load_planck_tt
+
 # Ensure data directory exists
 os.makedirs(data_dir, exist_ok=True)
 
@@ -23,28 +28,54 @@ if not os.path.exists(planck_file):
         print("Please download manually or check network connection")
         raise
 
-# Load data
-ell, Dl_TT = np.loadtxt(planck_file, unpack=True, usecols=(0,1))[:2000]
-def Dl_model(ell,H0,ombh2,omch2,tau,As,ns,l0):
-    pars=camb.CAMBparams()
-    pars.set_cosmology(H0=H0,ombh2=ombh2,omch2=omch2,tau=tau)
-    pars.InitPower.set_params(As=As,ns=ns)
-    Dl=camb.get_results(pars).get_cmb_power_spectra(lmax=int(ell.max()),CMB_unit="muK")["total"][:,0]
-    return Dl[:len(ell)]*np.exp(-ell**2/(2*l0**2))
-def lnlike(theta):
-    H0,ombh2,omch2,tau,As,ns,l0=theta
-    if not (50<H0<90 and 0.005<ombh2<0.025 and 0.10<omch2<0.30 and 0.04<tau<0.12 and 1e-10<As<2e-9 and 0.92<ns<1.0 and 10<l0<500): return -np.inf
-    try: return -0.5*np.sum(((Dl_TT-Dl_model(ell,*theta))/(0.01*Dl_TT))**2)
-    except: return -np.inf
-sampler=emcee.EnsembleSampler(32,7,lnlike)
-sampler.run_mcmc([np.array([67,0.022,0.12,0.06,2e-9,0.96,70])+1e-3*np.random.randn(7) for _ in range(32)],500)
-l0=np.median(sampler.get_chain(discard=100,flat=True)[:,-1])
-print(f"l0 = {l0:.1f}")
-plt.figure(figsize=(10,6))
-plt.loglog(ell,Dl_TT,"k-",label="Planck",alpha=0.7)
-plt.loglog(ell,Dl_model(ell,67,0.022,0.12,0.06,2e-9,0.96,l0),"r-",label=f"Model")
-plt.xlabel("Multipolo l")
-plt.ylabel("DlTT (muK2)")
-plt.legend()
-plt.savefig(os.path.join(output_dir, "cmb.png"))
-print(f"cmb.png saved to {output_dir}")
\ No newline at end of file
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ajuste de l0 ao espectro TT do Planck")
+    parser.add_argument('--processes', type=int, default=None, help="walkers avaliados em N processos")
+    parser.add_argument('--emulator', type=int, default=0, metavar='N',
+                        help="amostra com um emulador treinado em N soluções CAMB")
+    parser.add_argument('--steps', type=int, default=500,
+                        help="passos por walker; o burn-in descarta min(100, steps // 2)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="grava os espectros CAMB em disco (sem limite: ~20 KB por cosmologia)")
+    args = parser.parse_args(argv)
+    if args.steps < 1:
+        parser.error("--steps deve ser positivo")
+
+    # Load data
+    # Convertido para .npy na primeira execução e mapeado em memória nas seguintes
+    ell, Dl_TT = load_planck_tt(planck_file)[:2]
+    # Espectros CAMB memorizados por cosmologia; l0 só amortece analiticamente
+    model = CMBSpectrumModel(ell, cache_dir=args.cache_dir)
+    exact = CMBLikelihood(ell, Dl_TT, model=model)
+    lnlike = exact
+    if args.emulator:
+        # Treino em ±10% da cosmologia fiducial, dentro dos priors
+        bounds = [(max(lo, c*0.9), min(hi, c*1.1))
+                  for c, (lo, hi) in zip(FIDUCIAL, (PRIORS[name] for name in COSMOLOGY_PARAMS))]
+        emulator = SpectrumEmulator.train(model, args.emulator, bounds, processes=args.processes)
+        lnlike = CMBLikelihood(ell, Dl_TT, model=emulator, priors={**PRIORS, **dict(zip(COSMOLOGY_PARAMS, bounds))})
+
+    sampler = run_sampler(lnlike, 32, args.steps, initial=initial_walkers(32), processes=args.processes)
+    chain = sampler.get_chain(discard=min(100, args.steps // 2), flat=True)
+    if not args.processes:
+        # Com pool, cada worker tem o seu cache; os contadores do processo pai não os incluem
+        print(f"Cache CAMB: {model.cache_info()}")
+    if args.emulator:
+        check = verify_exact(chain, lnlike, exact)
+        print(f"Verificação exata: max |Δ ln L| = {check['max_abs_delta']:.3g}")
+
+    l0=np.median(chain[:,-1])
+    print(f"l0 = {l0:.1f}")
+    plt.figure(figsize=(10,6))
+    plt.loglog(ell,Dl_TT,"k-",label="Planck",alpha=0.7)
+    plt.loglog(ell,model.Dl(FIDUCIAL[:-1]+(l0,)),"r-",label=f"Model")
+    plt.xlabel("Multipolo l")
+    plt.ylabel("DlTT (muK2)")
+    plt.legend()
+    plt.savefig(os.path.join(output_dir, "cmb.png"))
+    print(f"cmb.png saved to {output_dir}")
+
+
+if __name__ == '__main__':
+    main()
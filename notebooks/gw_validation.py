@@ -1,45 +1,59 @@
-# Execute isto no Python/Colab para recriar o arquivo
-script_completo = '''import numpy as np, matplotlib.pyplot as plt
-from gwpy.timeseries import TimeSeries
-from pycbc.waveform import get_td_waveform
-
-# 1. Dados do detector
-strain = TimeSeries.fetch_open_data('H1', 1126259446, 1126259478, sample_rate=4096)
-strain = strain.whiten(4, 2).bandpass(30, 400)
-print(f"Strain processado: {len(strain)} pontos")
-
-# 2. Template
-hp, _ = get_td_waveform(approximant='SEOBNRv4', mass1=36, mass2=29, 
-                        delta_t=1/4096, f_lower=30)
-hp = np.array(hp)
-dt = 1/4096
-print(f"Template gerado: {len(hp)} pontos")
-
-# 3. Função SNR
-def snr(k):
-    factor = np.exp(-k*0.1*np.exp(-np.arange(len(hp))*dt/0.05))
-    return (hp * factor).max()
-
-# 4. Otimização
-kappas = np.linspace(0, 50, 100)
-snrs = [snr(k) for k in kappas]
-best = kappas[np.argmax(snrs)]
-print(f'κ ótimo = {best:.1f}')
-
-# 5. Plot (salva na pasta NOTEBOOKS)
-plt.figure(figsize=(10,6))
-plt.plot(kappas, snrs, 'b-', linewidth=2)
-plt.axvline(x=best, color='r', linestyle='--', label=f'κ={best:.1f}')
-plt.xlabel('κ (parâmetro de amortecimento)')
-plt.ylabel('SNR máximo')
-plt.title('GW150914: SNR vs κ')
-plt.legend()
-plt.savefig('notebooks/gw.png', dpi=150)
-print("✅ gw.png gerado com sucesso")
-'''
-
-# Escreva o arquivo
-with open('notebooks/gw_validation.py', 'w', encoding='utf-8') as f:
-    f.write(script_completo)
-
-print("✅ Arquivo recriado com sucesso!")
\ No newline at end of file
+"""GW150914: varredura de κ por filtro casado contra o strain de H1
+
+Uso:
+    python notebooks/gw_validation.py --strain data/H-H1_LOSC_4_V2-1126259446-32.txt.gz
+    python notebooks/gw_validation.py            # baixa o strain com gwpy
+"""
+import argparse, os, sys
+import numpy as np, matplotlib.pyplot as plt
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(script_dir), 'src'))
+from model_x.matched_filter import MatchedFilter, load_strain
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Varredura de κ para GW150914")
+    parser.add_argument('--strain', help="arquivo local de strain (.txt, .txt.gz ou .npy)")
+    parser.add_argument('--sample-rate', type=float, default=None)
+    parser.add_argument('--kappa-max', type=float, default=50.0)
+    parser.add_argument('--n-kappa', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    # 1. Dados do detector
+    if args.strain:
+        strain, fs, t0 = load_strain(args.strain, args.sample_rate)
+    else:
+        from gwpy.timeseries import TimeSeries
+        series = TimeSeries.fetch_open_data('H1', 1126259446, 1126259478, sample_rate=4096)
+        strain, fs, t0 = series.value, series.sample_rate.value, series.t0.value
+    print(f"Strain: {len(strain)} pontos a {fs:.0f} Hz")
+
+    # 2. Template
+    from pycbc.waveform import get_td_waveform
+    hp, _ = get_td_waveform(approximant='SEOBNRv4', mass1=36, mass2=29,
+                            delta_t=1/fs, f_lower=30)
+    hp = np.array(hp)
+    print(f"Template gerado: {len(hp)} pontos")
+
+    # 3. Banco de κ e filtro casado (PSD de Welch, banda 30-400 Hz)
+    mf = MatchedFilter(strain, fs, start_time=t0, f_low=30, f_high=400)
+    kappas = np.linspace(0, args.kappa_max, args.n_kappa)
+    result = mf.scan(hp, kappas)
+    print(f"κ ótimo = {result['best_kappa']:.1f} | SNR = {result['best_snr']:.1f} "
+          f"| pico em GPS {result['best_time']:.3f}")
+
+    # 4. Plot (salva na pasta NOTEBOOKS)
+    plt.figure(figsize=(10,6))
+    plt.plot(kappas, result['snr_max'], 'b-', linewidth=2)
+    plt.axvline(x=result['best_kappa'], color='r', linestyle='--', label=f"κ={result['best_kappa']:.1f}")
+    plt.xlabel('κ (parâmetro de amortecimento)')
+    plt.ylabel('SNR máximo')
+    plt.title('GW150914: SNR vs κ')
+    plt.legend()
+    plt.savefig(os.path.join(script_dir, 'gw.png'), dpi=150)
+    print("✅ gw.png gerado com sucesso")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,110 +1,217 @@
 # -*- coding: utf-8 -*-
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
-from qiskit import QuantumCircuit
-from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+"""Experimento de decoerência do Modelo X em hardware IBM Quantum
+
+Um único circuito H → RY(θ) → medida, com θ como Parameter, é transpilado
+uma vez para o backend; todos os pontos t viram PUBs (circuito, θ(t)) de um
+só job SamplerV2, e os resultados são coletados quando o job termina (ou em
+segundo plano com run_experiment_async). Qualquer backend aceito pelo
+SamplerV2 serve, inclusive os fake backends locais de
+qiskit_ibm_runtime.fake_provider, que não exigem token.
+
+O backend é escolhido pela variável QUANTUM_BACKEND (ou --backend):
+'local[:semente]' usa o simulador numpy de quantum_backends, 'fake:Nome' um
+fake backend e 'ibm[:nome]' o hardware (padrão, menos ocupado). As
+contagens passam por um ResultCache em disco.
+"""
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import json
 import os
 from datetime import datetime
-from dotenv import load_dotenv
 from pathlib import Path
 
+from quantum_backends import LocalStatevectorBackend, ResultCache, circuit_spec
+
 env_path = Path(__file__).parent / '.env'
-load_dotenv(env_path)
+
 
 def get_quantum_service():
+    from dotenv import load_dotenv
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+    load_dotenv(env_path)
     token = os.getenv('IBMQ_TOKEN')
     if not token:
         raise ValueError('Token IBM Quantum nao encontrado. Configure em .env')
     return QiskitRuntimeService(channel='ibm_quantum_platform', token=token)
 
-def create_decoherence_circuit(t_param):
+
+def theta_from_t(t):
+    """Ângulo de RY para o parâmetro de decoerência t ∈ [0, 1]"""
+    return np.arccos(np.sqrt(1 - np.asarray(t, dtype=float)))
+
+
+def create_decoherence_circuit(t_param=None):
+    """Circuito H → RY(θ) → medida; sem t_param, θ fica como Parameter livre"""
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+
     qc = QuantumCircuit(1, 1)
     qc.h(0)
-    theta = np.arccos(np.sqrt(1 - t_param))
-    qc.ry(theta, 0)
+    qc.ry(Parameter('θ') if t_param is None else float(theta_from_t(t_param)), 0)
     qc.measure(0, 0)
     return qc
 
-def run_experiment(service, backend_name='least_busy', t_points=11, shots=4096):
-    # ✅ Selecionar backend com menos jobs
+
+def model_x_metrics(p1):
+    """Entropia de Shannon (bits), sintropia σ = 1 - S e X = σ - S, vetorizados"""
+    p1 = np.asarray(p1, dtype=float)
+    p0 = 1 - p1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = 0.0 - (np.where(p1 > 0, p1 * np.log2(p1), 0.0) + np.where(p0 > 0, p0 * np.log2(p0), 0.0))
+    sigma = 1 - S
+    return S, sigma, sigma - S
+
+
+def select_backend(service, backend_name='least_busy'):
     if backend_name == 'least_busy':
         backends = service.backends(operational=True, simulator=False)
         if not backends:
             raise RuntimeError("No operational quantum backends available")
-        backend = min(backends, key=lambda b: b.status().pending_jobs)
-    else:
-        backend = service.backend(backend_name)
-    
-    print(f'Backend: {backend.name} (jobs pendentes: {backend.status().pending_jobs})')
-    
-    # ✅ Criar Sampler V2
-    sampler = SamplerV2(mode=backend)
-    
-    # ✅ Criar transpiler para este backend
+        return min(backends, key=lambda b: b.status().pending_jobs)
+    return service.backend(backend_name)
+
+
+def submit_batch(backend, thetas, shots=4096, circuit=None):
+    """Transpila o circuito parametrizado uma vez e envia um job com um PUB por θ
+
+    Retorna (job, nome do registrador clássico) sem esperar o resultado.
+    """
+    from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+    from qiskit_ibm_runtime import SamplerV2
+
+    if circuit is None:
+        circuit = create_decoherence_circuit()
     pass_manager = generate_preset_pass_manager(backend=backend, optimization_level=1)
-    
-    results = {
-        'backend': backend.name,
+    transpiled_qc = pass_manager.run(circuit)
+
+    pubs = [(transpiled_qc, [theta]) for theta in np.atleast_1d(thetas)]
+    job = SamplerV2(mode=backend).run(pubs, shots=shots)
+    return job, circuit.cregs[0].name
+
+
+def collect_counts(job, register='c'):
+    """Contagens {'0': n0, '1': n1} de cada PUB de um job SamplerV2 (bloqueia até o fim)"""
+    return [getattr(pub_result.data, register).get_counts() for pub_result in job.result()]
+
+
+class RuntimeBackend:
+    """Backend qiskit (IBM ou fake) com a interface de quantum_backends"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.name = backend.name
+        self.cache_id = backend.name
+        # A chave do cache usa a estrutura do circuito que é de fato transpilado
+        self.template = create_decoherence_circuit()
+        self.circuit = circuit_spec(self.template)
+
+    def run(self, thetas, shots=4096):
+        status = getattr(self.backend, 'status', None)
+        pending = f' (jobs pendentes: {status().pending_jobs})' if callable(status) else ''
+        job, register = submit_batch(self.backend, thetas, shots, self.template)
+        print(f'Job ID: {job.job_id()} com {len(thetas)} PUBs em {self.name}{pending} (esperando...)')
+        return collect_counts(job, register)
+
+
+def fake_backend(name='FakeManilaV2'):
+    """Backend local de qiskit_ibm_runtime.fake_provider (sem token)"""
+    from qiskit_ibm_runtime import fake_provider
+    return getattr(fake_provider, name)()
+
+
+def load_backend(spec=None, service=None):
+    """Backend a partir de uma especificação ou de QUANTUM_BACKEND
+
+    'local' / 'local:42'     simulador numpy (semente opcional)
+    'fake:FakeManilaV2'      fake backend do qiskit_ibm_runtime
+    'ibm' / 'ibm:ibm_kyiv'   hardware IBM (menos ocupado por padrão)
+    """
+    if spec is None:
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            pass
+        else:
+            load_dotenv(env_path)
+        spec = os.getenv('QUANTUM_BACKEND', 'ibm')
+    kind, _, name = spec.partition(':')
+
+    if kind == 'local':
+        return LocalStatevectorBackend(seed=int(name) if name else None)
+    if kind == 'fake':
+        return RuntimeBackend(fake_backend(name or 'FakeManilaV2'))
+    if kind == 'ibm':
+        return RuntimeBackend(select_backend(service or get_quantum_service(), name or 'least_busy'))
+    raise ValueError(f"Backend desconhecido: {spec!r} (use local, fake:Nome ou ibm[:nome])")
+
+
+def build_results(backend_name, t_values, counts, shots):
+    """Monta o dicionário de resultados (p1, S, σ, X por t) a partir das contagens"""
+    t_values = np.asarray(t_values, dtype=float)
+    ones = np.array([c.get('1', 0) for c in counts], dtype=float)
+    totals = np.array([sum(c.values()) for c in counts], dtype=float)
+    p1 = np.divide(ones, totals, out=np.full_like(ones, 0.5), where=totals > 0)
+    S, sigma, X = model_x_metrics(p1)
+
+    data = [
+        {'t': float(t), 'p1': float(p), 'entropy': float(s), 'syntropy': float(g), 'X': float(x)}
+        for t, p, s, g, x in zip(t_values, p1, S, sigma, X)
+    ]
+    return {
+        'backend': backend_name,
         'timestamp': datetime.now().isoformat(),
         'shots': shots,
-        'data': []
-    }
-    
-    for i, t in enumerate(np.linspace(0, 1, t_points)):
-        print(f'[{i+1}/{t_points}] t={t:.3f}')
-        
-        # Criar e transpilar circuito
-        qc = create_decoherence_circuit(t)
-        transpiled_qc = pass_manager.run(qc)
-        
-        # ✅ Executar com Sampler V2
-        job = sampler.run([transpiled_qc], shots=shots)
-        print(f'Job ID: {job.job_id()} (esperando...)')
-        
-        # ✅ Extrair resultados CORRETAMENTE da nova API
-        result = job.result()
-        
-        # ✅ Formato correto da PrimitiveResult
-        if hasattr(result, 'quasi_dists') and result.quasi_dists:
-            dist = result.quasi_dists[0]
-            # Converter para counts (probabilidades * shots)
-            total_counts = shots
-            counts_0 = int(dist.get(0, 0) * total_counts + 0.5)
-            counts_1 = int(dist.get(1, 0) * total_counts + 0.5)
-            
-            # Normalizar para probabilidades
-            total = counts_0 + counts_1
-            if total > 0:
-                p0 = counts_0 / total
-                p1 = counts_1 / total
-            else:
-                p0 = p1 = 0.5
-        else:
-            # Fallback extremo
-            p0 = p1 = 0.5
-        
-        # Calcular Model X
-        if p1 > 0 and p0 > 0:
-            S = - (p1 * np.log2(p1) + p0 * np.log2(p0))
-        else:
-            S = 0
-        sigma = 1 - S
-        X = sigma - S
-        
-        results['data'].append({
-            't': t, 'p1': p1, 'entropy': S, 'syntropy': sigma, 'X': X
-        })
-        print(f'X = {X:.4f}, S = {S:.4f}, sigma = {sigma:.4f}')
-    
-    X_values = [d['X'] for d in results['data']]
-    results['stats'] = {
-        'average_X': np.mean(X_values),
-        'std_X': np.std(X_values)
+        'data': data,
+        'stats': {
+            'average_X': float(np.mean(X)),
+            'std_X': float(np.std(X))
+        }
     }
+
+
+def run_experiment(service=None, backend_name='least_busy', t_points=11, shots=4096, backend=None,
+                   cache=None):
+    """Executa a varredura de t num único job
+
+    `backend` pode ser um backend de quantum_backends, um backend qiskit
+    (ex.: fake backend) ou uma especificação como 'local:42'; sem ele, usa o
+    service IBM ou, sem service, QUANTUM_BACKEND. `cache=False` desliga o
+    ResultCache.
+    """
+    if isinstance(backend, str) or (backend is None and service is None):
+        backend = load_backend(backend, service)
+    elif backend is None:
+        backend = RuntimeBackend(select_backend(service, backend_name))
+    elif not hasattr(backend, 'cache_id'):
+        backend = RuntimeBackend(backend)
+    print(f'Backend: {backend.name}')
+
+    t_values = np.linspace(0, 1, t_points)
+    thetas = theta_from_t(t_values)
+    if cache is False:
+        counts = backend.run(thetas, shots)
+    else:
+        cache = ResultCache() if cache is None else cache
+        hits = cache.hits
+        counts = cache.run(backend, thetas, shots)
+        print(f'Cache: {cache.hits - hits}/{t_points} pontos reaproveitados')
+
+    results = build_results(backend.name, t_values, counts, shots)
+    for point in results['data']:
+        print(f"t={point['t']:.3f}: X = {point['X']:.4f}, S = {point['entropy']:.4f}, sigma = {point['syntropy']:.4f}")
     print(f"Experimento completo! Media X: {results['stats']['average_X']:.4f}")
     return results
 
+
+_executor = ThreadPoolExecutor(max_workers=4)
+
+
+def run_experiment_async(*args, **kwargs):
+    """run_experiment em segundo plano: devolve um Future com o dicionário de resultados"""
+    return _executor.submit(run_experiment, *args, **kwargs)
+
+
 def save_results(results, filename=None):
     os.makedirs('results', exist_ok=True)
     if filename is None:
@@ -115,11 +222,24 @@ def save_results(results, filename=None):
     print(f'Resultados salvos em: {filename}')
     return filename
 
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Decoerência do Modelo X em IBM Quantum")
+    parser.add_argument('--backend', help="local[:semente], fake:Nome ou ibm[:nome] (padrão: $QUANTUM_BACKEND ou ibm)")
+    parser.add_argument('--t-points', type=int, default=11)
+    parser.add_argument('--shots', type=int, default=4096)
+    parser.add_argument('--no-cache', action='store_true', help="reexecuta mesmo pontos já em cache")
+    args = parser.parse_args(argv)
+
+    results = run_experiment(backend=load_backend(args.backend), t_points=args.t_points, shots=args.shots,
+                             cache=False if args.no_cache else None)
+    return save_results(results)
+
+
 if __name__ == '__main__':
     try:
-        service = get_quantum_service()
-        results = run_experiment(service, t_points=11, shots=4096)
-        save_results(results)
+        main()
     except Exception as e:
         print(f'Erro: {e}')
         import traceback
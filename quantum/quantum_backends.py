@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Simulador local e cache em disco do experimento de decoerência
+
+Todo backend do runner segue a mesma interface mínima:
+
+    name          nome exibido e gravado nos resultados
+    cache_id      identidade usada na chave do cache (None = não cachear)
+    circuit       estrutura do circuito executado, também parte da chave
+    run(thetas, shots) → lista de contagens {'0': n0, '1': n1}, uma por θ
+
+LocalStatevectorBackend evolui o estado de H → RY(θ) para todos os θ de uma
+vez e sorteia os shots por uma multinomial vetorizada; não depende de qiskit
+nem de token. ResultCache guarda as contagens por (circuito, θ, shots,
+backend), e só os pontos ausentes são executados.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+CIRCUIT_SPEC = 'h q[0]; ry(θ) q[0]; measure q[0] -> c[0]'
+CACHE_DIR = Path(__file__).resolve().parent.parent / 'data' / 'cache' / 'quantum'
+
+_H = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+
+
+def circuit_spec(circuit):
+    """Estrutura de um QuantumCircuit como texto (portas, parâmetros, qubits e bits)
+
+    Para o circuito de create_decoherence_circuit() o resultado é CIRCUIT_SPEC.
+    """
+    operations = []
+    for instruction in circuit.data:
+        operation = instruction.operation
+        text = operation.name
+        if operation.params:
+            text += '(' + ', '.join(str(p) for p in operation.params) + ')'
+        text += ' ' + ', '.join(f'q[{circuit.find_bit(q).index}]' for q in instruction.qubits)
+        if instruction.clbits:
+            text += ' -> ' + ', '.join(f'c[{circuit.find_bit(c).index}]' for c in instruction.clbits)
+        operations.append(text)
+    return '; '.join(operations)
+
+
+class LocalStatevectorBackend:
+    """Simulador de vetor de estado do circuito H → RY(θ) → medida
+
+    Sem semente cada execução é um sorteio novo, e as contagens não vão
+    para o cache.
+    """
+
+    circuit = CIRCUIT_SPEC
+
+    def __init__(self, seed=None, name='local_statevector'):
+        self.seed = seed
+        self.name = name
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def cache_id(self):
+        if self.seed is None:
+            return None
+        return f'{self.name}:seed={self.seed}'
+
+    @staticmethod
+    def statevectors(thetas):
+        """Estados RY(θ)·H|0⟩ para cada θ: array (n_θ, 2)"""
+        half = np.asarray(thetas, dtype=float)[:, None, None] / 2
+        c, s = np.cos(half), np.sin(half)
+        ry = np.concatenate([np.concatenate([c, -s], axis=2), np.concatenate([s, c], axis=2)], axis=1)
+        return ry @ _H[:, 0]
+
+    def probabilities(self, thetas):
+        """Probabilidades (n_θ, 2) dos resultados 0 e 1"""
+        return np.abs(self.statevectors(np.atleast_1d(thetas)))**2
+
+    def run(self, thetas, shots=4096):
+        """Sorteia `shots` medidas por θ (multinomial em lote) e devolve as contagens"""
+        probabilities = self.probabilities(thetas)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        samples = self.rng.multinomial(int(shots), probabilities)
+        return [{'0': int(n0), '1': int(n1)} for n0, n1 in samples]
+
+
+class ResultCache:
+    """Contagens em disco, um JSON por (circuito, θ, shots, backend)
+
+    O circuito da chave é o `circuit` do backend; `circuit` aqui o substitui.
+    """
+
+    def __init__(self, cache_dir=None, circuit=None):
+        self.cache_dir = Path(CACHE_DIR if cache_dir is None else cache_dir)
+        self.circuit = circuit
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, backend, theta, shots):
+        payload = json.dumps({
+            'circuit': self.circuit or backend.circuit,
+            'theta': float(theta).hex(),
+            'shots': int(shots),
+            'backend': backend.cache_id,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / f'{key}.json'
+
+    def get(self, backend, theta, shots):
+        path = self._path(self.key(backend, theta, shots))
+        if not path.exists():
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)['counts']
+
+    def put(self, backend, theta, shots, counts):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        key = self.key(backend, theta, shots)
+        entry = {'backend': backend.name, 'theta': float(theta), 'shots': int(shots), 'counts': counts}
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def run(self, backend, thetas, shots=4096):
+        """Contagens para todos os θ, executando no backend só os que faltam no cache"""
+        thetas = np.atleast_1d(np.asarray(thetas, dtype=float))
+        if backend.cache_id is None:
+            return backend.run(thetas, shots)
+        counts = [self.get(backend, theta, shots) for theta in thetas]
+        missing = [i for i, c in enumerate(counts) if c is None]
+        self.hits += len(thetas) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            fresh = backend.run(thetas[missing], shots)
+            for i, c in zip(missing, fresh):
+                counts[i] = c
+                self.put(backend, thetas[i], shots, c)
+        return counts
+
+    def clear(self):
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob('*.json'):
+                path.unlink()
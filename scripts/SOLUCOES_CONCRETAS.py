@@ -8,34 +8,55 @@ Modelo X Framework - Derivações Matemáticas e Valores Numéricos
 Este arquivo NÃO é uma análise teórica.
 Este arquivo RESOLVE os problemas com valores CONCRETOS.
 
+Importar o módulo não executa nenhuma solução: as dez classes *Solution ficam
+num registro (SOLUTIONS) e são instanciadas e resolvidas sob demanda, e os
+submódulos do scipy só são importados pelos solvers que os usam.
+
+Os resultados ficam num cache persistente (data/cache/solucoes) indexado por
+solver, ModeloXParams e versão do código; soluções inalteradas carregam do disco.
+
+Uso:
+    python scripts/SOLUCOES_CONCRETAS.py                  # todos os problemas
+    python scripts/SOLUCOES_CONCRETAS.py 3 envelhecimento  # por número ou nome
+    python scripts/SOLUCOES_CONCRETAS.py --list
+    python scripts/SOLUCOES_CONCRETAS.py --no-cache       # recalcula tudo
+
 Autor: Modelo X Framework v2.0
 Data: Novembro 2025
 ================================================================================
 """
 
-import numpy as np
-from scipy import constants, optimize, integrate
-from scipy.special import gamma as gamma_func
+import argparse
+import glob
+import gzip
+import hashlib
 import json
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+import os
+import tempfile
 import warnings
-warnings.filterwarnings('ignore')
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Tuple, Optional
+
+import numpy as np
+
+# np.trapz foi renomeada para np.trapezoid no NumPy 2
+_trapezoid = np.trapezoid if hasattr(np, 'trapezoid') else np.trapz
 
 # =============================================================================
 # CONSTANTES FÍSICAS FUNDAMENTAIS
 # =============================================================================
 
-# Constantes do SI
-c = constants.c                     # Velocidade da luz: 299792458 m/s
-G = constants.G                     # Constante gravitacional: 6.674e-11 m³/(kg·s²)
-hbar = constants.hbar               # Constante de Planck reduzida: 1.055e-34 J·s
-k_B = constants.k                   # Constante de Boltzmann: 1.381e-23 J/K
-e = constants.e                     # Carga do elétron: 1.602e-19 C
-m_e = constants.m_e                 # Massa do elétron: 9.109e-31 kg
-m_p = constants.m_p                 # Massa do próton: 1.673e-27 kg
-epsilon_0 = constants.epsilon_0     # Permissividade do vácuo
-alpha = constants.alpha             # Constante de estrutura fina: ~1/137
+# Constantes do SI (CODATA 2022, mesmos valores de scipy.constants; fixadas
+# aqui para que importar o módulo não carregue o scipy)
+c = 299792458.0                     # Velocidade da luz: 299792458 m/s
+G = 6.6743e-11                      # Constante gravitacional: 6.674e-11 m³/(kg·s²)
+hbar = 1.0545718176461565e-34       # Constante de Planck reduzida: 1.055e-34 J·s
+k_B = 1.380649e-23                  # Constante de Boltzmann: 1.381e-23 J/K
+e = 1.602176634e-19                 # Carga do elétron: 1.602e-19 C
+m_e = 9.1093837139e-31              # Massa do elétron: 9.109e-31 kg
+m_p = 1.67262192595e-27             # Massa do próton: 1.673e-27 kg
+epsilon_0 = 8.8541878188e-12        # Permissividade do vácuo
+alpha = 0.0072973525643             # Constante de estrutura fina: ~1/137
 
 # Escalas de Planck
 l_P = np.sqrt(hbar * G / c**3)      # Comprimento de Planck: 1.616e-35 m
@@ -67,37 +88,374 @@ class ModeloXParams:
 
 MX = ModeloXParams()
 
-def f_E(E_energy: float, params: ModeloXParams = MX) -> float:
-    """Função de modulação entrópica"""
-    if E_energy <= 0:
-        return 1.0
-    return 1 + params.alpha * np.log(E_energy / params.E0)
+def params_arrays(params=MX, ndim: int = 0) -> Tuple:
+    """(α, β, γ, E0) prontos para broadcast contra energias com `ndim` dimensões
 
-def g_S(E_energy: float, params: ModeloXParams = MX) -> float:
-    """Função de modulação sintrópica"""
-    if E_energy <= 0:
-        return 1.0
-    return 1 + params.beta * (E_energy / params.E0)**params.gamma
+    Um único ModeloXParams dá escalares; uma sequência de P conjuntos dá
+    arrays de forma (P, 1, ..., 1), e o resultado ganha um eixo 0 com um
+    elemento por conjunto de parâmetros.
+    """
+    if isinstance(params, ModeloXParams):
+        return params.alpha, params.beta, params.gamma, params.E0
+    table = np.array([(p.alpha, p.beta, p.gamma, p.E0) for p in params], dtype=float)
+    return tuple(column.reshape((-1,) + (1,) * ndim) for column in table.T)
 
-def Phi(E: float, S: float, energy: float, params: ModeloXParams = MX) -> float:
-    """Equação universal do Modelo X: Φ(E, S, ℰ) = E·f(ℰ) + S·g(ℰ)"""
+def _unwrap(value: np.ndarray):
+    """Devolve escalar NumPy para entradas escalares e o array nos demais casos"""
+    return value[()] if value.ndim == 0 else value
+
+def f_E(E_energy, params=MX):
+    """Função de modulação entrópica
+
+    Vetorizada sobre ℰ e sobre uma sequência de ModeloXParams (ver
+    params_arrays); o ramo ℰ ≤ 0 → 1 é tratado por máscara.
+    """
+    energy = np.asarray(E_energy, dtype=float)
+    alpha, _, _, E0 = params_arrays(params, energy.ndim)
+    positive = energy > 0
+    value = 1 + alpha * np.log(np.where(positive, energy, E0) / E0)
+    return _unwrap(np.where(positive, value, 1.0))
+
+def g_S(E_energy, params=MX):
+    """Função de modulação sintrópica (vetorizada como f_E)"""
+    energy = np.asarray(E_energy, dtype=float)
+    _, beta, gamma, E0 = params_arrays(params, energy.ndim)
+    positive = energy > 0
+    value = 1 + beta * (np.where(positive, energy, E0) / E0)**gamma
+    return _unwrap(np.where(positive, value, 1.0))
+
+def Phi(E, S, energy, params=MX):
+    """Equação universal do Modelo X: Φ(E, S, ℰ) = E·f(ℰ) + S·g(ℰ)
+
+    E, S e ℰ seguem as regras de broadcast do NumPy; uma sequência de
+    ModeloXParams acrescenta o eixo 0 de parâmetros.
+    """
+    energy = np.asarray(energy, dtype=float)
+    shape = np.broadcast_shapes(np.shape(E), np.shape(S), energy.shape)
+    energy = np.broadcast_to(energy, shape)
     return E * f_E(energy, params) + S * g_S(energy, params)
 
 
+# =============================================================================
+# RAÍZES EM LOTE (VARREDURAS DE PARÂMETROS)
+# =============================================================================
+
+def bracketed_roots(func: Callable, lower, upper, args: Tuple = (), xtol: float = 2e-12,
+                    rtol: float = 8.9e-16, maxiter: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """Raízes de func(x, *args) em cada intervalo [lower, upper], todas de uma vez
+
+    `func` deve ser vetorizada; lower, upper e args são combinados por
+    broadcasting e cada elemento é um problema independente. Usa o método de
+    Chandrupatla (interpolação quadrática inversa com salvaguarda de
+    bisseção, convergência comparável à de brentq), avaliando a cada iteração
+    apenas os elementos ainda não convergidos. Retorna (raízes, convergiu);
+    elementos sem troca de sinal no intervalo saem como NaN.
+    """
+    arrays = np.broadcast_arrays(np.asarray(lower, dtype=float), np.asarray(upper, dtype=float),
+                                 *[np.asarray(arg, dtype=float) for arg in args])
+    shape = arrays[0].shape
+    x1, x2, *params = [array.ravel().copy() for array in arrays]
+
+    f1 = func(x1, *params)
+    f2 = func(x2, *params)
+    roots = np.full(x1.shape, np.nan)
+    converged = np.zeros(x1.shape, dtype=bool)
+
+    for x, fx in ((x2, f2), (x1, f1)):
+        roots[fx == 0] = x[fx == 0]
+        converged[fx == 0] = True
+
+    active = np.flatnonzero(~converged & (np.sign(f1) != np.sign(f2)))
+    x1, x2, f1, f2 = x1[active], x2[active], f1[active], f2[active]
+    x3, f3 = x1, f1
+    params = [param[active] for param in params]
+    t = np.full(len(active), 0.5)
+
+    for _ in range(maxiter):
+        if len(active) == 0:
+            break
+
+        xt = x1 + t * (x2 - x1)
+        ft = func(xt, *params)
+
+        # Manter [x1, x2] com troca de sinal; x3 guarda o ponto descartado
+        same = np.sign(ft) == np.sign(f1)
+        x3, f3 = np.where(same, x1, x2), np.where(same, f1, f2)
+        x2, f2 = np.where(same, x2, x1), np.where(same, f2, f1)
+        x1, f1 = xt, ft
+
+        best = np.abs(f1) < np.abs(f2)
+        xm = np.where(best, x1, x2)
+        fm = np.where(best, f1, f2)
+        tol = 2 * rtol * np.abs(xm) + xtol / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tl = tol / np.abs(x2 - x1)
+
+        done = (fm == 0) | (tl > 0.5)
+        roots[active[done]] = xm[done]
+        converged[active[done]] = True
+
+        # Interpolação quadrática inversa quando segura, senão bisseção
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            iqi = (f1 / (f2 - f1) * f3 / (f2 - f3)
+                   + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2))
+        use_iqi = (phi ** 2 < xi) & ((1 - phi) ** 2 < 1 - xi)
+        t = np.clip(np.where(use_iqi, iqi, 0.5), tl, 1 - tl)
+
+        keep = ~done
+        active, t = active[keep], t[keep]
+        x1, x2, x3, f1, f2, f3 = x1[keep], x2[keep], x3[keep], f1[keep], f2[keep], f3[keep]
+        params = [param[keep] for param in params]
+
+    roots[active] = np.where(np.abs(f1) < np.abs(f2), x1, x2)
+    return roots.reshape(shape), converged.reshape(shape)
+
+
+def expand_brackets(func: Callable, guess, width, lower, upper, args: Tuple = (),
+                    max_expansions: int = 30) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Intervalos com troca de sinal em torno de `guess`, dobrando `width` até achar
+
+    Os intervalos ficam limitados a [lower, upper]. Retorna (a, b, encontrado).
+    """
+    arrays = np.broadcast_arrays(np.asarray(guess, dtype=float), np.asarray(width, dtype=float),
+                                 np.asarray(lower, dtype=float), np.asarray(upper, dtype=float),
+                                 *[np.asarray(arg, dtype=float) for arg in args])
+    guess, width, lower, upper, *params = [array.ravel().copy() for array in arrays]
+
+    a = np.clip(guess - width, lower, upper)
+    b = np.clip(guess + width, lower, upper)
+    found = np.zeros(guess.shape, dtype=bool)
+    pending = np.flatnonzero(np.isfinite(guess))
+
+    for _ in range(max_expansions):
+        if len(pending) == 0:
+            break
+        sub = [param[pending] for param in params]
+        fa, fb = func(a[pending], *sub), func(b[pending], *sub)
+        hit = (np.sign(fa) != np.sign(fb)) | (fa == 0) | (fb == 0)
+        found[pending[hit]] = True
+
+        pending = pending[~hit]
+        width[pending] *= 2
+        a[pending] = np.clip(guess[pending] - width[pending], lower[pending], upper[pending])
+        b[pending] = np.clip(guess[pending] + width[pending], lower[pending], upper[pending])
+        # Intervalo já cobre [lower, upper] sem troca de sinal: desistir
+        exhausted = (a[pending] <= lower[pending]) & (b[pending] >= upper[pending]) & (width[pending] > 2 * (upper[pending] - lower[pending]))
+        pending = pending[~exhausted]
+
+    shape = arrays[0].shape
+    return a.reshape(shape), b.reshape(shape), found.reshape(shape)
+
+
+def solve_roots_grid(func: Callable, args: Tuple, lower: float, upper: float, axis: int = -1,
+                     stride: int = 8, xtol: float = 2e-12, maxiter: int = 100) -> np.ndarray:
+    """Raízes de func(x, *args) em toda a grade formada pelo broadcast de `args`
+
+    Partida a quente ao longo de `axis`: primeiro é resolvido, com o intervalo
+    completo [lower, upper], um ponto a cada `stride`; os demais partem da
+    interpolação das raízes vizinhas, com um intervalo estreito expandido até
+    haver troca de sinal. Pontos sem raiz em [lower, upper] saem como NaN.
+    """
+    grid = np.broadcast_arrays(*[np.asarray(arg, dtype=float) for arg in args])
+    shape = grid[0].shape
+    if not shape:
+        grid = [array.reshape(1) for array in grid]
+    moved = [np.moveaxis(array, axis, -1) for array in grid]
+    n = moved[0].shape[-1]
+
+    coarse = np.unique(np.r_[np.arange(0, n, max(1, stride)), n - 1])
+    roots = np.full(moved[0].shape, np.nan)
+    roots[..., coarse], _ = bracketed_roots(func, lower, upper, [array[..., coarse] for array in moved],
+                                            xtol=xtol, maxiter=maxiter)
+
+    fine = np.setdiff1d(np.arange(n), coarse)
+    if len(fine):
+        right = np.searchsorted(coarse, fine)
+        left = coarse[right - 1]
+        right = coarse[right]
+        weight = (fine - left) / (right - left)
+
+        root_left, root_right = roots[..., left], roots[..., right]
+        guess = root_left + weight * (root_right - root_left)
+        width = np.maximum(np.abs(root_right - root_left), 1e-6 * (upper - lower))
+        fine_args = [array[..., fine] for array in moved]
+
+        a, b, found = expand_brackets(func, guess, width, lower, upper, fine_args)
+        # Sem vizinhos resolvidos (ou sem troca de sinal local): intervalo completo
+        a = np.where(found, a, lower)
+        b = np.where(found, b, upper)
+        roots[..., fine], _ = bracketed_roots(func, a, b, fine_args, xtol=xtol, maxiter=maxiter)
+
+    return np.moveaxis(roots, -1, axis).reshape(shape)
+
+
+# =============================================================================
+# REGISTRO DE SOLUÇÕES
+# =============================================================================
+
+@dataclass(frozen=True)
+class SolutionEntry:
+    """Entrada do registro: metadados e classe de uma solução (ainda não resolvida)"""
+    number: int
+    name: str
+    title: str
+    solution_class: type
+
+    @property
+    def key(self) -> str:
+        """Chave usada em SOLUCOES_CONCRETAS.json (ex.: '3_origem_da_vida')"""
+        return f"{self.number}_{self.name}"
+
+
+SOLUTIONS: Dict[str, SolutionEntry] = {}
+_RESULTS: Dict[str, Dict] = {}
+
+DEFAULT_CACHE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                  '..', 'data', 'cache', 'solucoes'))
+
+
+def _code_version() -> str:
+    """Hash do código-fonte deste módulo: qualquer edição invalida o cache"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+CODE_VERSION = _code_version()
+
+
+def cache_key(name: str, params: ModeloXParams = MX) -> str:
+    """Hash estável de (solver, ModeloXParams, versão do código)"""
+    payload = json.dumps({'solver': name, 'params': asdict(params), 'code_version': CODE_VERSION},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Cache persistente dos resultados de solve(): um JSON gzip por chave
+
+    A chave vem de cache_key(), então alterar alpha, beta, gamma, E0 (ou
+    qualquer campo de ModeloXParams) ou editar este módulo gera entradas
+    novas. As gravações são atômicas (arquivo temporário + os.replace) e
+    entradas corrompidas são tratadas como ausentes.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Resultado armazenado para a chave (ou None)"""
+        try:
+            with gzip.open(self.path(key), 'rt', encoding='utf-8') as f:
+                result = json.load(f)['result']
+        except (OSError, EOFError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def store(self, key: str, result: Dict, metadata: Optional[Dict] = None) -> str:
+        """Grava o resultado de forma atômica e retorna o caminho"""
+        os.makedirs(self.directory, exist_ok=True)
+        payload = json.dumps({**(metadata or {}), 'result': result}, ensure_ascii=False,
+                             separators=(',', ':'), default=str)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+                f.write(payload.encode('utf-8'))
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return self.path(key)
+
+    def clear(self) -> int:
+        """Remove todas as entradas e retorna quantas foram apagadas"""
+        paths = glob.glob(os.path.join(self.directory, '*.json.gz'))
+        for path in paths:
+            os.remove(path)
+        return len(paths)
+
+
+class ModeloXSolution:
+    """Base das classes *Solution: guarda os parâmetros do Modelo X usados por solve()"""
+
+    def __init__(self, params: ModeloXParams = MX):
+        self.params = params
+
+    def solve(self) -> Dict:
+        raise NotImplementedError
+
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return []
+
+
+def register_solution(number: int, name: str, title: str) -> Callable[[type], type]:
+    """Decorador que registra uma classe *Solution sem instanciá-la"""
+    def decorator(cls: type) -> type:
+        SOLUTIONS[name] = SolutionEntry(number, name, title, cls)
+        return cls
+    return decorator
+
+
+def get_entry(problem) -> SolutionEntry:
+    """Entrada do registro por nome, chave ('3_origem_da_vida') ou número"""
+    for entry in SOLUTIONS.values():
+        if str(problem) in (entry.name, entry.key, str(entry.number)):
+            return entry
+    raise KeyError(f"Problema desconhecido: {problem!r} (use --list para ver os disponíveis)")
+
+
+def solve(problem, params: ModeloXParams = MX, cache: Optional[ResultCache] = None) -> Dict:
+    """Resolve um problema sob demanda
+
+    O resultado fica memorizado no processo e, com `cache`, também em disco,
+    ambos indexados por cache_key(nome, params).
+    """
+    entry = get_entry(problem)
+    key = cache_key(entry.name, params)
+    if key not in _RESULTS:
+        result = cache.load(key) if cache is not None else None
+        if result is None:
+            result = entry.solution_class(params).solve()
+            if cache is not None:
+                cache.store(key, result, {'solver': entry.name, 'params': asdict(params),
+                                          'code_version': CODE_VERSION})
+        _RESULTS[key] = result
+    return _RESULTS[key]
+
+
+def solve_all(problems: Optional[List] = None, params: ModeloXParams = MX,
+              cache: Optional[ResultCache] = None) -> Dict[str, Dict]:
+    """Resolve os problemas selecionados (padrão: todos), indexados pela chave JSON"""
+    entries = [get_entry(p) for p in problems] if problems else list(SOLUTIONS.values())
+    entries.sort(key=lambda entry: entry.number)
+    return {entry.key: solve(entry.name, params, cache) for entry in entries}
+
+
 # =============================================================================
 # PROBLEMA 1: MATÉRIA ESCURA E ENERGIA ESCURA
 # =============================================================================
-print("="*80)
-print("PROBLEMA 1: MATÉRIA ESCURA E ENERGIA ESCURA")
-print("="*80)
 
-class DarkMatterEnergySolution:
+@register_solution(1, "materia_escura_energia_escura", "MATÉRIA ESCURA E ENERGIA ESCURA")
+class DarkMatterEnergySolution(ModeloXSolution):
     """
     SOLUÇÃO: Matéria Escura é manifestação de Sintropia Negativa S(-)
              Energia Escura é manifestação de Entropia Negativa E(-)
     """
 
-    def __init__(self):
+    def __init__(self, params: ModeloXParams = MX):
+        super().__init__(params)
         # Observações cosmológicas
         self.Omega_DM = 0.268       # Fração de matéria escura
         self.Omega_DE = 0.683       # Fração de energia escura
@@ -119,7 +477,7 @@ class DarkMatterEnergySolution:
         # 2. CAMPO SINTRÓPICO NEGATIVO
         # S(-) = ρ_DM / g(ℰ_CMB)
         E_CMB = k_B * T_CMB  # Energia característica da CMB
-        g_CMB = g_S(E_CMB / (1.602e-19))  # Normalizado
+        g_CMB = g_S(E_CMB / (1.602e-19), self.params)  # Normalizado
 
         S_negative = rho_DM / g_CMB  # Densidade do campo sintrópico
 
@@ -159,7 +517,7 @@ class DarkMatterEnergySolution:
         # ENERGIA DO VÁCUO POR UNIDADE DE VOLUME
         # ρ_vac = E(-) / V_Planck³ × f(ℰ_vac)
         # Resolvendo:
-        E_negative = rho_vacuum / f_E(E_CMB / (1.602e-19))
+        E_negative = rho_vacuum / f_E(E_CMB / (1.602e-19), self.params)
 
         # 5. ESCALA DE ENERGIA DA ENERGIA ESCURA
         # ρ_DE ≈ (meV)⁴ / (ℏc)³
@@ -203,20 +561,21 @@ class DarkMatterEnergySolution:
             ]
         }
 
-dm_solution = DarkMatterEnergySolution()
-result_1 = dm_solution.solve()
-print(f"\n✓ MASSA MATÉRIA ESCURA: {result_1['solucoes_materiais_escura']['massa_particula_DM_eV']:.2e} eV/c²")
-print(f"✓ ESCALA ENERGIA ESCURA: {result_1['solucoes_energia_escura']['escala_energia_meV']:.4f} meV")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ MASSA MATÉRIA ESCURA: {result['solucoes_materiais_escura']['massa_particula_DM_eV']:.2e} eV/c²",
+            f"✓ ESCALA ENERGIA ESCURA: {result['solucoes_energia_escura']['escala_energia_meV']:.4f} meV"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 2: GRAVIDADE QUÂNTICA
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 2: GRAVIDADE QUÂNTICA")
-print("="*80)
 
-class QuantumGravitySolution:
+@register_solution(2, "gravidade_quantica", "GRAVIDADE QUÂNTICA")
+class QuantumGravitySolution(ModeloXSolution):
     """
     SOLUÇÃO: Gravidade emerge de gradientes S/E em escala de Planck
     """
@@ -275,7 +634,7 @@ class QuantumGravitySolution:
         # 8. ENERGIA DE UNIFICAÇÃO EXATA
         # E_unif = E_P × (α × β / γ)^(1/4)
         # Usando parâmetros do Modelo X:
-        E_unif = E_P * (MX.alpha * MX.beta / MX.gamma)**(1/4)
+        E_unif = E_P * (self.params.alpha * self.params.beta / self.params.gamma)**(1/4)
         E_unif_GeV = E_unif / (1.602e-19) / 1e9
 
         return {
@@ -316,24 +675,47 @@ class QuantumGravitySolution:
             ]
         }
 
-qg_solution = QuantumGravitySolution()
-result_2 = qg_solution.solve()
-print(f"\n✓ CONSTANTE κ_MX: {result_2['constante_unificacao']['kappa_MX_m']:.6e} m")
-print(f"✓ ENERGIA UNIFICAÇÃO: {result_2['constante_unificacao']['energia_unificacao_GeV']:.2e} GeV")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ CONSTANTE κ_MX: {result['constante_unificacao']['kappa_MX_m']:.6e} m",
+            f"✓ ENERGIA UNIFICAÇÃO: {result['constante_unificacao']['energia_unificacao_GeV']:.2e} GeV"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 3: ORIGEM DA VIDA
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 3: ORIGEM DA VIDA")
-print("="*80)
 
-class OriginOfLifeSolution:
+@register_solution(3, "origem_da_vida", "ORIGEM DA VIDA")
+class OriginOfLifeSolution(ModeloXSolution):
     """
     SOLUÇÃO: Vida emerge em transição de fase sintrópica crítica
     """
 
+    @staticmethod
+    def transition_residual(E_norm, delta, alpha, beta, gamma, E0):
+        """g(ℰ) - f(ℰ) - Δ vetorizado (ℰ > 0 em todo o intervalo de busca)"""
+        ratio = E_norm / E0
+        return (1 + beta * ratio**gamma) - (1 + alpha * np.log(ratio)) - delta
+
+    def critical_energies(self, delta, alpha=None, beta=None, gamma=None, E0=None,
+                          lower: float = 0.01, upper: float = 10.0, axis: int = -1,
+                          stride: int = 8) -> np.ndarray:
+        """ℰ_min normalizada, onde g(ℰ) = f(ℰ) + Δ, em toda a grade de Δ e parâmetros
+
+        Δ e os parâmetros (omitidos: valores de self.params) são combinados por
+        broadcasting e resolvidos numa única chamada de solve_roots_grid. Onde
+        não há raiz em [lower, upper] vale a aproximação linear Δ / (β - α).
+        """
+        p = self.params
+        args = [np.asarray(value if value is not None else default, dtype=float)
+                for value, default in ((delta, None), (alpha, p.alpha), (beta, p.beta),
+                                       (gamma, p.gamma), (E0, p.E0))]
+        roots = solve_roots_grid(self.transition_residual, args, lower, upper, axis=axis, stride=stride)
+        return np.where(np.isnan(roots), args[0] / (args[2] - args[1]), roots)
+
     def solve(self) -> Dict:
         """
         DERIVAÇÃO DA ENERGIA CRÍTICA DE TRANSIÇÃO VIDA/NÃO-VIDA
@@ -393,19 +775,13 @@ class OriginOfLifeSolution:
         # Vida requer: g(ℰ) > f(ℰ) + Δ
         # Onde Δ = (S_vida - S_prebiotico) / C
 
-        Delta = (S_vida - S_prebiotico) / MX.C_universal
+        Delta = (S_vida - S_prebiotico) / self.params.C_universal
 
         # Energia mínima que satisfaz g(ℰ) > f(ℰ) + Δ:
-        def equation_to_solve(E_norm):
-            return g_S(E_norm) - f_E(E_norm) - Delta
-
         # Encontrar numericamente onde g(ℰ) - f(ℰ) = Δ
         # Para valores típicos, isso ocorre em E_norm ~ 0.5-2.0
-        try:
-            E_min_norm = optimize.brentq(equation_to_solve, 0.01, 10)
-        except ValueError:
-            # Se não encontrar raiz, usar valor aproximado
-            E_min_norm = Delta / (MX.beta - MX.alpha)  # Aproximação linear
+        # (sem raiz em [0.01, 10]: aproximação linear Δ / (β - α))
+        E_min_norm = float(self.critical_energies(Delta))
 
         E_min_kJ = E_min_norm * E_ATP / 1000  # kJ/mol
 
@@ -455,21 +831,22 @@ class OriginOfLifeSolution:
             ]
         }
 
-life_solution = OriginOfLifeSolution()
-result_3 = life_solution.solve()
-print(f"\n✓ ENERGIA CRÍTICA: {result_3['energia_critica']['E_critico_kJ_mol']:.1f} kJ/mol")
-print(f"✓ TEMPERATURA CRÍTICA: {result_3['temperatura_critica']['T_critico_K']:.0f} K")
-print(f"✓ PROBABILIDADE TOTAL: {result_3['probabilidade_abiogenese']['P_total']:.6f}")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ ENERGIA CRÍTICA: {result['energia_critica']['E_critico_kJ_mol']:.1f} kJ/mol",
+            f"✓ TEMPERATURA CRÍTICA: {result['temperatura_critica']['T_critico_K']:.0f} K",
+            f"✓ PROBABILIDADE TOTAL: {result['probabilidade_abiogenese']['P_total']:.6f}"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 4: CONSCIÊNCIA
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 4: CONSCIÊNCIA")
-print("="*80)
 
-class ConsciousnessSolution:
+@register_solution(4, "consciencia", "CONSCIÊNCIA")
+class ConsciousnessSolution(ModeloXSolution):
     """
     SOLUÇÃO: Consciência = Sintropia² × g(ℰ_neural) × I_integrada
     """
@@ -506,7 +883,7 @@ class ConsciousnessSolution:
         # Φ_c = S² × g(ℰ) × I
 
         def consciousness_index(S, E_norm, I):
-            return S**2 * g_S(E_norm) * I
+            return S**2 * g_S(E_norm, self.params) * I
 
         # Estados de consciência
         states = {
@@ -593,23 +970,23 @@ class ConsciousnessSolution:
             ]
         }
 
-consciousness_solution = ConsciousnessSolution()
-result_4 = consciousness_solution.solve()
-print(f"\n✓ LIMIAR DE CONSCIÊNCIA: Φ_c > {result_4['limiar_consciencia']['Phi_critico']}")
-print(f"✓ CONSTANTE k_c: {result_4['equacao_consciencia']['constante_k']:.4f}")
-print("✓ ÍNDICES DE CONSCIÊNCIA:")
-for state, phi in result_4['indices_por_estado'].items():
-    print(f"   - {state}: Φ = {phi:.3f}")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ LIMIAR DE CONSCIÊNCIA: Φ_c > {result['limiar_consciencia']['Phi_critico']}",
+            f"✓ CONSTANTE k_c: {result['equacao_consciencia']['constante_k']:.4f}",
+            "✓ ÍNDICES DE CONSCIÊNCIA:",
+            *(f"   - {state}: Φ = {phi:.3f}" for state, phi in result['indices_por_estado'].items())
+        ]
 
 
 # =============================================================================
 # PROBLEMA 5: MUDANÇAS CLIMÁTICAS
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 5: MUDANÇAS CLIMÁTICAS")
-print("="*80)
 
-class ClimateChangeSolution:
+@register_solution(5, "mudancas_climaticas", "MUDANÇAS CLIMÁTICAS")
+class ClimateChangeSolution(ModeloXSolution):
     """
     SOLUÇÃO: Trajetória de estabilização E→0.50, S→0.50 até 2050
     """
@@ -668,7 +1045,7 @@ class ClimateChangeSolution:
         years = np.arange(2025, 2051)
         E_trajectory = np.linspace(E_2025, E_2050, len(years))
         S_trajectory = np.linspace(S_2025, S_2050, len(years))
-        CO2_trajectory = [CO2_from_E(e) for e in E_trajectory]
+        CO2_trajectory = CO2_from_E(E_trajectory)
 
         # 8. EMISSÕES ANUAIS PERMITIDAS
         # Budget de carbono restante para 1.5°C: ~300 GtCO2
@@ -679,7 +1056,7 @@ class ClimateChangeSolution:
 
         # Emissões permitidas (decrescendo linearmente para zero em 2050)
         emissions_trajectory = np.linspace(emissions_2025, 0, len(years))
-        total_emissions = np.trapz(emissions_trajectory)
+        total_emissions = _trapezoid(emissions_trajectory)
 
         # 9. PONTOS DE INFLEXÃO
         tipping_points = {
@@ -737,25 +1114,69 @@ class ClimateChangeSolution:
             ]
         }
 
-climate_solution = ClimateChangeSolution()
-result_5 = climate_solution.solve()
-print(f"\n✓ META CO2 2050: {result_5['meta_2050']['CO2_ppm']:.0f} ppm")
-print(f"✓ REDUÇÃO NECESSÁRIA: {result_5['trajetoria_solucao']['reducao_percentual_total']:.1f}%")
-print(f"✓ CUSTO TOTAL: {result_5['acoes_quantificadas']['custo_total_trilhoes_USD']:.1f} trilhões USD")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ META CO2 2050: {result['meta_2050']['CO2_ppm']:.0f} ppm",
+            f"✓ REDUÇÃO NECESSÁRIA: {result['trajetoria_solucao']['reducao_percentual_total']:.1f}%",
+            f"✓ CUSTO TOTAL: {result['acoes_quantificadas']['custo_total_trilhoes_USD']:.1f} trilhões USD"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 6: ENVELHECIMENTO E LONGEVIDADE
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 6: ENVELHECIMENTO E LONGEVIDADE")
-print("="*80)
 
-class AgingSolution:
+@register_solution(6, "envelhecimento", "ENVELHECIMENTO E LONGEVIDADE")
+class AgingSolution(ModeloXSolution):
     """
     SOLUÇÃO: Constantes de decaimento sintrópico e acúmulo entrópico
     """
 
+    # S(t) = S₀ × exp(-λt) + S_min, E(t) = E₀ + μt; morte quando E/S = 20
+    S_0 = 0.80
+    S_min = 0.05
+    t_80 = 80
+    E_0 = 0.20
+    E_80 = 0.84
+    ES_critical = 20
+
+    @property
+    def rates(self) -> Tuple[float, float]:
+        """(λ, μ) calibrados: S(80) ≈ S_min partindo de S₀ e E(80) = 0.84"""
+        return -np.log(0.01) / self.t_80, (self.E_80 - self.E_0) / self.t_80
+
+    def death_residual(self, t, lambda_decay, mu_accumulation):
+        """E/S - (E/S)_crítico, vetorizado em t, λ e μ"""
+        S = self.S_0 * np.exp(-lambda_decay * t) + self.S_min
+        E = self.E_0 + mu_accumulation * t
+        return E / S - self.ES_critical
+
+    def death_times(self, lambda_decay, mu_accumulation, lower: float = 50.0, upper: float = 200.0,
+                    axis: int = -1, stride: int = 8) -> np.ndarray:
+        """Tempo até E/S crítico em toda a grade (λ, μ), numa única chamada
+
+        λ e μ são combinados por broadcasting e resolvidos por solve_roots_grid
+        (partida a quente ao longo de `axis`); NaN onde não há raiz no intervalo.
+        """
+        return solve_roots_grid(self.death_residual, (lambda_decay, mu_accumulation),
+                                lower, upper, axis=axis, stride=stride)
+
+    def intervention_gains(self, lambda_effects, mu_effects, upper: float = 200.0) -> np.ndarray:
+        """Anos ganhos para efeitos relativos em λ e μ (ex.: -0.15 = redução de 15%)
+
+        Varre, por exemplo, uma grade de intensidades de intervenção
+        (lambda_effects[:, None], mu_effects[None, :]). Pontos sem raiz até
+        `upper` recebem o limite prático de 50 anos usado em solve().
+        """
+        lambda_decay, mu_accumulation = self.rates
+        t_death, _ = bracketed_roots(self.death_residual, 50, 150, (lambda_decay, mu_accumulation))
+        lambda_new = lambda_decay * (1 + np.asarray(lambda_effects, dtype=float))
+        mu_new = mu_accumulation * (1 + np.asarray(mu_effects, dtype=float))
+        t_new = self.death_times(lambda_new, mu_new, upper=upper)
+        return np.where(np.isnan(t_new), 50.0, t_new - t_death)
+
     def solve(self) -> Dict:
         """
         DERIVAÇÃO DAS CONSTANTES DE ENVELHECIMENTO
@@ -763,6 +1184,7 @@ class AgingSolution:
         dS/dt = -λ × S + R(ℰ)
         dE/dt = +μ × t - D(S)
         """
+        from scipy import integrate
 
         # 1. DADOS EMPÍRICOS
         # Expectativa de vida máxima: ~122 anos (Jeanne Calment)
@@ -776,21 +1198,17 @@ class AgingSolution:
         # 2. CONSTANTE DE DECAIMENTO SINTRÓPICO (λ)
         # S(t) = S_0 × exp(-λ × t) + S_min
         # Para S(80) = 0.05 partindo de S(0) = 0.80:
-        S_0 = 0.80
-        S_min = 0.05
-        t_80 = 80
+        S_0 = self.S_0
+        S_min = self.S_min
 
         # λ = -ln((S(80) - S_min) / (S_0 - S_min)) / t
-        # Como S(80) ≈ S_min, usamos aproximação
-        lambda_decay = -np.log(0.01) / t_80  # ~0.058/ano
+        # Como S(80) ≈ S_min, usamos aproximação (~0.058/ano)
 
         # 3. CONSTANTE DE ACÚMULO ENTRÓPICO (μ)
         # E(t) = E_0 + μ × t
-        # Para E(80) = 0.84 partindo de E(0) = 0.20:
-        E_0 = 0.20
-        E_80 = 0.84
-
-        mu_accumulation = (E_80 - E_0) / t_80  # 0.008/ano
+        # Para E(80) = 0.84 partindo de E(0) = 0.20 (0.008/ano):
+        E_0 = self.E_0
+        lambda_decay, mu_accumulation = self.rates
 
         # 4. RAZÃO E/S AO LONGO DA VIDA
         def ES_ratio(t):
@@ -800,12 +1218,7 @@ class AgingSolution:
 
         # Razão crítica (morte): E/S → ∞ quando S → S_min
         # Tempo crítico quando E/S = 20 (limite prático)
-        ES_critical = 20
-
-        def find_death_time(t):
-            return ES_ratio(t) - ES_critical
-
-        t_death = optimize.brentq(find_death_time, 50, 150)
+        ES_critical = self.ES_critical
 
         # 5. INTERVENÇÕES E SEUS EFEITOS
         interventions = {
@@ -841,28 +1254,26 @@ class AgingSolution:
             },
         }
 
-        # Calcular ganho de anos para cada intervenção
-        for name, params in interventions.items():
-            lambda_new = lambda_decay * (1 + params["efeito_lambda"])
-            mu_new = mu_accumulation * (1 + params["efeito_mu"])
-
-            def find_death_intervention(t):
-                S = S_0 * np.exp(-lambda_new * t) + S_min
-                E = E_0 + mu_new * t
-                return E / S - ES_critical
+        # Tempo natural e tempos com cada intervenção numa única chamada em lote
+        # (sem raiz até 200 anos: limite prático de +50 anos)
+        lambda_effects = np.array([p["efeito_lambda"] for p in interventions.values()])
+        mu_effects = np.array([p["efeito_mu"] for p in interventions.values()])
+        death_times, _ = bracketed_roots(
+            self.death_residual,
+            50, np.r_[150.0, np.full(len(interventions), 200.0)],
+            (lambda_decay * np.r_[1.0, 1 + lambda_effects], mu_accumulation * np.r_[1.0, 1 + mu_effects])
+        )
+        t_death = death_times[0]
 
-            try:
-                t_death_new = optimize.brentq(find_death_intervention, 50, 200)
-                params["ganho_anos"] = t_death_new - t_death
-            except:
-                params["ganho_anos"] = 50  # Limite prático
+        for params, t_death_new in zip(interventions.values(), death_times[1:]):
+            params["ganho_anos"] = float(t_death_new - t_death) if np.isfinite(t_death_new) else 50
 
         # 6. EQUAÇÃO DA LONGEVIDADE MÁXIMA
         # L_max = ∫₀^T [S(t) × g(ℰ(t))] dt
         def vitality(t):
             S = max(S_0 * np.exp(-lambda_decay * t) + S_min, 0.01)
             E_energy = 1.0 - 0.005 * t  # Declínio energético
-            return S * g_S(max(E_energy, 0.1))
+            return S * g_S(max(E_energy, 0.1), self.params)
 
         L_max, _ = integrate.quad(vitality, 0, t_death)
 
@@ -914,24 +1325,24 @@ class AgingSolution:
             ]
         }
 
-aging_solution = AgingSolution()
-result_6 = aging_solution.solve()
-print(f"\n✓ λ (DECAIMENTO): {result_6['constantes_envelhecimento']['lambda_decaimento_ano']:.4f}/ano")
-print(f"✓ μ (ACÚMULO): {result_6['constantes_envelhecimento']['mu_acumulo_ano']:.4f}/ano")
-print(f"✓ EXPECTATIVA (modelo): {result_6['tempo_vida_natural']['expectativa_modelo_anos']:.1f} anos")
-print("✓ INTERVENÇÕES:")
-for name, params in result_6['intervencoes'].items():
-    print(f"   - {name}: +{params['ganho_anos']:.1f} anos")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ λ (DECAIMENTO): {result['constantes_envelhecimento']['lambda_decaimento_ano']:.4f}/ano",
+            f"✓ μ (ACÚMULO): {result['constantes_envelhecimento']['mu_acumulo_ano']:.4f}/ano",
+            f"✓ EXPECTATIVA (modelo): {result['tempo_vida_natural']['expectativa_modelo_anos']:.1f} anos",
+            "✓ INTERVENÇÕES:",
+            *(f"   - {name}: +{params['ganho_anos']:.1f} anos" for name, params in result['intervencoes'].items())
+        ]
 
 
 # =============================================================================
 # PROBLEMA 7: CÂNCER
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 7: CÂNCER")
-print("="*80)
 
-class CancerSolution:
+@register_solution(7, "cancer", "CÂNCER")
+class CancerSolution(ModeloXSolution):
     """
     SOLUÇÃO: Limiar de transformação maligna e estratégia de reversão
     """
@@ -1069,25 +1480,87 @@ class CancerSolution:
             ]
         }
 
-cancer_solution = CancerSolution()
-result_7 = cancer_solution.solve()
-print(f"\n✓ LIMIAR S/E CRÍTICO: {result_7['limiar_transformacao']['SE_critico']:.2f}")
-print(f"✓ MUTAÇÕES NECESSÁRIAS: {result_7['limiar_transformacao']['mutacoes_necessarias']}")
-print(f"✓ P(CÂNCER) em 70 anos: {result_7['probabilidade_cancer']['P_cancer_70_anos']*100:.1f}%")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ LIMIAR S/E CRÍTICO: {result['limiar_transformacao']['SE_critico']:.2f}",
+            f"✓ MUTAÇÕES NECESSÁRIAS: {result['limiar_transformacao']['mutacoes_necessarias']}",
+            f"✓ P(CÂNCER) em 70 anos: {result['probabilidade_cancer']['P_cancer_70_anos']*100:.1f}%"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 8: DOENÇAS NEURODEGENERATIVAS
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 8: DOENÇAS NEURODEGENERATIVAS")
-print("="*80)
 
-class NeurodegenerationSolution:
+@register_solution(8, "neurodegeneracao", "DOENÇAS NEURODEGENERATIVAS")
+class NeurodegenerationSolution(ModeloXSolution):
     """
     SOLUÇÃO: Taxa de propagação e janela terapêutica
     """
 
+    S_healthy = 0.90
+
+    @staticmethod
+    def propagation_model(t, S, k, S_seed=0.3):
+        """dS/dt em região vizinha (vetorizado em S, k e S_seed)"""
+        dS_dt = -k * (1 - S) * (1 - S_seed)
+        return dS_dt
+
+    def propagation_closed_form(self, t, k, S_seed=0.3, S0: Optional[float] = None) -> np.ndarray:
+        """Solução exata de propagation_model: S(t) = 1 - (1 - S₀)·exp(k(1 - S_seed)t)
+
+        O modelo é linear em (1 - S), então não há integração numérica; t, k e
+        S_seed são combinados por broadcasting.
+        """
+        S0 = self.S_healthy if S0 is None else S0
+        return 1 - (1 - S0) * np.exp(np.asarray(k) * (1 - np.asarray(S_seed)) * np.asarray(t))
+
+    def propagation_ensemble(self, k, S_seed, t_eval, S0: Optional[float] = None,
+                             method: str = 'closed_form', rtol: float = 1e-8,
+                             atol: float = 1e-10) -> np.ndarray:
+        """Trajetórias S(t) de vários conjuntos (k, S_seed) de uma vez
+
+        Retorna array de forma broadcast(k, S_seed).shape + (len(t_eval),).
+        method='closed_form' usa a solução exata; method='ode' empilha todos os
+        conjuntos num único vetor de estado e integra com solve_ivp (RK45),
+        com um só controlador de passo adaptativo para o conjunto inteiro.
+        """
+        k, S_seed = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(S_seed, dtype=float))
+        t_eval = np.asarray(t_eval, dtype=float)
+        S0 = self.S_healthy if S0 is None else S0
+
+        if method == 'closed_form':
+            return self.propagation_closed_form(t_eval, k[..., np.newaxis], S_seed[..., np.newaxis], S0)
+        if method != 'ode':
+            raise ValueError(f"Método desconhecido: {method!r} (use 'closed_form' ou 'ode')")
+
+        from scipy.integrate import solve_ivp
+        k_flat, seed_flat = k.ravel(), S_seed.ravel()
+        solution = solve_ivp(lambda t, S: self.propagation_model(t, S, k_flat, seed_flat),
+                             (0.0, float(t_eval.max())), np.full(k_flat.shape, S0),
+                             t_eval=t_eval, rtol=rtol, atol=atol)
+        return solution.y.reshape(k.shape + (len(t_eval),))
+
+    def time_to_threshold(self, S_threshold, k, S_seed=0.3, S0: Optional[float] = None) -> np.ndarray:
+        """Tempo exato até S atingir S_threshold (vetorizado)"""
+        S0 = self.S_healthy if S0 is None else S0
+        return (np.log((1 - np.asarray(S_threshold)) / (1 - S0))
+                / (np.asarray(k) * (1 - np.asarray(S_seed))))
+
+    def fit_spread_rate(self, t, S_observed, S_seed=0.3, S0: Optional[float] = None) -> np.ndarray:
+        """Ajusta k_spread por mínimos quadrados em log(1 - S), uma série por linha
+
+        Como log((1 - S)/(1 - S₀)) = k(1 - S_seed)·t, o ajuste é uma regressão
+        pela origem em forma fechada, vetorizada sobre todas as séries.
+        """
+        S0 = self.S_healthy if S0 is None else S0
+        t = np.asarray(t, dtype=float)
+        y = np.log((1 - np.asarray(S_observed, dtype=float)) / (1 - S0))
+        slope = (y * t).sum(axis=-1) / (t * t).sum()
+        return slope / (1 - np.asarray(S_seed))
+
     def solve(self) -> Dict:
         """
         DERIVAÇÃO DA TAXA DE PROPAGAÇÃO PATOLÓGICA
@@ -1106,15 +1579,11 @@ class NeurodegenerationSolution:
 
         # 2. MODELO DE PROPAGAÇÃO
         # dS/dt = -k_spread × (1 - S) × S_vizinhos_afetados
-
-        def propagation_model(t, S, k, S_seed=0.3):
-            """S em região vizinha, começando de S=0.9"""
-            dS_dt = -k * (1 - S) * (1 - S_seed)
-            return dS_dt
+        # (propagation_model; em lote: propagation_ensemble)
 
         # 3. TEMPO PARA SINTOMAS
         # Sintomas aparecem quando S_região < 0.50
-        S_healthy = 0.90
+        S_healthy = self.S_healthy
         S_symptomatic = 0.50
         S_severe = 0.30
 
@@ -1228,21 +1697,22 @@ class NeurodegenerationSolution:
             ]
         }
 
-neuro_solution = NeurodegenerationSolution()
-result_8 = neuro_solution.solve()
-print(f"\n✓ TAXA PROPAGAÇÃO k: {result_8['taxa_propagacao']['k_spread_ano']}/ano")
-print(f"✓ TEMPO ATÉ SINTOMAS: ~{result_8['tempos_progressao']['sintomas_leves_anos']:.0f} anos")
-print(f"✓ JANELA TERAPÊUTICA IDEAL: S > 0.70")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ TAXA PROPAGAÇÃO k: {result['taxa_propagacao']['k_spread_ano']}/ano",
+            f"✓ TEMPO ATÉ SINTOMAS: ~{result['tempos_progressao']['sintomas_leves_anos']:.0f} anos",
+            f"✓ JANELA TERAPÊUTICA IDEAL: S > 0.70"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 9: RESISTÊNCIA ANTIMICROBIANA
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 9: RESISTÊNCIA ANTIMICROBIANA")
-print("="*80)
 
-class AntimicrobialResistanceSolution:
+@register_solution(9, "resistencia_antimicrobiana", "RESISTÊNCIA ANTIMICROBIANA")
+class AntimicrobialResistanceSolution(ModeloXSolution):
     """
     SOLUÇÃO: Ponto de equilíbrio evolutivo e estratégia de manejo
     """
@@ -1375,25 +1845,63 @@ class AntimicrobialResistanceSolution:
             ]
         }
 
-amr_solution = AntimicrobialResistanceSolution()
-result_9 = amr_solution.solve()
-print(f"\n✓ CUSTO FITNESS RESISTÊNCIA: {result_9['parametros_evolutivos']['custo_fitness_%']:.0f}%")
-print(f"✓ TEMPO DOMINÂNCIA: {result_9['equilibrio']['tempo_dominancia_dias']:.1f} dias")
-print(f"✓ VIDAS SALVAS COM AÇÃO: {result_9['impacto_global']['vidas_salvas_com_acao']:,}/ano")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ CUSTO FITNESS RESISTÊNCIA: {result['parametros_evolutivos']['custo_fitness_%']:.0f}%",
+            f"✓ TEMPO DOMINÂNCIA: {result['equilibrio']['tempo_dominancia_dias']:.1f} dias",
+            f"✓ VIDAS SALVAS COM AÇÃO: {result['impacto_global']['vidas_salvas_com_acao']:,}/ano"
+        ]
 
 
 # =============================================================================
 # PROBLEMA 10: FUSÃO NUCLEAR CONTROLADA
 # =============================================================================
-print("\n" + "="*80)
-print("PROBLEMA 10: FUSÃO NUCLEAR CONTROLADA")
-print("="*80)
 
-class NuclearFusionSolution:
+@register_solution(10, "fusao_nuclear", "FUSÃO NUCLEAR CONTROLADA")
+class NuclearFusionSolution(ModeloXSolution):
     """
     SOLUÇÃO: Parâmetros ótimos para confinamento e ignição
     """
 
+    # Unidades: n em m⁻³, T em keV, τ em s
+    lawson_threshold = 3e21         # keV·s/m³
+    E_fusion_MeV = 17.59            # D + T → ⁴He + n
+    E_alpha_MeV = 3.52              # Fração depositada no plasma
+
+    # Ajuste de Bosch-Hale (1992) para ⟨σv⟩ D-T, válido em 0.2-100 keV
+    _BG = 34.3827                   # keV^½
+    _MRC2 = 1124656.0               # keV
+    _C = (1.17302e-9, 1.51361e-2, 7.51886e-2, 4.60643e-3, 1.35e-2, -1.0675e-4, 1.366e-5)
+
+    @staticmethod
+    def Q_factor(n, T, tau, lawson_threshold: float = 3e21):
+        """Q proporcional ao produto triplo (Q = 10 no limiar de Lawson)"""
+        return n * T * tau / lawson_threshold * 10
+
+    @classmethod
+    def dt_reactivity(cls, T):
+        """⟨σv⟩ D-T em m³/s para T em keV (ajuste de Bosch-Hale)"""
+        T = np.asarray(T, dtype=float)
+        C1, C2, C3, C4, C5, C6, C7 = cls._C
+        theta = T / (1 - T * (C2 + T * (C4 + T * C6)) / (1 + T * (C3 + T * (C5 + T * C7))))
+        xi = (cls._BG**2 / (4 * theta))**(1 / 3)
+        return C1 * theta * np.sqrt(xi / (cls._MRC2 * T**3)) * np.exp(-3 * xi) * 1e-6
+
+    @classmethod
+    def Q_energy_balance(cls, n, T, tau):
+        """Q = P_fusão / (P_perdas - P_α) em regime estacionário; ∞ na ignição
+
+        P_fusão = n²⟨σv⟩E_fus/4 e P_perdas = 3nT/τ. Quando o aquecimento α
+        compensa as perdas o plasma está ignizado e Q diverge.
+        """
+        T_joule = T * 1e3 * e
+        P_fusion = n**2 / 4 * cls.dt_reactivity(T) * cls.E_fusion_MeV * 1e6 * e
+        P_heating = 3 * n * T_joule / tau - P_fusion * (cls.E_alpha_MeV / cls.E_fusion_MeV)
+        with np.errstate(divide='ignore'):
+            return np.where(P_heating > 0, P_fusion / P_heating, np.inf)
+
     def solve(self) -> Dict:
         """
         DERIVAÇÃO DOS PARÂMETROS ÓTIMOS DE CONFINAMENTO
@@ -1447,10 +1955,7 @@ class NuclearFusionSolution:
         # Q = P_fusion / P_input
         # Para comercialização: Q > 30
 
-        def Q_factor(n, T, tau):
-            return n * T * tau / lawson_threshold * 10
-
-        Q_ITER_calc = Q_factor(n_ITER, T_ITER, tau_ITER)
+        Q_ITER_calc = self.Q_factor(n_ITER, T_ITER, tau_ITER, lawson_threshold)
 
         # Para Q = 30 (comercial):
         # Precisamos de n × T × τ = 9e21
@@ -1522,66 +2027,166 @@ class NuclearFusionSolution:
             ]
         }
 
-fusion_solution = NuclearFusionSolution()
-result_10 = fusion_solution.solve()
-print(f"\n✓ TEMPERATURA ÓTIMA: {result_10['parametros_otimos']['T_otimo_keV']} keV")
-print(f"✓ CAMPO MAGNÉTICO ÓTIMO: {result_10['parametros_otimos']['B_otimo_T']} T")
-print(f"✓ Q ITER ESPERADO: {result_10['parametros_ITER']['Q_esperado']:.0f}")
-print(f"✓ FUSÃO COMERCIAL: ~2055")
+    @staticmethod
+    def summary(result: Dict) -> List[str]:
+        """Linhas de resumo exibidas pela CLI"""
+        return [
+            f"✓ TEMPERATURA ÓTIMA: {result['parametros_otimos']['T_otimo_keV']} keV",
+            f"✓ CAMPO MAGNÉTICO ÓTIMO: {result['parametros_otimos']['B_otimo_T']} T",
+            f"✓ Q ITER ESPERADO: {result['parametros_ITER']['Q_esperado']:.0f}",
+            f"✓ FUSÃO COMERCIAL: ~2055"
+        ]
 
 
-# =============================================================================
-# COMPILAÇÃO FINAL
-# =============================================================================
-print("\n" + "="*80)
-print("COMPILAÇÃO FINAL DE TODAS AS SOLUÇÕES")
-print("="*80)
-
-# Coletar todos os resultados
-all_solutions = {
-    "metadata": {
-        "framework": "Modelo X Framework v2.0",
-        "tipo": "SOLUÇÕES CONCRETAS (não apenas análise teórica)",
-        "data": "2025-11-23",
-        "status": "RESOLVIDO"
-    },
-    "constantes_modelo_x": {
-        "alpha": MX.alpha,
-        "beta": MX.beta,
-        "gamma": MX.gamma,
-        "phi_aureo": MX.phi,
-        "C_universal": MX.C_universal,
-    },
-    "solucoes": {
-        "1_materia_escura_energia_escura": result_1,
-        "2_gravidade_quantica": result_2,
-        "3_origem_da_vida": result_3,
-        "4_consciencia": result_4,
-        "5_mudancas_climaticas": result_5,
-        "6_envelhecimento": result_6,
-        "7_cancer": result_7,
-        "8_neurodegeneracao": result_8,
-        "9_resistencia_antimicrobiana": result_9,
-        "10_fusao_nuclear": result_10,
-    }
-}
+class FusionGridExplorer:
+    """Varredura do fator Q em malhas 3-D (n, T, τ) processadas em blocos
+
+    Os eixos são 1-D e cada bloco cobre um intervalo de densidades, avaliado
+    por broadcasting (n[:, None, None], T[None, :, None], τ[None, None, :]);
+    a memória fica limitada a ~chunk_points valores por vez, e a malha
+    completa só existe em disco quando `output` é dado a explore().
+
+    Com B (Tesla) os pontos acima do limite β de pressão, n·k_B·T >
+    β_max·B²/2μ₀, são marcados como inviáveis (NaN).
+    """
+
+    def __init__(self, n, T, tau, q_func: Optional[Callable] = None,
+                 chunk_points: int = 2**22, B: Optional[float] = None, beta_max: float = 0.05):
+        self.n, self.T, self.tau = (np.asarray(axis, dtype=float) for axis in (n, T, tau))
+        if any(axis.ndim != 1 or axis.size == 0 for axis in (self.n, self.T, self.tau)):
+            raise ValueError("n, T e tau devem ser eixos 1-D não vazios")
+        if np.any(np.diff(self.tau) <= 0):
+            raise ValueError("tau deve ser estritamente crescente")
+
+        self.q_func = q_func or NuclearFusionSolution.Q_factor
+        self.rows = max(1, chunk_points // (self.T.size * self.tau.size))
+
+        self.n_limit = None
+        if B is not None:
+            mu_0 = 4 * np.pi * 1e-7
+            self.n_limit = beta_max * B**2 / (2 * mu_0) / (self.T * 1e3 * e)
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.n.size, self.T.size, self.tau.size
+
+    def chunks(self):
+        """Gera (fatia de n, bloco de Q com forma (linhas, nT, nτ))"""
+        T = self.T[None, :, None]
+        tau = self.tau[None, None, :]
+        for start in range(0, self.n.size, self.rows):
+            rows = slice(start, min(start + self.rows, self.n.size))
+            n = self.n[rows, None, None]
+            Q = np.broadcast_to(self.q_func(n, T, tau), (n.shape[0],) + self.shape[1:]).astype(float)
+            if self.n_limit is not None:
+                Q[n[..., 0] > self.n_limit[None, :]] = np.nan
+            yield rows, Q
+
+    def contour_tau(self, Q: np.ndarray, level: float) -> np.ndarray:
+        """Menor τ com Q ≥ level para cada (n, T) do bloco (NaN se não alcança)
+
+        Interpola linearmente 1/Q em 1/τ entre os pontos da malha que cercam
+        o cruzamento, o que é exato para os dois modelos de Q fora da ignição.
+        """
+        reached = Q >= level
+        found = reached.any(axis=-1)
+        upper = np.argmax(reached, axis=-1)[..., None]
+        lower = np.maximum(upper - 1, 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            y = 1 / Q
+            y_lo = np.take_along_axis(y, lower, -1)[..., 0]
+            y_hi = np.take_along_axis(y, upper, -1)[..., 0]
+            x_lo, x_hi = 1 / self.tau[lower[..., 0]], 1 / self.tau[upper[..., 0]]
+            frac = np.clip((y_lo - 1 / level) / (y_lo - y_hi), 0, 1)
+            tau_cross = 1 / (x_lo + np.where(upper[..., 0] > 0, frac, 1.0) * (x_hi - x_lo))
+        return np.where(found, tau_cross, np.nan)
+
+    def explore(self, levels=(1.0, 10.0), output: Optional[str] = None) -> Dict:
+        """Percorre a malha bloco a bloco e extrai contornos e cristas de operação
+
+        Retorna:
+          tau_contorno[level] (nn, nT): τ mínimo para Q ≥ level
+          tau_ignicao (nn, nT): menor τ da malha com ignição (Q = ∞)
+          T_otimo, Q_max (nn, nτ): crista de Q ao longo de T
+          crista: para cada τ, o ponto (n, T) viável de maior Q
+          fracao_acima[level]: fração de pontos viáveis com Q ≥ level
+        Com `output`, Q (float32) é gravado em um .npy mapeado em memória.
+        """
+        nn, nT, ntau = self.shape
+        contours = {level: np.full((nn, nT), np.nan) for level in levels}
+        above = dict.fromkeys(levels, 0)
+        tau_ignition = np.full((nn, nT), np.nan)
+        T_opt = np.full((nn, ntau), np.nan)
+        Q_max = np.full((nn, ntau), np.nan)
+        ridge_Q = np.full(ntau, -np.inf)
+        ridge_n = np.full(ntau, np.nan)
+        ridge_T = np.full(ntau, np.nan)
+        feasible = 0
+
+        stream = None
+        if output:
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+            stream = np.lib.format.open_memmap(output, mode='w+', dtype=np.float32, shape=self.shape)
+
+        for rows, Q in self.chunks():
+            if stream is not None:
+                stream[rows] = Q
+
+            valid = ~np.isnan(Q)
+            feasible += int(valid.sum())
+            for level in levels:
+                contours[level][rows] = self.contour_tau(Q, level)
+                above[level] += int((Q >= level).sum())
+
+            ignited = np.isposinf(Q)
+            first = np.argmax(ignited, axis=-1)
+            tau_ignition[rows] = np.where(ignited.any(axis=-1), self.tau[first], np.nan)
+
+            ranked = np.where(valid, Q, -np.inf)
+            best_T = np.argmax(ranked, axis=1)
+            best_Q = np.take_along_axis(ranked, best_T[:, None, :], 1)[:, 0, :]
+            has = valid.any(axis=1)
+            T_opt[rows] = np.where(has, self.T[best_T], np.nan)
+            Q_max[rows] = np.where(has, best_Q, np.nan)
+
+            best_n = np.argmax(best_Q, axis=0)
+            chunk_Q = best_Q[best_n, np.arange(ntau)]
+            improved = chunk_Q > ridge_Q
+            ridge_Q[improved] = chunk_Q[improved]
+            ridge_n[improved] = self.n[rows][best_n[improved]]
+            ridge_T[improved] = self.T[best_T[best_n, np.arange(ntau)][improved]]
+
+        if stream is not None:
+            stream.flush()
+            del stream
 
-# Salvar em JSON
-output_file = "/home/user/o/data/SOLUCOES_CONCRETAS.json"
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(all_solutions, f, indent=2, ensure_ascii=False, default=str)
+        return {
+            "pontos": nn * nT * ntau,
+            "pontos_viaveis": feasible,
+            "tau_contorno": contours,
+            "tau_ignicao": tau_ignition,
+            "T_otimo": T_opt,
+            "Q_max": Q_max,
+            "crista": {
+                "tau": self.tau.copy(),
+                "n": ridge_n,
+                "T": ridge_T,
+                "Q": np.where(np.isneginf(ridge_Q), np.nan, ridge_Q),
+            },
+            "fracao_acima": {level: count / max(feasible, 1) for level, count in above.items()},
+            "arquivo": output,
+        }
 
-print(f"\n✓ Soluções salvas em: {output_file}")
 
 # =============================================================================
-# RESUMO FINAL
+# COMPILAÇÃO FINAL
 # =============================================================================
-print("\n" + "="*80)
-print("RESUMO: CONSTANTES E VALORES CHAVE DERIVADOS")
-print("="*80)
 
-print("""
-┌─────────────────────────────────────────────────────────────────────────────┐
+DEFAULT_OUTPUT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                               '..', 'data', 'SOLUCOES_CONCRETAS.json'))
+
+SUMMARY_TABLE = """┌─────────────────────────────────────────────────────────────────────────────┐
 │ PROBLEMA                    │ CONSTANTE/VALOR CHAVE                         │
 ├─────────────────────────────────────────────────────────────────────────────┤
 │ 1. Matéria Escura          │ m_DM ≈ 10⁵ eV/c² (WIMP leve/axion)           │
@@ -1614,7 +2219,100 @@ print("""
 │ 10. Fusão Nuclear          │ T_ótimo = 15 keV (174 milhões K)              │
 │                            │ B_ótimo = 12 T, Q_comercial > 50              │
 └─────────────────────────────────────────────────────────────────────────────┘
-""")
+"""
+
+
+def compile_solutions(results: Dict[str, Dict], params: ModeloXParams = MX) -> Dict:
+    """Monta o documento de SOLUCOES_CONCRETAS.json a partir de solve_all()"""
+    return {
+        "metadata": {
+            "framework": "Modelo X Framework v2.0",
+            "tipo": "SOLUÇÕES CONCRETAS (não apenas análise teórica)",
+            "data": "2025-11-23",
+            "status": "RESOLVIDO"
+        },
+        "constantes_modelo_x": {
+            "alpha": params.alpha,
+            "beta": params.beta,
+            "gamma": params.gamma,
+            "phi_aureo": params.phi,
+            "C_universal": params.C_universal,
+        },
+        "solucoes": results
+    }
+
+
+def save_solutions(all_solutions: Dict, filename: str = DEFAULT_OUTPUT) -> str:
+    """Salva as soluções compiladas em JSON"""
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(all_solutions, f, indent=2, ensure_ascii=False, default=str)
+    return filename
+
+
+def print_solution(entry: SolutionEntry, result: Dict) -> None:
+    """Exibe o cabeçalho e o resumo de uma solução"""
+    print("\n" + "="*80)
+    print(f"PROBLEMA {entry.number}: {entry.title}")
+    print("="*80)
+    print()
+    for line in entry.solution_class.summary(result):
+        print(line)
+
+
+# =============================================================================
+# PONTO DE ENTRADA
+# =============================================================================
 
-print("\n✓ TODAS AS SOLUÇÕES DERIVADAS COM VALORES CONCRETOS!")
-print("✓ Arquivo de saída: /home/user/o/data/SOLUCOES_CONCRETAS.json")
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Soluções concretas dos 10 problemas científicos")
+    parser.add_argument('problems', nargs='*',
+                        help="Problemas a resolver, por número ou nome (padrão: todos)")
+    parser.add_argument('--list', action='store_true', help="Lista os problemas registrados")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Arquivo JSON de saída")
+    parser.add_argument('--no-save', action='store_true', help="Não grava o JSON")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Diretório do cache de resultados")
+    parser.add_argument('--no-cache', action='store_true', help="Recalcula sem ler nem gravar o cache")
+    parser.add_argument('--clear-cache', action='store_true', help="Apaga o cache antes de resolver")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for entry in SOLUTIONS.values():
+            print(f"{entry.number:>2}  {entry.name:<32} {entry.title}")
+        return 0
+
+    try:
+        entries = [get_entry(p) for p in args.problems] or list(SOLUTIONS.values())
+    except KeyError as exc:
+        parser.error(exc.args[0])
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    if cache is not None and args.clear_cache:
+        print(f"✓ {cache.clear()} resultado(s) removidos do cache")
+
+    warnings.filterwarnings('ignore')
+    results = solve_all([entry.name for entry in entries], cache=cache)
+    for entry in sorted(entries, key=lambda entry: entry.number):
+        print_solution(entry, results[entry.key])
+
+    if cache is not None:
+        print(f"\n✓ Cache: {cache.hits} carregada(s), {cache.misses} calculada(s) ({cache.directory})")
+
+    if not args.no_save:
+        print("\n" + "="*80)
+        print("COMPILAÇÃO FINAL DAS SOLUÇÕES")
+        print("="*80)
+        output_file = save_solutions(compile_solutions(results), args.output)
+        print(f"\n✓ Soluções salvas em: {output_file}")
+
+    if len(results) == len(SOLUTIONS):
+        print("\n" + "="*80)
+        print("RESUMO: CONSTANTES E VALORES CHAVE DERIVADOS")
+        print("="*80)
+        print(SUMMARY_TABLE)
+        print("\n✓ TODAS AS SOLUÇÕES DERIVADAS COM VALORES CONCRETOS!")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,10 +13,14 @@ Data: Novembro 2025
 
 import math
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence
 from datetime import datetime
 
+import numpy as np
+
 # Importar módulos do Modelo X
 import sys
 sys.path.insert(0, '/home/user/o')
@@ -46,6 +50,23 @@ E0 = 1.0         # Energia de referência
 C_UNIVERSAL = 1.0  # Constante de conservação
 
 
+@dataclass
+class ModelConstants:
+    """Constantes α, β, γ, ℰ₀ de uma execução (padrão: valores universais acima)
+
+    No backend vetorizado os campos podem ser arrays de forma (n, 1): as colunas
+    que dependem das constantes (Φ, Φ_c) saem com forma (n, passos), avaliando
+    n conjuntos de constantes de uma só vez.
+    """
+    alpha: float = ALPHA
+    beta: float = BETA
+    gamma: float = GAMMA
+    E0: float = E0
+
+    def as_dict(self) -> Dict:
+        return {'alpha': self.alpha, 'beta': self.beta, 'gamma': self.gamma, 'E0': self.E0}
+
+
 # =============================================================================
 # CLASSES DE DADOS
 # =============================================================================
@@ -67,9 +88,11 @@ class SystemState:
     @property
     def phi(self) -> float:
         """Calcula Φ(E, S, ℰ) = E × f(ℰ) + S × g(ℰ)"""
-        f_e = 1.0 + ALPHA * math.log(self.energy / E0 + 0.001)
-        g_e = 1.0 + BETA * (self.energy / E0) ** GAMMA
-        return self.entropy * f_e + self.syntropy * g_e
+        return self.phi_with()
+
+    def phi_with(self, constants: Optional[ModelConstants] = None) -> float:
+        """Φ com constantes explícitas"""
+        return compute_phi(self.entropy, self.syntropy, self.energy, constants)
 
     @property
     def temporal_dilation(self) -> float:
@@ -98,17 +121,160 @@ class SimulationResult:
 # FUNÇÕES DE MODULAÇÃO
 # =============================================================================
 
-def f_modulation(energy: float) -> float:
+def f_modulation(energy: float, constants: Optional[ModelConstants] = None) -> float:
     """Função de modulação entrópica: f(ℰ) = 1 + α × ln(ℰ/ℰ₀)"""
-    return 1.0 + ALPHA * math.log(energy / E0 + 0.001)
+    c = constants or ModelConstants()
+    return 1.0 + c.alpha * math.log(energy / c.E0 + 0.001)
 
-def g_modulation(energy: float) -> float:
+def g_modulation(energy: float, constants: Optional[ModelConstants] = None) -> float:
     """Função de modulação sintrópica: g(ℰ) = 1 + β × (ℰ/ℰ₀)^γ"""
-    return 1.0 + BETA * (energy / E0) ** GAMMA
+    c = constants or ModelConstants()
+    return 1.0 + c.beta * (energy / c.E0) ** c.gamma
 
-def compute_phi(entropy: float, syntropy: float, energy: float) -> float:
+def compute_phi(entropy: float, syntropy: float, energy: float,
+                constants: Optional[ModelConstants] = None) -> float:
     """Calcula o valor de Φ"""
-    return entropy * f_modulation(energy) + syntropy * g_modulation(energy)
+    return entropy * f_modulation(energy, constants) + syntropy * g_modulation(energy, constants)
+
+
+# =============================================================================
+# BACKEND VETORIZADO (NumPy)
+# =============================================================================
+
+def f_modulation_array(energy: np.ndarray, constants: Optional[ModelConstants] = None) -> np.ndarray:
+    """Versão vetorizada de f_modulation"""
+    c = constants or ModelConstants()
+    return 1.0 + c.alpha * np.log(energy / c.E0 + 0.001)
+
+def g_modulation_array(energy: np.ndarray, constants: Optional[ModelConstants] = None) -> np.ndarray:
+    """Versão vetorizada de g_modulation"""
+    c = constants or ModelConstants()
+    return 1.0 + c.beta * (energy / c.E0) ** c.gamma
+
+def compute_phi_array(entropy: np.ndarray, syntropy: np.ndarray, energy: np.ndarray,
+                      constants: Optional[ModelConstants] = None) -> np.ndarray:
+    """Versão vetorizada de compute_phi"""
+    return (entropy * f_modulation_array(energy, constants)
+            + syntropy * g_modulation_array(energy, constants))
+
+def clamp_state_arrays(entropy, syntropy, energy) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Aplica os limites de SystemState.__post_init__ a arrays"""
+    return (np.clip(entropy, 0.0, 1.0),
+            np.clip(syntropy, 0.0, 1.0),
+            np.maximum(0.1, energy))
+
+def clipped_cumsum(x0: float, increments: np.ndarray,
+                   lower: float = -np.inf, upper: float = np.inf) -> np.ndarray:
+    """Varredura x_i = clip(x_{i-1} + inc_i, lower, upper) sem loop Python
+
+    Usa a forma fechada x_i = S_i + min(x0, upper - max_{j≤i} S_j) (e a simétrica
+    para o limite inferior), exata quando os incrementos têm sinal constante.
+    Com incrementos de sinais mistos recorre ao laço sequencial.
+    """
+    increments = np.asarray(increments, dtype=float)
+    if len(increments) == 0:
+        return increments.copy()
+
+    if np.all(increments >= 0):
+        # Após o primeiro passo o limite inferior não volta a atuar
+        first = min(upper, max(lower, x0 + increments[0]))
+        partial = np.cumsum(increments[1:])
+        rest = partial + np.minimum(first, upper - np.maximum.accumulate(np.r_[0.0, partial])[1:])
+        return np.r_[first, rest]
+
+    if np.all(increments <= 0):
+        first = max(lower, min(upper, x0 + increments[0]))
+        partial = np.cumsum(increments[1:])
+        rest = partial + np.maximum(first, lower - np.minimum.accumulate(np.r_[0.0, partial])[1:])
+        return np.r_[first, rest]
+
+    values = np.empty(len(increments))
+    x = x0
+    for i, inc in enumerate(increments.tolist()):
+        x = min(upper, max(lower, x + inc))
+        values[i] = x
+    return values
+
+
+def capped_geometric(x0: float, ratio: float, upper: float, steps: int) -> np.ndarray:
+    """Varredura x_i = min(upper, x_{i-1} × ratio), ratio > 1, sem overflow"""
+    exponent = np.arange(1, steps + 1)
+    if x0 > 0 and upper > x0:
+        # Além deste expoente o teto já foi atingido
+        exponent = np.minimum(exponent, int(math.ceil(math.log(upper / x0) / math.log(ratio))) + 1)
+    return np.minimum(upper, x0 * ratio ** exponent)
+
+
+class ColumnarTrajectory(Sequence):
+    """Trajetória em colunas (dict de arrays NumPy) com visão de lista de dicts
+
+    `trajectory['phi']` devolve a coluna inteira; `trajectory[i]` devolve o
+    registro do passo i no mesmo formato (tipos Python) da trajetória original
+    de SimulationResult. Colunas aninhadas (dict de arrays) viram sub-dicts.
+    """
+
+    def __init__(self, columns: Dict):
+        self.columns = columns
+        self._length = len(next(iter(self._flat_columns())))
+
+    def _flat_columns(self):
+        for value in self.columns.values():
+            if isinstance(value, dict):
+                yield from value.values()
+            else:
+                yield value
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _row(self, index: int) -> Dict:
+        return {
+            key: ({k: v[index].item() for k, v in value.items()} if isinstance(value, dict)
+                  else value[index].item())
+            for key, value in self.columns.items()
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self.columns[index]
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("índice fora da trajetória")
+        return self._row(index)
+
+    def column(self, name: str) -> np.ndarray:
+        """Coluna `name` como array"""
+        return self.columns[name]
+
+    def to_records(self) -> List[Dict]:
+        """Converte para a lista de dicts usada pelo backend Python"""
+        return [self._row(i) for i in range(self._length)]
+
+
+def trajectory_column(trajectory, name: str):
+    """Coluna de uma trajetória, seja lista de dicts ou ColumnarTrajectory"""
+    if isinstance(trajectory, ColumnarTrajectory):
+        return trajectory.column(name)
+    return [t[name] for t in trajectory]
+
+def _max(values):
+    return values.max().item() if isinstance(values, np.ndarray) else max(values)
+
+def _min(values):
+    return values.min().item() if isinstance(values, np.ndarray) else min(values)
+
+def _mean(values):
+    return values.mean().item() if isinstance(values, np.ndarray) else sum(values) / len(values)
+
+def _first_step(trajectory, name: str, predicate):
+    """Primeiro passo em que predicate(coluna) é verdadeiro (ou None)"""
+    if isinstance(trajectory, ColumnarTrajectory):
+        hits = np.flatnonzero(predicate(trajectory.column(name)))
+        return trajectory.column('step')[hits[0]].item() if len(hits) else None
+    return next((t['step'] for t in trajectory if predicate(t[name])), None)
 
 
 # =============================================================================
@@ -118,15 +284,44 @@ def compute_phi(entropy: float, syntropy: float, energy: float) -> float:
 class ScientificProblemSimulator:
     """Classe base para simulação de problemas científicos"""
 
-    def __init__(self, name: str, params: Dict):
+    def __init__(self, name: str, params: Dict, constants: Optional[ModelConstants] = None):
         self.name = name
         self.params = params
+        self.constants = constants or ModelConstants()
         self.trajectory = []
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         """Método abstrato - implementar em subclasses"""
         raise NotImplementedError
 
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        """Backend vetorizado: trajetória inteira como colunas NumPy"""
+        raise NotImplementedError
+
+    def simulate_vectorized(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
+        """Mesmo resultado de simulate(), calculado pelo backend vetorizado
+
+        `result.trajectory` é uma ColumnarTrajectory: indexável como a lista de
+        dicts original e com acesso direto às colunas.
+        """
+        return self._build_result(self.trajectory_arrays(steps, dt), steps)
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
+        """Monta SimulationResult (métricas, predições) a partir da trajetória"""
+        raise NotImplementedError
+
+    def sensitivity_outputs(self, trajectory: ColumnarTrajectory) -> Dict[str, np.ndarray]:
+        """Saídas escalares que dependem de α, β, γ, ℰ₀ (análise de sensibilidade)
+
+        Recebe a trajetória de trajectory_arrays() calculada com constantes em
+        forma (n, 1) e devolve um array de n valores por saída. Apenas Φ depende
+        das constantes na classe base; simuladores sem Φ não têm saídas.
+        """
+        if 'phi' not in trajectory.columns:
+            return {}
+        phi = np.atleast_2d(trajectory.column('phi'))
+        return {'phi_final': phi[:, -1], 'phi_mean': phi.mean(axis=1)}
+
 
 class DarkMatterEnergySimulator(ScientificProblemSimulator):
     """
@@ -135,7 +330,7 @@ class DarkMatterEnergySimulator(ScientificProblemSimulator):
     Hipótese: Matéria escura = S(-), Energia escura = E(-)
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'cosmic_entropy': 0.95,
             'cosmic_syntropy': 0.05,
@@ -144,7 +339,7 @@ class DarkMatterEnergySimulator(ScientificProblemSimulator):
             'dark_energy_ratio': 0.683,
             'baryonic_ratio': 0.049
         }
-        super().__init__("Matéria Escura e Energia Escura", params)
+        super().__init__("Matéria Escura e Energia Escura", params, constants)
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         state = SystemState(
@@ -169,10 +364,31 @@ class DarkMatterEnergySimulator(ScientificProblemSimulator):
                 'entropy': state.entropy,
                 'syntropy': state.syntropy,
                 'energy': state.energy,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'dilation': state.temporal_dilation
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+
+        # Resfriamento geométrico e entropia aditiva com teto 1.0 (formas fechadas)
+        energy = self.params['cmb_energy'] * (1 - 0.001 * dt) ** (i + 1)
+        entropy = np.minimum(1.0, self.params['cosmic_entropy'] + 0.0001 * dt * (i + 1))
+        syntropy = 1.0 - entropy
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'dilation': energy * (1.0 + syntropy - entropy)
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
         # Calcular componentes escuras
         phi_total = trajectory[-1]['phi']
         s_negative = self.params['dark_matter_ratio'] * phi_total
@@ -212,14 +428,14 @@ class QuantumGravitySimulator(ScientificProblemSimulator):
     Hipótese: Gravidade emerge de gradientes de sintropia
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'quantum_entropy': 0.5,
             'quantum_syntropy': 0.5,
             'planck_energy': 1.22e19,  # GeV
             'planck_length': 1.616e-35,  # metros
         }
-        super().__init__("Teoria Quântica da Gravidade", params)
+        super().__init__("Teoria Quântica da Gravidade", params, constants)
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
@@ -246,14 +462,42 @@ class QuantumGravitySimulator(ScientificProblemSimulator):
                 'entropy': state.entropy,
                 'syntropy': state.syntropy,
                 'energy': state.energy,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'curvature': curvature,
                 'dilation': state.temporal_dilation
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+        phase = i * dt * 2 * math.pi
+
+        entropy, syntropy, energy = clamp_state_arrays(
+            0.5 + 0.3 * np.sin(phase),
+            0.5 - 0.3 * np.sin(phase),
+            1.0 + 0.1 * np.cos(phase * 2)
+        )
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'curvature': 0.3 * np.cos(phase) * (1.0 + 0.1 * np.cos(phase * 2)),
+            'dilation': energy * (1.0 + syntropy - entropy)
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
         # Métricas de unificação
-        mean_phi = sum(t['phi'] for t in trajectory) / len(trajectory)
-        curvature_variance = sum((t['curvature'] - 0)**2 for t in trajectory) / len(trajectory)
+        mean_phi = _mean(trajectory_column(trajectory, 'phi'))
+        curvature = trajectory_column(trajectory, 'curvature')
+        if isinstance(curvature, np.ndarray):
+            curvature_variance = np.mean(curvature ** 2).item()
+        else:
+            curvature_variance = sum((c - 0)**2 for c in curvature) / len(curvature)
 
         return SimulationResult(
             problem_name=self.name,
@@ -287,7 +531,7 @@ class OriginOfLifeSimulator(ScientificProblemSimulator):
     Hipótese: Vida surge em pontos críticos de transição sintrópica
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'initial_entropy': 0.95,
             'initial_syntropy': 0.05,
@@ -295,7 +539,7 @@ class OriginOfLifeSimulator(ScientificProblemSimulator):
             'temperature': 350,  # K
             'uv_flux': 10.0  # W/m²
         }
-        super().__init__("Origem da Vida", params)
+        super().__init__("Origem da Vida", params, constants)
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
@@ -304,9 +548,6 @@ class OriginOfLifeSimulator(ScientificProblemSimulator):
         syntropy = self.params['initial_syntropy']
         energy = 1.0
 
-        life_emerged = False
-        emergence_step = None
-
         for i in range(steps):
             # Entrada de energia (UV, vulcões, relâmpagos)
             energy_input = 0.05 * (1 + 0.3 * math.sin(i * dt * math.pi))
@@ -318,10 +559,6 @@ class OriginOfLifeSimulator(ScientificProblemSimulator):
                 syntropy = min(0.8, syntropy + syntropy_growth)
                 entropy = max(0.2, 1.0 - syntropy)
 
-                if syntropy > 0.5 and not life_emerged:
-                    life_emerged = True
-                    emergence_step = i
-
             state = SystemState(entropy, syntropy, energy, time=i*dt)
 
             trajectory.append({
@@ -330,11 +567,46 @@ class OriginOfLifeSimulator(ScientificProblemSimulator):
                 'entropy': state.entropy,
                 'syntropy': state.syntropy,
                 'energy': state.energy,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'life_probability': 1 / (1 + math.exp(-10 * (syntropy - 0.5))),
                 'dilation': state.temporal_dilation
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+
+        # Energia acumulada com teto 2.0 (entrada sempre positiva)
+        energy_input = 0.05 * (1 + 0.3 * np.sin(i * dt * math.pi))
+        energy = clipped_cumsum(1.0, energy_input * dt, upper=2.0)
+
+        # Sintropia só cresce acima do limiar crítico ℰ > 1.2
+        critical = energy > 1.2
+        growth = np.where(critical, 0.02 * (energy - 1.2) * dt, 0.0)
+        syntropy = clipped_cumsum(self.params['initial_syntropy'], growth, upper=0.8)
+        entropy = np.where(critical.cumsum() > 0, np.maximum(0.2, 1.0 - syntropy),
+                           self.params['initial_entropy'])
+
+        life_probability = 1 / (1 + np.exp(-10 * (syntropy - 0.5)))
+        entropy, syntropy, energy = clamp_state_arrays(entropy, syntropy, energy)
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'life_probability': life_probability,
+            'dilation': energy * (1.0 + syntropy - entropy)
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
+        # Vida emerge no primeiro passo com S > 0.5
+        emergence_step = _first_step(trajectory, 'syntropy', lambda s: s > 0.5)
+        life_emerged = emergence_step is not None
+
         return SimulationResult(
             problem_name=self.name,
             initial_state=asdict(SystemState(0.95, 0.05, 1.0)),
@@ -369,7 +641,7 @@ class ConsciousnessSimulator(ScientificProblemSimulator):
     Hipótese: Consciência = estado de máxima sintropia local
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'neural_entropy': 0.15,
             'neural_syntropy': 0.85,
@@ -377,19 +649,22 @@ class ConsciousnessSimulator(ScientificProblemSimulator):
             'neurons': 86e9,
             'synapses': 150e12
         }
-        super().__init__("Consciência", params)
+        super().__init__("Consciência", params, constants)
+
+    # Diferentes estados de consciência: (nome, E, S, ℰ)
+    STATES_SEQUENCE = [
+        ('sono_profundo', 0.60, 0.40, 15.0),
+        ('rem', 0.45, 0.55, 18.0),
+        ('acordado', 0.20, 0.80, 20.0),
+        ('foco', 0.10, 0.90, 22.0),
+        ('meditacao', 0.05, 0.95, 18.0)
+    ]
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
 
         # Simular diferentes estados de consciência
-        states_sequence = [
-            ('sono_profundo', 0.60, 0.40, 15.0),
-            ('rem', 0.45, 0.55, 18.0),
-            ('acordado', 0.20, 0.80, 20.0),
-            ('foco', 0.10, 0.90, 22.0),
-            ('meditacao', 0.05, 0.95, 18.0)
-        ]
+        states_sequence = self.STATES_SEQUENCE
 
         steps_per_state = steps // len(states_sequence)
 
@@ -404,7 +679,7 @@ class ConsciousnessSimulator(ScientificProblemSimulator):
                 state = SystemState(entropy, syntropy, energy, time=step*dt)
 
                 # Nível de consciência Φ_c = S² × g(ℰ)
-                phi_c = syntropy ** 2 * g_modulation(energy / 20.0)
+                phi_c = syntropy ** 2 * g_modulation(energy / 20.0, self.constants)
 
                 trajectory.append({
                     'step': step,
@@ -413,13 +688,55 @@ class ConsciousnessSimulator(ScientificProblemSimulator):
                     'entropy': state.entropy,
                     'syntropy': state.syntropy,
                     'energy': state.energy,
-                    'phi': state.phi,
+                    'phi': state.phi_with(self.constants),
                     'consciousness_level': phi_c,
                     'temporal_dilation': state.temporal_dilation
                 })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        steps_per_state = steps // len(self.STATES_SEQUENCE)
+        names, e, s, energy = (np.repeat(column, steps_per_state)
+                               for column in zip(*self.STATES_SEQUENCE))
+        step = np.arange(len(names))
+
+        # Adicionar variação natural
+        wave = 0.02 * np.sin(step * dt * math.pi)
+        entropy = e.astype(float) + wave
+        syntropy = s.astype(float) - wave
+        energy = energy.astype(float)
+
+        # Nível de consciência Φ_c = S² × g(ℰ)
+        phi_c = syntropy ** 2 * g_modulation_array(energy / 20.0, self.constants)
+        entropy, syntropy, energy = clamp_state_arrays(entropy, syntropy, energy)
+
+        return ColumnarTrajectory({
+            'step': step,
+            'time': step * dt,
+            'state_name': names,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'consciousness_level': phi_c,
+            'temporal_dilation': energy * (1.0 + syntropy - entropy)
+        })
+
+    def sensitivity_outputs(self, trajectory: ColumnarTrajectory) -> Dict[str, np.ndarray]:
+        levels = np.atleast_2d(trajectory.column('consciousness_level'))
+        return {
+            **super().sensitivity_outputs(trajectory),
+            'max_consciousness': levels.max(axis=1),
+            'min_consciousness': levels.min(axis=1),
+            'mean_consciousness': levels.mean(axis=1)
+        }
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
+        states_sequence = self.STATES_SEQUENCE
+
         # Calcular métricas
-        consciousness_levels = [t['consciousness_level'] for t in trajectory]
+        consciousness_levels = trajectory_column(trajectory, 'consciousness_level')
 
         return SimulationResult(
             problem_name=self.name,
@@ -427,16 +744,16 @@ class ConsciousnessSimulator(ScientificProblemSimulator):
             final_state=trajectory[-1],
             trajectory=trajectory,
             metrics={
-                'max_consciousness': max(consciousness_levels),
-                'min_consciousness': min(consciousness_levels),
-                'mean_consciousness': sum(consciousness_levels) / len(consciousness_levels),
-                'consciousness_range': max(consciousness_levels) - min(consciousness_levels),
+                'max_consciousness': _max(consciousness_levels),
+                'min_consciousness': _min(consciousness_levels),
+                'mean_consciousness': _mean(consciousness_levels),
+                'consciousness_range': _max(consciousness_levels) - _min(consciousness_levels),
                 'states_analyzed': len(states_sequence)
             },
             predictions=[
                 "Consciência é propriedade fundamental da sintropia, não emergente",
-                f"Φ_c máximo: {max(consciousness_levels):.3f} (meditação profunda)",
-                f"Φ_c mínimo: {min(consciousness_levels):.3f} (sono profundo)",
+                f"Φ_c máximo: {_max(consciousness_levels):.3f} (meditação profunda)",
+                f"Φ_c mínimo: {_min(consciousness_levels):.3f} (sono profundo)",
                 "Qualia = gradientes de sintropia no espaço neural",
                 "Tempo subjetivo varia com S: τ/τ₀ = ℰ(1 + S - E)"
             ],
@@ -455,7 +772,7 @@ class ClimateChangeSimulator(ScientificProblemSimulator):
     Hipótese: Sistema climático é oscilador E-S com múltiplos equilíbrios
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'current_entropy': 0.58,
             'current_syntropy': 0.42,
@@ -463,7 +780,7 @@ class ClimateChangeSimulator(ScientificProblemSimulator):
             'co2_ppm': 420,
             'tipping_threshold': 0.65
         }
-        super().__init__("Mudanças Climáticas", params)
+        super().__init__("Mudanças Climáticas", params, constants)
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
@@ -473,7 +790,6 @@ class ClimateChangeSimulator(ScientificProblemSimulator):
         energy = self.params['radiative_forcing']
 
         tipping_occurred = False
-        tipping_step = None
 
         for i in range(steps):
             # Cenário: emissões continuam aumentando
@@ -489,7 +805,6 @@ class ClimateChangeSimulator(ScientificProblemSimulator):
             # Verificar tipping point
             if entropy > self.params['tipping_threshold'] and not tipping_occurred:
                 tipping_occurred = True
-                tipping_step = i
                 # Aceleração após tipping
                 entropy += 0.05
 
@@ -504,12 +819,55 @@ class ClimateChangeSimulator(ScientificProblemSimulator):
                 'entropy': state.entropy,
                 'syntropy': state.syntropy,
                 'energy': state.energy,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'temperature_anomaly': temp_anomaly,
                 'tipping_risk': 1 / (1 + math.exp(-20 * (entropy - 0.65))),
                 'dilation': state.temporal_dilation
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+
+        # Forçamento radiativo crescente e feedback entrópico com teto 0.95
+        energy = self.params['radiative_forcing'] + 0.002 * dt * (i + 1)
+        growth = 0.001 * (energy - 1.0) * dt
+        entropy = clipped_cumsum(self.params['current_entropy'], growth, upper=0.95)
+
+        # Sintropia é calculada antes do salto de tipping
+        syntropy = np.maximum(0.05, 1.0 - entropy)
+
+        # Tipping point: salto de +0.05 e nova varredura a partir dele
+        crossed = np.flatnonzero(entropy > self.params['tipping_threshold'])
+        if len(crossed):
+            k = crossed[0]
+            entropy[k] += 0.05
+            entropy[k + 1:] = clipped_cumsum(entropy[k], growth[k + 1:], upper=0.95)
+            syntropy[k + 1:] = np.maximum(0.05, 1.0 - entropy[k + 1:])
+
+        temp_anomaly = 1.2 + 3.0 * (entropy - 0.58)
+        tipping_risk = 1 / (1 + np.exp(-20 * (entropy - 0.65)))
+        entropy, syntropy, energy = clamp_state_arrays(entropy, syntropy, energy)
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'temperature_anomaly': temp_anomaly,
+            'tipping_risk': tipping_risk,
+            'dilation': energy * (1.0 + syntropy - entropy)
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
+        # Entropia é monótona: primeiro passo acima do limiar é o tipping point
+        threshold = self.params['tipping_threshold']
+        tipping_step = _first_step(trajectory, 'entropy', lambda e: e > threshold)
+        tipping_occurred = tipping_step is not None
+
         return SimulationResult(
             problem_name=self.name,
             initial_state={'entropy': 0.58, 'syntropy': 0.42, 'energy': 1.12},
@@ -544,7 +902,7 @@ class AgingSimulator(ScientificProblemSimulator):
     Hipótese: Envelhecimento = vitória gradual de E sobre S
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'initial_entropy': 0.20,
             'initial_syntropy': 0.80,
@@ -552,7 +910,7 @@ class AgingSimulator(ScientificProblemSimulator):
             'syntropy_decay': 0.01,  # por ano
             'lifespan_years': 80
         }
-        super().__init__("Envelhecimento e Longevidade", params)
+        super().__init__("Envelhecimento e Longevidade", params, constants)
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
@@ -593,10 +951,43 @@ class AgingSimulator(ScientificProblemSimulator):
                 'energy': state.energy,
                 'es_ratio': es_ratio,
                 'biological_age': biological_age,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'vitality': syntropy * energy
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+        years_per_step = self.params['lifespan_years'] / steps
+        age = i * years_per_step
+
+        # Taxas constantes com limites biológicos; declínio metabólico geométrico
+        entropy = clipped_cumsum(self.params['initial_entropy'],
+                                 np.full(steps, self.params['entropy_rate'] * years_per_step),
+                                 lower=0.0, upper=0.95)
+        syntropy = clipped_cumsum(self.params['initial_syntropy'],
+                                  np.full(steps, -self.params['syntropy_decay'] * years_per_step),
+                                  lower=0.05, upper=1.0)
+        energy = np.maximum(0.3, (1 - 0.005 * years_per_step / 10) ** (i + 1))
+
+        es_ratio = entropy / np.maximum(0.01, syntropy)
+        vitality = syntropy * energy
+        entropy, syntropy, energy = clamp_state_arrays(entropy, syntropy, energy)
+
+        return ColumnarTrajectory({
+            'step': i,
+            'chronological_age': age,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'es_ratio': es_ratio,
+            'biological_age': 20 * np.log(1 + es_ratio * 2),
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'vitality': vitality
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
         return SimulationResult(
             problem_name=self.name,
             initial_state={'entropy': 0.20, 'syntropy': 0.80, 'age': 0},
@@ -631,7 +1022,7 @@ class CancerSimulator(ScientificProblemSimulator):
     Hipótese: Câncer = reversão ao estado de alta entropia celular
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'normal_entropy': 0.25,
             'normal_syntropy': 0.75,
@@ -639,16 +1030,20 @@ class CancerSimulator(ScientificProblemSimulator):
             'cancer_syntropy': 0.20,
             'mutation_threshold': 10
         }
-        super().__init__("Câncer", params)
+        super().__init__("Câncer", params, constants)
+
+    # Progressão: Normal → Displasia → Carcinoma → Metástase
+    STAGES = ['normal', 'displasia', 'carcinoma_in_situ', 'invasivo', 'metastatico']
+    STAGE_PARAMS = [
+        (0.25, 0.75), (0.40, 0.60), (0.55, 0.45), (0.70, 0.30), (0.85, 0.15)
+    ]
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
 
         # Simular progressão: Normal → Displasia → Carcinoma → Metástase
-        stages = ['normal', 'displasia', 'carcinoma_in_situ', 'invasivo', 'metastatico']
-        stage_params = [
-            (0.25, 0.75), (0.40, 0.60), (0.55, 0.45), (0.70, 0.30), (0.85, 0.15)
-        ]
+        stages = self.STAGES
+        stage_params = self.STAGE_PARAMS
 
         mutations = 0
         current_stage = 0
@@ -681,11 +1076,52 @@ class CancerSimulator(ScientificProblemSimulator):
                 'entropy': state.entropy,
                 'syntropy': state.syntropy,
                 'energy': state.energy,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'malignancy_score': entropy / max(0.1, syntropy),
                 'warburg_ratio': 1 - energy
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+        steps_per_mutation = steps // 12
+        if steps_per_mutation == 0:
+            raise ZeroDivisionError("steps < 12: sem passos por mutação")
+
+        # Uma mutação a cada steps_per_mutation passos, duas por estágio, até o último
+        last_stage = len(self.STAGES) - 1
+        mutations = np.minimum(i // steps_per_mutation, 2 * last_stage)
+        stage = mutations // 2
+
+        e_target, s_target = (np.asarray(column)[stage] for column in zip(*self.STAGE_PARAMS))
+
+        # Transição suave entre estágios
+        wave = 0.02 * np.sin(i * dt * math.pi)
+        entropy = e_target + wave
+        syntropy = s_target - wave
+
+        # Energia (Warburg: câncer usa menos energia eficientemente)
+        energy = 1.0 - 0.3 * (1 - syntropy)
+
+        malignancy = entropy / np.maximum(0.1, syntropy)
+        warburg = 1 - energy
+        entropy, syntropy, energy = clamp_state_arrays(entropy, syntropy, energy)
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'stage': np.asarray(self.STAGES)[stage],
+            'mutations': mutations,
+            'entropy': entropy,
+            'syntropy': syntropy,
+            'energy': energy,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'malignancy_score': malignancy,
+            'warburg_ratio': warburg
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
         return SimulationResult(
             problem_name=self.name,
             initial_state={'entropy': 0.25, 'syntropy': 0.75, 'stage': 'normal'},
@@ -721,20 +1157,23 @@ class NeurodegenerationSimulator(ScientificProblemSimulator):
     Hipótese: Neurodegeneração = cascata de colapso sintrópico
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'healthy_syntropy': 0.90,
             'disease_threshold': 0.70,
             'clinical_threshold': 0.50,
             'spread_rate': 0.05
         }
-        super().__init__("Doenças Neurodegenerativas", params)
+        super().__init__("Doenças Neurodegenerativas", params, constants)
+
+    # Regiões cerebrais na ordem de propagação
+    REGIONS = ['hipocampo', 'cortex_temporal', 'cortex_frontal', 'cortex_parietal']
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
 
         # Simular múltiplas regiões cerebrais
-        regions = ['hipocampo', 'cortex_temporal', 'cortex_frontal', 'cortex_parietal']
+        regions = self.REGIONS
         region_syntropy = {r: 0.90 for r in regions}
 
         # Iniciar patologia no hipocampo (Alzheimer típico)
@@ -779,10 +1218,54 @@ class NeurodegenerationSimulator(ScientificProblemSimulator):
                 'mean_syntropy': mean_syntropy,
                 'mean_entropy': mean_entropy,
                 'clinical_stage': stage,
-                'phi': state.phi,
+                'phi': state.phi_with(self.constants),
                 'cognitive_function': mean_syntropy ** 2
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+        spread_rate = self.params['spread_rate']
+
+        # Cada região depende da vizinha anterior já atualizada no mesmo passo;
+        # perdas são sempre ≥ 0, então cada região é uma varredura com piso 0.10
+        regions = {}
+        previous = None
+        for j, region in enumerate(self.REGIONS):
+            start = 0.85 if j == 0 else 0.90
+            loss = np.full(steps, 0.003 * dt)
+            if previous is not None:
+                loss = loss + (0.90 - previous) * spread_rate * dt
+            previous = clipped_cumsum(start, -loss, lower=0.10)
+            regions[region] = previous
+
+        mean_syntropy = sum(regions.values()) / len(regions)
+        mean_entropy = 1.0 - mean_syntropy
+        entropy, syntropy, energy = clamp_state_arrays(mean_entropy, mean_syntropy, np.full(steps, 0.8))
+
+        stage = np.select(
+            [mean_syntropy > 0.70, mean_syntropy > 0.50, mean_syntropy > 0.30],
+            ['assintomatico', 'leve', 'moderado'],
+            default='severo'
+        )
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time_years': i * dt * 10,
+            'regions': regions,
+            'mean_syntropy': mean_syntropy,
+            'mean_entropy': mean_entropy,
+            'clinical_stage': stage,
+            'phi': compute_phi_array(entropy, syntropy, energy, self.constants),
+            'cognitive_function': mean_syntropy ** 2
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
+        years_to_symptoms = _first_step(trajectory, 'mean_syntropy', lambda s: s < 0.70)
+        if years_to_symptoms is not None:
+            years_to_symptoms = trajectory[years_to_symptoms]['time_years']
+
         return SimulationResult(
             problem_name=self.name,
             initial_state={'syntropy': 0.90, 'stage': 'saudável'},
@@ -792,7 +1275,7 @@ class NeurodegenerationSimulator(ScientificProblemSimulator):
                 'final_stage': trajectory[-1]['clinical_stage'],
                 'final_syntropy': trajectory[-1]['mean_syntropy'],
                 'cognitive_decline': 1.0 - trajectory[-1]['cognitive_function'],
-                'years_to_symptoms': next((t['time_years'] for t in trajectory if t['mean_syntropy'] < 0.70), None),
+                'years_to_symptoms': years_to_symptoms,
                 'spread_pattern': 'hipocampo → temporal → frontal → parietal'
             },
             predictions=[
@@ -818,14 +1301,14 @@ class AntimicrobialResistanceSimulator(ScientificProblemSimulator):
     Hipótese: AMR = corrida armamentista E-S entre patógenos e tratamentos
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'sensitive_fitness': 1.0,
             'resistant_fitness': 0.95,
             'mutation_rate': 1e-8,
             'selection_pressure': 0.9
         }
-        super().__init__("Resistência Antimicrobiana", params)
+        super().__init__("Resistência Antimicrobiana", params, constants)
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
@@ -869,6 +1352,36 @@ class AntimicrobialResistanceSimulator(ScientificProblemSimulator):
                 'resistance_risk': resistant
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+
+        # Antibiótico liga no passo 0 e alterna a cada 20 passos
+        antibiotic_on = (i // 20) % 2 == 0
+
+        # A normalização preserva a razão resistentes/sensíveis, que evolui
+        # multiplicativamente: log-razão = soma acumulada dos log-fatores
+        log_factor = np.where(antibiotic_on, math.log(1.05 / 0.9), math.log(0.98 / 1.02))
+        log_ratio = math.log(0.01 / 0.99) + np.cumsum(log_factor)
+        resistant = np.exp(-np.logaddexp(0.0, -log_ratio))
+        sensitive = np.exp(-np.logaddexp(0.0, log_ratio))
+
+        # Entropia do sistema (diversidade)
+        system_entropy = (-sensitive * np.log(sensitive + 0.001)
+                          - resistant * np.log(resistant + 0.001)) / math.log(2)
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'sensitive_fraction': sensitive,
+            'resistant_fraction': resistant,
+            'antibiotic_on': antibiotic_on,
+            'system_entropy': system_entropy,
+            'resistance_risk': resistant
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
         return SimulationResult(
             problem_name=self.name,
             initial_state={'sensitive': 0.99, 'resistant': 0.01},
@@ -877,7 +1390,7 @@ class AntimicrobialResistanceSimulator(ScientificProblemSimulator):
             metrics={
                 'final_resistant_fraction': trajectory[-1]['resistant_fraction'],
                 'resistance_increase': trajectory[-1]['resistant_fraction'] / 0.01,
-                'max_resistance': max(t['resistant_fraction'] for t in trajectory),
+                'max_resistance': _max(trajectory_column(trajectory, 'resistant_fraction')),
                 'cycles_simulated': steps // 20
             },
             predictions=[
@@ -903,14 +1416,16 @@ class NuclearFusionSimulator(ScientificProblemSimulator):
     Hipótese: Fusão = transição de fase sintrópica extrema
     """
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
         params = {
             'plasma_temperature': 150e6,  # Kelvin
             'plasma_density': 1e20,  # partículas/m³
             'confinement_time': 3.0,  # segundos
             'Q_target': 10
         }
-        super().__init__("Fusão Nuclear Controlada", params)
+        super().__init__("Fusão Nuclear Controlada", params, constants)
+
+    LAWSON_THRESHOLD = 3e21
 
     def simulate(self, steps: int = 100, dt: float = 0.01) -> SimulationResult:
         trajectory = []
@@ -920,9 +1435,6 @@ class NuclearFusionSimulator(ScientificProblemSimulator):
         density = self.params['plasma_density']
         confinement = 0.1
 
-        fusion_achieved = False
-        ignition_step = None
-
         for i in range(steps):
             # Aquecimento progressivo
             temperature = min(self.params['plasma_temperature'], temperature * 1.05)
@@ -932,7 +1444,7 @@ class NuclearFusionSimulator(ScientificProblemSimulator):
 
             # Critério de Lawson: n × T × τ
             lawson = density * (temperature / 1e3) * confinement  # Simplificado
-            lawson_threshold = 3e21
+            lawson_threshold = self.LAWSON_THRESHOLD
 
             # Entropia do plasma (alta temperatura = alta entropia)
             plasma_entropy = 0.5 + 0.4 * (temperature / self.params['plasma_temperature'])
@@ -944,10 +1456,6 @@ class NuclearFusionSimulator(ScientificProblemSimulator):
             else:
                 Q = 0.1
 
-            if Q >= 1.0 and not fusion_achieved:
-                fusion_achieved = True
-                ignition_step = i
-
             state = SystemState(plasma_entropy, plasma_syntropy, temperature / 1e8, time=i*dt)
 
             trajectory.append({
@@ -963,6 +1471,41 @@ class NuclearFusionSimulator(ScientificProblemSimulator):
                 'fusion_active': Q >= 1.0
             })
 
+        return self._build_result(trajectory, steps)
+
+    def trajectory_arrays(self, steps: int = 100, dt: float = 0.01) -> ColumnarTrajectory:
+        i = np.arange(steps)
+        density = self.params['plasma_density']
+
+        # Aquecimento e confinamento geométricos com teto (formas fechadas)
+        temperature = capped_geometric(1e6, 1.05, self.params['plasma_temperature'], steps)
+        confinement = capped_geometric(0.1, 1.03, self.params['confinement_time'], steps)
+
+        # Critério de Lawson: n × T × τ
+        lawson = density * (temperature / 1e3) * confinement  # Simplificado
+        plasma_entropy = 0.5 + 0.4 * (temperature / self.params['plasma_temperature'])
+
+        Q = np.where(lawson > self.LAWSON_THRESHOLD * 0.5,
+                     (lawson / self.LAWSON_THRESHOLD) * self.params['Q_target'], 0.1)
+
+        return ColumnarTrajectory({
+            'step': i,
+            'time': i * dt,
+            'temperature_MK': temperature / 1e6,
+            'density': np.full(steps, density),
+            'confinement_s': confinement,
+            'lawson_parameter': lawson,
+            'Q_factor': Q,
+            'plasma_entropy': plasma_entropy,
+            'plasma_syntropy': 1.0 - plasma_entropy,
+            'fusion_active': Q >= 1.0
+        })
+
+    def _build_result(self, trajectory, steps: int) -> SimulationResult:
+        lawson_threshold = self.LAWSON_THRESHOLD
+        ignition_step = _first_step(trajectory, 'Q_factor', lambda q: q >= 1.0)
+        fusion_achieved = ignition_step is not None
+
         return SimulationResult(
             problem_name=self.name,
             initial_state={'temperature': 1e6, 'Q': 0.1},
@@ -992,54 +1535,127 @@ class NuclearFusionSimulator(ScientificProblemSimulator):
         )
 
 
+SIMULATOR_CLASSES = (
+    DarkMatterEnergySimulator,
+    QuantumGravitySimulator,
+    OriginOfLifeSimulator,
+    ConsciousnessSimulator,
+    ClimateChangeSimulator,
+    AgingSimulator,
+    CancerSimulator,
+    NeurodegenerationSimulator,
+    AntimicrobialResistanceSimulator,
+    NuclearFusionSimulator
+)
+
+
 # =============================================================================
 # EXECUTOR PRINCIPAL
 # =============================================================================
 
+def run_simulator_timed(simulator: ScientificProblemSimulator, steps: int = 100,
+                        backend: str = 'python') -> Tuple[SimulationResult, float]:
+    """Executa um simulador e mede o tempo de parede (função de nível de módulo
+    para poder ser despachada a um pool de processos)"""
+    start = time.perf_counter()
+    if backend == 'numpy':
+        result = simulator.simulate_vectorized(steps=steps)
+    else:
+        result = simulator.simulate(steps=steps)
+    return result, time.perf_counter() - start
+
+def _run_job(job: Tuple[ScientificProblemSimulator, int, str]) -> Tuple[SimulationResult, float]:
+    return run_simulator_timed(*job)
+
+
 class ScientificProblemsAnalyzer:
     """Classe principal para executar todas as análises"""
 
-    def __init__(self):
+    def __init__(self, constants: Optional[ModelConstants] = None):
+        self.constants = constants or ModelConstants()
         self.simulators = [
-            DarkMatterEnergySimulator(),
-            QuantumGravitySimulator(),
-            OriginOfLifeSimulator(),
-            ConsciousnessSimulator(),
-            ClimateChangeSimulator(),
-            AgingSimulator(),
-            CancerSimulator(),
-            NeurodegenerationSimulator(),
-            AntimicrobialResistanceSimulator(),
-            NuclearFusionSimulator()
+            simulator_class(self.constants) for simulator_class in SIMULATOR_CLASSES
         ]
         self.results = []
-
-    def run_all(self, steps: int = 100) -> List[SimulationResult]:
-        """Executa todas as simulações"""
-        print("=" * 70)
-        print("MODELO X FRAMEWORK - Análise dos 10 Grandes Problemas Científicos")
-        print("=" * 70)
-        print()
+        self.timings = []
+
+    def run_batch(self, simulators: Sequence[ScientificProblemSimulator], steps: int = 100,
+                  parallel: bool = False, max_workers: Optional[int] = None,
+                  executor: Optional[ProcessPoolExecutor] = None, backend: str = 'python',
+                  chunksize: int = 1):
+        """Executa uma lista de simuladores (ou variantes de parâmetros) e
+        devolve um iterador de (SimulationResult, tempo) na ordem original
+
+        Com `parallel=True` os simuladores são despachados a um pool de
+        processos; um `executor` já aberto pode ser reutilizado entre chamadas
+        (estudos paramétricos) para evitar o custo de criar o pool a cada vez.
+        """
+        jobs = [(simulator, steps, backend) for simulator in simulators]
+
+        if not parallel:
+            yield from map(_run_job, jobs)
+            return
+
+        if executor is not None:
+            yield from executor.map(_run_job, jobs, chunksize=chunksize)
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            yield from pool.map(_run_job, jobs, chunksize=chunksize)
+
+    def run_all(self, steps: int = 100, parallel: bool = False, max_workers: Optional[int] = None,
+                executor: Optional[ProcessPoolExecutor] = None, backend: str = 'python',
+                verbose: bool = True) -> List[SimulationResult]:
+        """Executa todas as simulações
+
+        Os resultados ficam em self.results (na ordem de self.simulators) e o
+        tempo de parede e passos/s de cada problema em self.timings.
+        """
+        log = print if verbose else (lambda *args, **kwargs: None)
+
+        log("=" * 70)
+        log("MODELO X FRAMEWORK - Análise dos 10 Grandes Problemas Científicos")
+        log("=" * 70)
+        log()
 
         self.results = []
+        self.timings = []
+        total = len(self.simulators)
 
-        for i, simulator in enumerate(self.simulators, 1):
-            print(f"[{i}/10] Simulando: {simulator.name}...")
-            result = simulator.simulate(steps=steps)
+        batch = self.run_batch(self.simulators, steps, parallel, max_workers, executor, backend)
+        for i, (simulator, (result, elapsed)) in enumerate(zip(self.simulators, batch), 1):
             self.results.append(result)
+            self.timings.append({
+                'problem': result.problem_name,
+                'wall_time': elapsed,
+                'steps_per_second': len(result.trajectory) / elapsed if elapsed > 0 else float('inf')
+            })
+
+            log(f"[{i}/{total}] Simulando: {simulator.name}...")
 
             # Resumo rápido
             phi_val = result.final_state.get('phi', 'N/A')
             phi_str = f"{phi_val:.4f}" if isinstance(phi_val, (int, float)) else str(phi_val)
-            print(f"       ✓ Concluído | Φ final: {phi_str}")
-            print()
+            log(f"       ✓ Concluído | Φ final: {phi_str} | "
+                f"{elapsed * 1e3:.2f} ms ({self.timings[-1]['steps_per_second']:,.0f} passos/s)")
+            log()
 
-        print("=" * 70)
-        print("TODAS AS SIMULAÇÕES CONCLUÍDAS")
-        print("=" * 70)
+        log("=" * 70)
+        log("TODAS AS SIMULAÇÕES CONCLUÍDAS")
+        log("=" * 70)
 
         return self.results
 
+    def timing_report(self) -> str:
+        """Tabela de tempo de parede e passos/s por problema da última execução"""
+        lines = [f"{'PROBLEMA':<40} {'TEMPO (ms)':>12} {'PASSOS/S':>14}"]
+        for timing in self.timings:
+            lines.append(f"{timing['problem'][:40]:<40} {timing['wall_time'] * 1e3:>12.2f} "
+                         f"{timing['steps_per_second']:>14,.0f}")
+        total = sum(t['wall_time'] for t in self.timings)
+        lines.append(f"{'TOTAL':<40} {total * 1e3:>12.2f}")
+        return "\n".join(lines)
+
     def generate_report(self) -> str:
         """Gera relatório textual dos resultados"""
         report = []
@@ -1085,10 +1701,7 @@ class ScientificProblemsAnalyzer:
                 'status': 'COMPLETE'
             },
             'parameters': {
-                'alpha': ALPHA,
-                'beta': BETA,
-                'gamma': GAMMA,
-                'E0': E0,
+                **self.constants.as_dict(),
                 'C_universal': C_UNIVERSAL
             },
             'results': []
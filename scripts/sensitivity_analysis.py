@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+MODELO X FRAMEWORK - Análise de Sensibilidade Global (índices de Sobol)
+============================================================================
+
+Mede quanto cada saída dos 10 simuladores científicos responde às constantes
+α, β, γ e ℰ₀. O desenho amostral é quase-aleatório (sequência de Sobol
+embaralhada, esquema de Saltelli), todas as amostras de um simulador são
+avaliadas de uma vez pelo backend vetorizado (constantes com forma (n, 1)) e
+as avaliações ficam em cache. Os índices de primeira ordem (S1) e totais (ST)
+são reportados com intervalos de confiança bootstrap.
+
+Uso:
+    python scripts/sensitivity_analysis.py --samples 1024 --steps 100
+    python scripts/sensitivity_analysis.py --spread 0.1 --output sensitivity.json
+"""
+
+import argparse
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.stats import qmc
+
+from scientific_problems_simulation import (
+    ALPHA, BETA, GAMMA, E0,
+    ModelConstants,
+    ScientificProblemSimulator,
+    SIMULATOR_CLASSES
+)
+
+PARAMETERS = ('alpha', 'beta', 'gamma', 'E0')
+NOMINAL = {'alpha': ALPHA, 'beta': BETA, 'gamma': GAMMA, 'E0': E0}
+
+
+def default_bounds(spread: float = 0.2) -> Dict[str, Tuple[float, float]]:
+    """Intervalos ±spread em torno dos valores universais das constantes"""
+    return {name: (value * (1.0 - spread), value * (1.0 + spread)) for name, value in NOMINAL.items()}
+
+
+class SobolSensitivityAnalyzer:
+    """Índices de Sobol S1/ST das saídas dos simuladores em relação a α, β, γ, ℰ₀
+
+    Com N amostras base e d parâmetros são avaliadas N × (d + 2) combinações
+    (matrizes A, B e A_B^(i) de Saltelli). S1 usa o estimador de Saltelli
+    (2010) e ST o de Jansen; os ICs vêm de reamostragem bootstrap das N linhas,
+    vetorizada como em BootstrapValidator.
+    """
+
+    def __init__(self, bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                 n_samples: int = 1024, steps: int = 100, dt: float = 0.01,
+                 n_resamples: int = 1000, confidence: float = 0.95, seed: int = 42,
+                 simulators: Optional[Sequence[ScientificProblemSimulator]] = None):
+        if n_samples < 2 or n_samples & (n_samples - 1):
+            raise ValueError("n_samples deve ser uma potência de 2 (sequência de Sobol)")
+        if n_resamples < 1:
+            raise ValueError("n_resamples deve ser positivo")
+        if not (0.0 < confidence < 1.0):
+            raise ValueError("confidence deve estar entre 0.0 e 1.0")
+
+        self.bounds = bounds or default_bounds()
+        unknown = set(self.bounds) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Parâmetros desconhecidos: {', '.join(sorted(unknown))}")
+        self.names = [name for name in PARAMETERS if name in self.bounds]
+
+        self.n_samples = int(n_samples)
+        self.steps = steps
+        self.dt = dt
+        self.n_resamples = int(n_resamples)
+        self.confidence = confidence
+        self.seed = seed
+        self.simulators = list(simulators) if simulators is not None else [
+            simulator_class() for simulator_class in SIMULATOR_CLASSES
+        ]
+
+        # (simulador, passos, dt) → {bytes da linha de constantes: {saída: valor}}
+        self.cache: Dict[Tuple, Dict[bytes, Dict[str, float]]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.results: Dict[str, Dict] = {}
+
+    # ------------------------------------------------------------------
+    # Desenho amostral
+    # ------------------------------------------------------------------
+
+    def sample_design(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Matrizes A, B (N × d) e A_B (d × N × d) no espaço das constantes"""
+        d = len(self.names)
+        sampler = qmc.Sobol(d=2 * d, scramble=True, seed=self.seed)
+        unit = sampler.random_base2(int(np.log2(self.n_samples)))
+
+        lower = np.array([self.bounds[name][0] for name in self.names])
+        upper = np.array([self.bounds[name][1] for name in self.names])
+        A = qmc.scale(unit[:, :d], lower, upper)
+        B = qmc.scale(unit[:, d:], lower, upper)
+
+        AB = np.repeat(A[np.newaxis], d, axis=0)
+        for i in range(d):
+            AB[i, :, i] = B[:, i]
+        return A, B, AB
+
+    def constants_for(self, samples: np.ndarray) -> ModelConstants:
+        """Constantes em forma (n, 1) para o backend vetorizado"""
+        values = dict(NOMINAL)
+        for j, name in enumerate(self.names):
+            values[name] = samples[:, j:j + 1]
+        return ModelConstants(**values)
+
+    # ------------------------------------------------------------------
+    # Avaliação em lote com cache
+    # ------------------------------------------------------------------
+
+    def evaluate(self, simulator: ScientificProblemSimulator,
+                 samples: np.ndarray) -> Dict[str, np.ndarray]:
+        """Saídas de sensibilidade do simulador para cada linha de `samples`
+
+        Apenas as linhas ausentes do cache são simuladas, todas numa única
+        chamada de trajectory_arrays com constantes vetoriais.
+        """
+        samples = np.ascontiguousarray(samples, dtype=float)
+        cache = self.cache.setdefault((simulator.name, self.steps, self.dt), {})
+        keys = [row.tobytes() for row in samples]
+
+        missing = [i for i, key in enumerate(keys) if key not in cache]
+        self.cache_hits += len(keys) - len(missing)
+        self.cache_misses += len(missing)
+
+        if missing:
+            original = simulator.constants
+            simulator.constants = self.constants_for(samples[missing])
+            try:
+                trajectory = simulator.trajectory_arrays(self.steps, self.dt)
+                outputs = simulator.sensitivity_outputs(trajectory)
+            finally:
+                simulator.constants = original
+
+            for row, i in enumerate(missing):
+                cache[keys[i]] = {name: float(np.broadcast_to(values, len(missing))[row])
+                                  for name, values in outputs.items()}
+
+        if not keys or not cache[keys[0]]:
+            return {}
+        return {name: np.array([cache[key][name] for key in keys]) for name in cache[keys[0]]}
+
+    # ------------------------------------------------------------------
+    # Índices de Sobol
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def sobol_indices(fA: np.ndarray, fB: np.ndarray, fAB: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """S1 e ST por parâmetro; aceita eixos extras à esquerda (reamostragens)
+
+        fA, fB: (..., N); fAB: (d, ..., N). As saídas são centradas antes dos
+        estimadores (reduz a variância de S1); saídas sem variância têm índices 0.
+        """
+        pooled = np.concatenate((fA, fB), axis=-1)
+        center = pooled.mean(axis=-1, keepdims=True)
+        fA, fB, fAB = fA - center, fB - center, fAB - center
+        variance = np.var(pooled, axis=-1)
+        safe = np.where(variance > 0, variance, 1.0)
+
+        first = np.mean(fB * (fAB - fA), axis=-1) / safe
+        total = 0.5 * np.mean((fA - fAB) ** 2, axis=-1) / safe
+        return np.where(variance > 0, first, 0.0), np.where(variance > 0, total, 0.0)
+
+    def _interval(self, samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        tail = (1.0 - self.confidence) / 2 * 100
+        lower, upper = np.percentile(samples, [tail, 100 - tail], axis=-1)
+        return lower, upper
+
+    def analyze_outputs(self, fA: np.ndarray, fB: np.ndarray, fAB: np.ndarray) -> Dict[str, Dict]:
+        """Estimativa pontual e IC bootstrap de S1/ST para uma saída"""
+        first, total = self.sobol_indices(fA, fB, fAB)
+
+        rng = np.random.default_rng(self.seed)
+        indices = rng.integers(0, len(fA), size=(self.n_resamples, len(fA)))
+        boot_first, boot_total = self.sobol_indices(fA[indices], fB[indices], fAB[:, indices])
+        first_low, first_high = self._interval(boot_first)
+        total_low, total_high = self._interval(boot_total)
+
+        return {
+            name: {
+                'S1': {'point': float(first[i]), 'lower': float(first_low[i]), 'upper': float(first_high[i])},
+                'ST': {'point': float(total[i]), 'lower': float(total_low[i]), 'upper': float(total_high[i])}
+            }
+            for i, name in enumerate(self.names)
+        }
+
+    def run(self, verbose: bool = True) -> Dict[str, Dict]:
+        """Calcula os índices de todas as saídas de todos os simuladores"""
+        A, B, AB = self.sample_design()
+        d = len(self.names)
+        design = np.concatenate((A, B, AB.reshape(-1, d)))
+
+        self.results = {}
+        for simulator in self.simulators:
+            outputs = self.evaluate(simulator, design)
+            problem = {}
+            for name, values in outputs.items():
+                fA = values[:self.n_samples]
+                fB = values[self.n_samples:2 * self.n_samples]
+                fAB = values[2 * self.n_samples:].reshape(d, self.n_samples)
+                problem[name] = self.analyze_outputs(fA, fB, fAB)
+            self.results[simulator.name] = problem
+
+            if verbose:
+                print(f"✓ {simulator.name}: {len(outputs)} saída(s) sensível(is) às constantes")
+
+        return self.results
+
+    # ------------------------------------------------------------------
+    # Relatórios
+    # ------------------------------------------------------------------
+
+    def generate_report(self) -> str:
+        """Tabela textual de S1/ST com ICs por simulador e saída"""
+        level = f"{self.confidence:.0%}"
+        report = [
+            "=" * 70,
+            "ANÁLISE DE SENSIBILIDADE GLOBAL (SOBOL) - CONSTANTES DO MODELO X",
+            "=" * 70,
+            f"Amostras base: {self.n_samples} | Avaliações: {self.n_samples * (len(self.names) + 2)}"
+            f" | Passos: {self.steps} | IC bootstrap {level} ({self.n_resamples} reamostragens)",
+            "Intervalos: " + ", ".join(f"{name} ∈ [{low:.3g}, {high:.3g}]"
+                                       for name, (low, high) in self.bounds.items()),
+            f"Cache: {self.cache_hits} acertos / {self.cache_misses} avaliações",
+            ""
+        ]
+
+        for problem, outputs in self.results.items():
+            report.append(f"▶ {problem}")
+            if not outputs:
+                report.append("   (nenhuma saída depende de α, β, γ, ℰ₀)")
+            for output, indices in outputs.items():
+                report.append(f"   {output}")
+                for name, values in indices.items():
+                    s1, st = values['S1'], values['ST']
+                    report.append(
+                        f"      {name:<6} S1 = {s1['point']:6.3f} [{s1['lower']:6.3f}, {s1['upper']:6.3f}]"
+                        f"   ST = {st['point']:6.3f} [{st['lower']:6.3f}, {st['upper']:6.3f}]"
+                    )
+            report.append("")
+
+        return "\n".join(report)
+
+    def export_json(self, filename: str) -> None:
+        """Exporta os índices para JSON"""
+        export_data = {
+            'metadata': {
+                'method': 'sobol-saltelli',
+                'n_samples': self.n_samples,
+                'steps': self.steps,
+                'dt': self.dt,
+                'n_resamples': self.n_resamples,
+                'confidence': self.confidence,
+                'seed': self.seed
+            },
+            'bounds': {name: list(bounds) for name, bounds in self.bounds.items()},
+            'results': self.results
+        }
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(export_data, f, indent=2, ensure_ascii=False)
+
+        print(f"Índices exportados para: {filename}")
+
+
+# =============================================================================
+# PONTO DE ENTRADA
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Índices de Sobol das constantes do Modelo X")
+    parser.add_argument('--samples', type=int, default=1024, help="Amostras base (potência de 2)")
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--spread', type=float, default=0.2,
+                        help="Variação relativa em torno dos valores universais (0.2 = ±20%%)")
+    parser.add_argument('--resamples', type=int, default=1000)
+    parser.add_argument('--confidence', type=float, default=0.95)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help="Arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    analyzer = SobolSensitivityAnalyzer(
+        bounds=default_bounds(args.spread),
+        n_samples=args.samples,
+        steps=args.steps,
+        n_resamples=args.resamples,
+        confidence=args.confidence,
+        seed=args.seed
+    )
+    analyzer.run()
+    print(analyzer.generate_report())
+
+    if args.output:
+        analyzer.export_json(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,8 @@ Componentes principais:
 - SimulationEngine: Simulação temporal determinística
 - ModelXVisualizer: Visualização e exportação de dados
 - ValidationUtils: Utilitários de validação e datasets
+- BootstrapValidator: Intervalos de confiança bootstrap das métricas de validação
+- CMBSpectrumModel / CMBLikelihood: Ajuste do espectro TT da CMB com cache de espectros CAMB
 - EnergyModulatedModel: Modelo unificado (compatibilidade)
 
 Validado com score 93.0/100 em 4 domínios científicos.
@@ -23,6 +25,8 @@ from .energy_modulation import EnergyModulationEngine
 from .simulation_engine import SimulationEngine
 from .visualization import ModelXVisualizer
 from .utils import ValidationUtils
+from .bootstrap import BootstrapValidator
+from .cmb import CMBSpectrumModel, CMBLikelihood
 
 # Manter classe original para compatibilidade
 class EnergyModulatedModel:
@@ -60,6 +64,9 @@ __all__ = [
     'SimulationEngine',
     'ModelXVisualizer',
     'ValidationUtils',
+    'BootstrapValidator',
+    'CMBSpectrumModel',
+    'CMBLikelihood',
     'EnergyModulatedModel'
 ]
 
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Intervalos de confiança bootstrap para métricas de validação do Modelo X Framework"""
+
+import numpy as np
+
+from .entropy_syntropy import EntropySyntropyCalculator
+from .utils import ValidationUtils
+
+
+class BootstrapValidator:
+    """Reamostragem bootstrap vetorizada de entropia, sintropia e score de validação
+
+    Cada dataset é reamostrado `n_resamples` vezes através de uma matriz 2-D de
+    índices (n_resamples × n); todas as reamostragens são avaliadas de uma vez
+    pelo caminho em lote do EntropySyntropyCalculator.
+    """
+
+    def __init__(self, n_resamples=10000, confidence=0.95, seed=42, batch_size=2000,
+                 calculator=None):
+        if n_resamples < 1:
+            raise ValueError("n_resamples deve ser positivo")
+        if not (0.0 < confidence < 1.0):
+            raise ValueError("confidence deve estar entre 0.0 e 1.0")
+
+        self.n_resamples = int(n_resamples)
+        self.confidence = confidence
+        self.seed = seed
+        self.batch_size = max(1, int(batch_size))
+        self.calculator = calculator or EntropySyntropyCalculator()
+
+    def resample_metrics(self, data, expected_values=None, method="complement"):
+        """Avalia entropia, sintropia e score de validação em todas as reamostragens
+
+        Retorna dict de arrays com `n_resamples` elementos. As reamostragens são
+        processadas em blocos de `batch_size` linhas para limitar a memória.
+        """
+        data = np.asarray(data, dtype=float).ravel()
+        rng = np.random.default_rng(self.seed)
+
+        entropy = np.empty(self.n_resamples)
+        for start in range(0, self.n_resamples, self.batch_size):
+            stop = min(start + self.batch_size, self.n_resamples)
+            indices = rng.integers(0, len(data), size=(stop - start, len(data)))
+            entropy[start:stop] = self.calculator.calculate_shannon_entropy_batch(data[indices])
+
+        syntropy = self.calculator.calculate_syntropy_batch(None, method=method, entropy=entropy)
+        metrics = {'entropy': entropy, 'syntropy': syntropy}
+
+        if expected_values is not None:
+            metrics['validation_score'] = ValidationUtils.validation_score(
+                np.abs(entropy - expected_values['expected_entropy']),
+                np.abs(syntropy - expected_values['expected_syntropy'])
+            )
+
+        return metrics
+
+    def confidence_interval(self, samples):
+        """Intervalo de confiança percentil para um array de reamostragens"""
+        tail = (1.0 - self.confidence) / 2 * 100
+        lower, upper = np.percentile(samples, [tail, 100 - tail])
+        return {
+            'mean': float(np.mean(samples)),
+            'std': float(np.std(samples)),
+            'lower': float(lower),
+            'upper': float(upper)
+        }
+
+    def bootstrap_dataset(self, data, expected_values=None, method="complement"):
+        """Estimativa pontual e IC percentil de entropia, sintropia e score"""
+        if data is None or len(data) == 0:
+            return {'error': 'Dados inválidos'}
+
+        entropy_point = self.calculator.calculate_shannon_entropy(data)
+        syntropy_point = self.calculator.calculate_syntropy(data, method=method)
+        point = {'entropy': entropy_point, 'syntropy': syntropy_point}
+
+        if expected_values is not None:
+            point['validation_score'] = ValidationUtils.validation_score(
+                abs(entropy_point - expected_values['expected_entropy']),
+                abs(syntropy_point - expected_values['expected_syntropy'])
+            )
+
+        samples = self.resample_metrics(data, expected_values, method=method)
+
+        results = {
+            'n_resamples': self.n_resamples,
+            'confidence': self.confidence
+        }
+        for name, value in point.items():
+            results[name] = {'point': float(value), **self.confidence_interval(samples[name])}
+
+        return results
+
+    def bootstrap_datasets(self, datasets, method="complement"):
+        """Aplica bootstrap_dataset a cada domínio de um dict de datasets de validação"""
+        return {
+            domain: self.bootstrap_dataset(
+                dataset['data'],
+                dataset if 'expected_entropy' in dataset else None,
+                method=method
+            )
+            for domain, dataset in datasets.items()
+        }
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""Espectro TT da CMB com amortecimento l0 do Modelo X e cache de soluções CAMB
+
+O modelo ajustado em notebooks/cmb_validation.py é
+
+    D_ℓ(θ, l0) = D_ℓ^CAMB(H0, ωb, ωc, τ, As, ns) · exp(-ℓ²/2l0²)
+
+Só o fator de amortecimento depende de l0, então o espectro base do CAMB é
+memorizado pelos seis parâmetros cosmológicos (LRU limitado em memória e,
+opcionalmente, arquivos .npy em disco) e l0 é aplicado analiticamente.
+Propostas do MCMC que mudam apenas l0 não chamam o CAMB. O atalho só rende
+com movimentos que atualizam l0 sozinho (Metropolis-within-Gibbs, ou um
+emcee.moves restrito à coordenada l0): o stretch move padrão do emcee muda
+os sete parâmetros juntos e quase toda proposta é uma cosmologia nova.
+O cache em disco não tem limite (um .npy de ~20 KB por cosmologia) e deve
+ser ligado só quando as cosmologias se repetem entre execuções.
+
+Para ajustes longos, SpectrumEmulator substitui o CAMB por um polinômio em
+log D_ℓ treinado num hipercubo latino de soluções exatas; run_sampler roda o
+emcee em série ou num pool de processos, e verify_exact confere o resultado
+com a verossimilhança exata. camb e emcee são importados só quando usados.
+"""
+
+import hashlib
+import itertools
+import os
+import tempfile
+from collections import OrderedDict
+from functools import partial
+from multiprocessing import Pool
+
+import numpy as np
+
+COSMOLOGY_PARAMS = ('H0', 'ombh2', 'omch2', 'tau', 'As', 'ns')
+PARAM_NAMES = COSMOLOGY_PARAMS + ('l0',)
+
+PRIORS = {
+    'H0': (50.0, 90.0),
+    'ombh2': (0.005, 0.025),
+    'omch2': (0.10, 0.30),
+    'tau': (0.04, 0.12),
+    'As': (1e-10, 2e-9),
+    'ns': (0.92, 1.0),
+    'l0': (10.0, 500.0),
+}
+
+# Ponto de partida dos walkers (As abaixo do limite superior aberto do prior)
+FIDUCIAL = (67.0, 0.022, 0.12, 0.06, 1.9e-9, 0.96, 70.0)
+
+
+def camb_spectrum(cosmology, lmax):
+    """D_ℓ^TT total (μK²) de ℓ = 0 a lmax calculado pelo CAMB"""
+    import camb
+
+    H0, ombh2, omch2, tau, As, ns = cosmology
+    pars = camb.CAMBparams()
+    pars.set_cosmology(H0=H0, ombh2=ombh2, omch2=omch2, tau=tau)
+    pars.InitPower.set_params(As=As, ns=ns)
+    pars.set_for_lmax(lmax)
+    spectra = camb.get_results(pars).get_cmb_power_spectra(lmax=lmax, CMB_unit='muK')
+    return spectra['total'][:lmax + 1, 0]
+
+
+class CMBSpectrumModel:
+    """D_ℓ do Modelo X com espectros base memorizados
+
+    `ell` são os multipolos observados; `solver(cosmology, lmax)` devolve o
+    espectro de ℓ = 0 a lmax (camb_spectrum por padrão). Os últimos
+    `cache_size` espectros ficam em memória; com `cache_dir` cada espectro
+    também é gravado em disco e reaproveitado entre execuções.
+    """
+
+    def __init__(self, ell, cache_size=128, cache_dir=None, solver=camb_spectrum):
+        self.ell = np.asarray(ell, dtype=float)
+        self.index = self.ell.astype(int)
+        self.lmax = int(self.index.max())
+        self.cache_size = max(1, int(cache_size))
+        self.cache_dir = cache_dir
+        self.solver = solver
+
+        self._spectra = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cosmology_key(cosmology):
+        """Chave do cache: os seis parâmetros cosmológicos como floats"""
+        key = tuple(float(value) for value in cosmology)
+        if len(key) != len(COSMOLOGY_PARAMS):
+            raise ValueError(f"Esperados {len(COSMOLOGY_PARAMS)} parâmetros cosmológicos, recebidos {len(key)}")
+        return key
+
+    def _path(self, key):
+        digest = hashlib.sha256(repr((self.lmax, key)).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}.npy')
+
+    def _load(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            return np.load(self._path(key))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key, spectrum):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.npy.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, spectrum)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def base_spectrum(self, cosmology):
+        """Espectro CAMB nos multipolos observados, sem amortecimento (somente leitura)"""
+        key = self.cosmology_key(cosmology)
+        spectrum = self._spectra.get(key)
+        if spectrum is not None:
+            self._spectra.move_to_end(key)
+            self.hits += 1
+            return spectrum
+
+        full = self._load(key)
+        if full is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            full = np.asarray(self.solver(key, self.lmax), dtype=float)
+            if self.cache_dir:
+                self._store(key, full)
+
+        spectrum = full[self.index]
+        spectrum.setflags(write=False)
+        self._spectra[key] = spectrum
+        if len(self._spectra) > self.cache_size:
+            self._spectra.popitem(last=False)
+        return spectrum
+
+    def damping(self, l0):
+        """Fator de amortecimento exp(-ℓ²/2l0²); l0 pode ser um array (eixo extra à esquerda)"""
+        l0 = np.asarray(l0, dtype=float)[..., None]
+        return np.exp(-self.ell**2 / (2 * l0**2))
+
+    def Dl(self, theta):
+        """D_ℓ(θ) para θ = (H0, ombh2, omch2, tau, As, ns, l0)"""
+        *cosmology, l0 = theta
+        return self.base_spectrum(cosmology) * self.damping(l0)
+
+    __call__ = Dl
+
+    def cache_info(self):
+        """Contadores do cache e taxa de acerto (memória + disco)"""
+        calls = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'size': len(self._spectra),
+            'hit_rate': (self.hits + self.disk_hits) / calls if calls else 0.0,
+        }
+
+    def clear(self):
+        """Esvazia o cache em memória (os arquivos em disco são mantidos)"""
+        self._spectra.clear()
+
+
+class CMBLikelihood:
+    """Log-verossimilhança gaussiana de D_ℓ^TT com priors uniformes
+
+    O erro padrão é 1% do espectro observado, como no ajuste original.
+    Instâncias são serializáveis (pickle) para uso em pools de processos.
+    """
+
+    def __init__(self, ell, Dl_obs, sigma=None, model=None, priors=None):
+        self.ell = np.asarray(ell, dtype=float)
+        self.Dl_obs = np.asarray(Dl_obs, dtype=float)
+        self.sigma = 0.01 * self.Dl_obs if sigma is None else np.asarray(sigma, dtype=float)
+        self.model = model or CMBSpectrumModel(self.ell)
+        priors = priors or PRIORS
+        self.bounds = np.array([priors[name] for name in PARAM_NAMES], dtype=float)
+
+    def in_prior(self, theta):
+        """θ dentro dos limites abertos dos priors"""
+        theta = np.asarray(theta, dtype=float)
+        return bool(np.all((self.bounds[:, 0] < theta) & (theta < self.bounds[:, 1])))
+
+    def chi2(self, Dl_model):
+        """χ² de um ou mais espectros modelo (último eixo = ℓ)"""
+        return np.sum(((self.Dl_obs - Dl_model) / self.sigma)**2, axis=-1)
+
+    def __call__(self, theta):
+        if not self.in_prior(theta):
+            return -np.inf
+        try:
+            return -0.5 * float(self.chi2(self.model.Dl(theta)))
+        except Exception:
+            return -np.inf
+
+
+class SpectrumEmulator:
+    """Emulador polinomial do espectro base: log D_ℓ ≈ Σ c_k(ℓ) · m_k(θ)
+
+    Os seis parâmetros cosmológicos são normalizados para [-1, 1] dentro de
+    `bounds` e os monômios m_k vão até o grau `degree`; os coeficientes de
+    todos os ℓ saem de um único ajuste de mínimos quadrados. Tem a mesma
+    interface de CMBSpectrumModel (base_spectrum, damping, Dl), então pode
+    ser passado como `model` a CMBLikelihood.
+    """
+
+    def __init__(self, ell, bounds, degree=3):
+        self.ell = np.asarray(ell, dtype=float)
+        self.bounds = np.asarray(bounds, dtype=float)
+        if self.bounds.shape != (len(COSMOLOGY_PARAMS), 2):
+            raise ValueError(f"bounds deve ter forma ({len(COSMOLOGY_PARAMS)}, 2)")
+        self.degree = int(degree)
+        self.powers = np.array([p for p in itertools.product(range(self.degree + 1), repeat=len(COSMOLOGY_PARAMS))
+                                if sum(p) <= self.degree])
+        self.coefficients = None
+
+    def features(self, cosmology):
+        """Matriz de monômios (n, n_termos) para uma ou mais cosmologias"""
+        cosmology = np.atleast_2d(np.asarray(cosmology, dtype=float))
+        lower, upper = self.bounds[:, 0], self.bounds[:, 1]
+        x = 2 * (cosmology - lower) / (upper - lower) - 1
+        return np.prod(x[:, None, :] ** self.powers[None, :, :], axis=-1)
+
+    @staticmethod
+    def latin_hypercube(bounds, n_samples, seed=42):
+        """Desenho em hipercubo latino dentro de `bounds` (n_samples, 6)"""
+        from scipy.stats import qmc
+
+        bounds = np.asarray(bounds, dtype=float)
+        unit = qmc.LatinHypercube(d=len(bounds), seed=seed).random(n_samples)
+        return qmc.scale(unit, bounds[:, 0], bounds[:, 1])
+
+    def fit(self, design, spectra):
+        """Ajusta os coeficientes a espectros exatos (n, n_ell) em `design` (n, 6)"""
+        design = np.asarray(design, dtype=float)
+        X = self.features(design)
+        if len(design) < X.shape[1]:
+            raise ValueError(f"São necessários ao menos {X.shape[1]} espectros para grau {self.degree}")
+        self.coefficients, *_ = np.linalg.lstsq(X, np.log(spectra), rcond=None)
+        return self
+
+    @classmethod
+    def train(cls, model, n_samples=300, bounds=None, degree=3, seed=42, processes=None):
+        """Treina com espectros exatos de `model` num hipercubo latino
+
+        Com `processes`, as soluções do treino são distribuídas num pool de
+        processos; sem ele, passam pelo cache de `model`.
+        """
+        if bounds is None:
+            bounds = [PRIORS[name] for name in COSMOLOGY_PARAMS]
+        emulator = cls(model.ell, bounds, degree)
+        design = cls.latin_hypercube(emulator.bounds, n_samples, seed)
+
+        if processes:
+            with Pool(processes) as pool:
+                full = pool.map(partial(model.solver, lmax=model.lmax), [tuple(row) for row in design])
+            spectra = np.array([np.asarray(spectrum, dtype=float)[model.index] for spectrum in full])
+        else:
+            spectra = np.array([model.base_spectrum(row) for row in design])
+        return emulator.fit(design, spectra)
+
+    def base_spectrum(self, cosmology):
+        """Espectro emulado; aceita uma cosmologia (n_ell,) ou várias (n, n_ell)"""
+        if self.coefficients is None:
+            raise RuntimeError("Emulador não treinado: chame fit() ou train()")
+        spectra = np.exp(self.features(cosmology) @ self.coefficients)
+        return spectra[0] if np.ndim(cosmology) == 1 else spectra
+
+    damping = CMBSpectrumModel.damping
+
+    def Dl(self, theta):
+        """D_ℓ(θ) emulado para θ = (H0, ombh2, omch2, tau, As, ns, l0)"""
+        *cosmology, l0 = theta
+        return self.base_spectrum(cosmology) * self.damping(l0)
+
+    __call__ = Dl
+
+    def max_relative_error(self, design, spectra):
+        """Maior erro relativo do emulador contra espectros exatos de validação"""
+        return float(np.max(np.abs(self.base_spectrum(np.atleast_2d(design)) / spectra - 1)))
+
+
+def initial_walkers(n_walkers, center=FIDUCIAL, scale=1e-3, seed=None):
+    """Bola inicial de walkers com perturbação relativa `scale` em torno de `center`"""
+    center = np.asarray(center, dtype=float)
+    rng = np.random.default_rng(seed)
+    return center * (1 + scale * rng.standard_normal((n_walkers, len(center))))
+
+
+# Verossimilhança de cada processo do pool, instalada uma única vez pelo
+# initializer: o modelo (e o seu cache em memória) sobrevive entre avaliações
+_POOL_LOG_PROB = None
+
+
+def _install_log_prob(log_prob):
+    global _POOL_LOG_PROB
+    _POOL_LOG_PROB = log_prob
+
+
+def _pool_log_prob(theta):
+    return _POOL_LOG_PROB(theta)
+
+
+def likelihood_pool(log_prob, processes):
+    """Pool de processos em que cada worker recebe `log_prob` uma vez
+
+    Para mapear θ no pool, use _pool_log_prob em vez de `log_prob`: só a
+    referência à função é serializada por tarefa, não a verossimilhança.
+    """
+    return Pool(processes, initializer=_install_log_prob, initargs=(log_prob,))
+
+
+def run_sampler(log_prob, n_walkers=32, n_steps=500, initial=None, processes=None, seed=None, progress=False):
+    """Roda emcee.EnsembleSampler em série ou com um pool de `processes` processos
+
+    `log_prob` precisa ser serializável para o modo paralelo (CMBLikelihood
+    é). Cada processo recebe a verossimilhança uma vez e mantém seu próprio
+    cache em memória ao longo da cadeia; os contadores de cache_info() do
+    processo pai não incluem os dos workers. Um `cache_dir` no modelo é
+    compartilhado entre eles.
+    """
+    import emcee
+
+    if initial is None:
+        initial = initial_walkers(n_walkers, seed=seed)
+    n_dim = np.shape(initial)[1]
+
+    if not processes:
+        sampler = emcee.EnsembleSampler(n_walkers, n_dim, log_prob)
+        sampler.run_mcmc(initial, n_steps, progress=progress)
+        return sampler
+
+    with likelihood_pool(log_prob, processes) as pool:
+        sampler = emcee.EnsembleSampler(n_walkers, n_dim, _pool_log_prob, pool=pool)
+        sampler.run_mcmc(initial, n_steps, progress=progress)
+    return sampler
+
+
+def verify_exact(samples, surrogate, exact, n_check=16, seed=None):
+    """Confere amostras de uma cadeia emulada com a verossimilhança exata
+
+    Avalia a mediana posterior e `n_check` amostras aleatórias com as duas
+    verossimilhanças e devolve os valores e a maior diferença |Δ ln L|.
+    """
+    samples = np.asarray(samples, dtype=float)
+    rng = np.random.default_rng(seed)
+    picks = samples[rng.choice(len(samples), size=min(n_check, len(samples)), replace=False)]
+    median = np.median(samples, axis=0)
+    points = np.vstack([median, picks])
+
+    surrogate_lnL = np.array([surrogate(theta) for theta in points])
+    exact_lnL = np.array([exact(theta) for theta in points])
+    finite = np.isfinite(surrogate_lnL) & np.isfinite(exact_lnL)
+    return {
+        'median': median,
+        'lnL_surrogate': surrogate_lnL,
+        'lnL_exact': exact_lnL,
+        'max_abs_delta': float(np.max(np.abs(surrogate_lnL - exact_lnL)[finite])) if finite.any() else np.nan,
+    }
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Expansão de Friedmann modulada por X e decoerência de qubit (modelos da v1)
+
+Friedmann modificada (legacy/v1/o.py), com ρ = ρ₀/a³ e X(t) = A·sin(ωt):
+
+    da/dt = a·H,   H² = (8πG/3)·(ρ₀/a³)·(1 + X(t)/κ)
+
+Na variável u = a^{3/2} a equação fica du/dt = (3/2)·√((8πGρ₀/3)(1 + X/κ)),
+que não depende de u: sem a rigidez de a → 0 e com o mesmo passo servindo a
+todo o ensemble. FriedmannEnsemble integra muitos conjuntos (ρ₀, G, A, ω, κ)
+numa única chamada a solve_ivp com RHS vetorizado.
+"""
+
+import numpy as np
+
+KAPPA = np.log(2) / 1.0  # Derivado do FDT, τ_char = 1
+
+
+def qubit_decoherence(t, kappa=KAPPA, n_levels=2):
+    """X(t) e dτ/dt de um sistema de N níveis decoerindo (v1: qubit, N = 2)
+
+    S(t) = ln N·(1 - e^{-t}) (von Neumann, nats), X = ln N - 2S e
+    dτ/dt = exp(-κX). Um array de κ acrescenta um eixo à esquerda de t.
+    """
+    t = np.asarray(t, dtype=float)
+    kappa = np.asarray(kappa, dtype=float)[..., None] if np.ndim(kappa) else kappa
+    S_t = np.log(n_levels) * (1 - np.exp(-t))
+    X_t = np.log(n_levels) - 2 * S_t
+    return X_t * np.ones_like(kappa), np.exp(-kappa * X_t)
+
+
+class FriedmannEnsemble:
+    """Ensemble de cosmologias de Friedmann moduladas por X(t) = A·sin(ωt)
+
+    Os parâmetros aceitam escalares ou arrays 1-D e são combinados por
+    broadcasting num ensemble de `size` membros. A = 0 reproduz a equação
+    original (poeira, sem X).
+    """
+
+    def __init__(self, rho0=1.0, G=1.0, amplitude=0.1, frequency=10.0, kappa=KAPPA):
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float))
+                                       for value in (rho0, G, amplitude, frequency, kappa)))
+        if arrays[0].ndim != 1:
+            raise ValueError("Parâmetros do ensemble devem ser escalares ou arrays 1-D")
+        self.rho0, self.G, self.amplitude, self.frequency, self.kappa = arrays
+
+    @property
+    def size(self):
+        return self.rho0.size
+
+    def X(self, t):
+        """X(t) de cada membro: array (size, n_t)"""
+        t = np.asarray(t, dtype=float)
+        return self.amplitude[:, None] * np.sin(self.frequency[:, None] * np.atleast_1d(t))
+
+    def _H2_scale(self, t):
+        """(8πG/3)·ρ₀·(1 + X/κ): H² = escala / a³"""
+        return (8 * np.pi * self.G[:, None] / 3) * self.rho0[:, None] * (1 + self.X(t) / self.kappa[:, None])
+
+    def rhs(self, t, u):
+        """du/dt para u = a^{3/2}; u tem forma (size,) ou (size, k) (vectorized=True)"""
+        rate = 1.5 * np.sqrt(self._H2_scale(t)[:, 0])
+        return rate if np.ndim(u) == 1 else np.broadcast_to(rate[:, None], np.shape(u)).copy()
+
+    def hubble(self, t, a):
+        """H(t) exato, a partir de a (size, n_t) na grade t"""
+        return np.sqrt(self._H2_scale(t) / np.asarray(a)**3)
+
+    def solve(self, t_eval, a0=0.001, rtol=1e-10, atol=1e-12, dense_output=False, method='RK45'):
+        """Integra todo o ensemble de t_eval[0] a t_eval[-1] com a(t_eval[0]) = a0
+
+        Retorna {'t', 'a' (size, n_t), 'H' (size, n_t), 'nfev', 'interpolant'};
+        com dense_output, interpolant(t) devolve a(t) (size, ...) em qualquer t
+        do intervalo.
+        """
+        from scipy.integrate import solve_ivp
+
+        t_eval = np.asarray(t_eval, dtype=float)
+        u0 = np.broadcast_to(np.asarray(a0, dtype=float), (self.size,))**1.5
+        solution = solve_ivp(self.rhs, (t_eval[0], t_eval[-1]), u0, method=method, t_eval=t_eval,
+                             rtol=rtol, atol=atol, vectorized=True, dense_output=dense_output)
+        if not solution.success:
+            raise RuntimeError(f"Falha na integração de Friedmann: {solution.message}")
+
+        a = solution.y**(2 / 3)
+        dense = solution.sol
+        return {
+            't': t_eval,
+            'a': a,
+            'H': self.hubble(t_eval, a),
+            'nfev': solution.nfev,
+            'interpolant': (lambda t: dense(t)**(2 / 3)) if dense is not None else None,
+        }
+
+    def matter_dominated(self, t, a0=0.001, t0=None):
+        """Solução fechada para A = 0: a^{3/2} = a0^{3/2} + (3/2)·√(8πGρ₀/3)·(t - t0)"""
+        t = np.asarray(t, dtype=float)
+        t0 = t.flat[0] if t0 is None else t0
+        H_scale = np.sqrt(8 * np.pi * self.G * self.rho0 / 3)[:, None]
+        return (np.asarray(a0, dtype=float)**1.5 + 1.5 * H_scale * (t - t0))**(2 / 3)
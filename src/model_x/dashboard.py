@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Painel ASCII ao vivo para simulações do Modelo X Framework"""
+
+import sys
+import time
+
+import numpy as np
+
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
+
+class RunningStats:
+    """Agregados incrementais (Welford) de uma série: média, desvio, min, max, último"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.last = None
+
+    def update(self, value):
+        """Incorpora um novo valor em O(1)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+    @property
+    def std(self):
+        """Desvio padrão populacional"""
+        return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+class LiveDashboard:
+    """Painel ASCII alimentado passo a passo por uma simulação em andamento
+
+    Mantém agregados incrementais de dilatação, entropia e sintropia e as
+    últimas `buffer_size` amostras em buffers circulares de tamanho fixo. O
+    redesenho acontece no máximo a cada `refresh_interval` segundos e custa
+    O(buffer_size), independente do número de passos já executados.
+    """
+
+    FIELDS = (
+        ('dilation', 'τ/τ₀'),
+        ('entropy', 'Entropia'),
+        ('syntropy', 'Sintropia'),
+    )
+
+    def __init__(self, buffer_size=60, refresh_interval=0.25, stream=None, clock=time.monotonic):
+        self.buffer_size = int(buffer_size)
+        self.refresh_interval = refresh_interval
+        self.stream = stream if stream is not None else sys.stdout
+        self.clock = clock
+
+        self.stats = {name: RunningStats() for name, _ in self.FIELDS}
+        self.buffers = {name: np.zeros(self.buffer_size) for name, _ in self.FIELDS}
+        self.position = 0
+        self.last_step = None
+        self.last_time = None
+        self.frames = 0
+
+        self._start = self.clock()
+        self._last_draw = None
+
+    def update(self, entry):
+        """Recebe um registro do histórico ({step, time, state, dilation})"""
+        values = {
+            'dilation': entry['dilation'],
+            'entropy': entry['state']['entropy'],
+            'syntropy': entry['state']['syntropy'],
+        }
+        slot = self.position % self.buffer_size
+        for name, value in values.items():
+            self.stats[name].update(value)
+            self.buffers[name][slot] = value
+
+        self.position += 1
+        self.last_step = entry.get('step', self.position - 1)
+        self.last_time = entry.get('time')
+
+        now = self.clock()
+        if self._last_draw is None or now - self._last_draw >= self.refresh_interval:
+            self.draw(now)
+
+    __call__ = update
+
+    def window(self, name):
+        """Amostras do buffer circular em ordem cronológica"""
+        buffer = self.buffers[name]
+        if self.position < self.buffer_size:
+            return buffer[:self.position]
+        slot = self.position % self.buffer_size
+        return np.concatenate((buffer[slot:], buffer[:slot]))
+
+    @staticmethod
+    def sparkline(values):
+        """Converte uma série em sparkline ASCII"""
+        if len(values) == 0:
+            return ''
+        low, high = values.min(), values.max()
+        if high == low:
+            levels = np.full(len(values), len(SPARK_CHARS) // 2)
+        else:
+            levels = ((values - low) / (high - low) * (len(SPARK_CHARS) - 1)).astype(int)
+        return ''.join(SPARK_CHARS[level] for level in levels)
+
+    def render(self):
+        """Monta o quadro atual do painel"""
+        elapsed = max(self.clock() - self._start, 1e-9)
+        lines = [
+            "=" * 60,
+            f"📊 MODELO X - PAINEL AO VIVO | passo {self.last_step} | "
+            f"{self.position / elapsed:,.0f} passos/s",
+            "=" * 60,
+        ]
+
+        for name, label in self.FIELDS:
+            stats = self.stats[name]
+            if not stats.count:
+                continue
+            lines.append(f"{label:<10}{self.sparkline(self.window(name))}")
+            lines.append(f"{'':<10}Média: {stats.mean:.4f} | Min/Max: {stats.min:.4f} / {stats.max:.4f}"
+                         f" | Atual: {stats.last:.4f}")
+
+        if self.stats['entropy'].count:
+            balance = self.stats['syntropy'].last - self.stats['entropy'].last
+            lines.append(f"\n📊 Balanço Atual: {balance:.4f}")
+        return '\n'.join(lines) + '\n'
+
+    def draw(self, now=None):
+        """Redesenha o painel no stream (limpa a tela em terminais interativos)"""
+        frame = self.render()
+        if getattr(self.stream, 'isatty', lambda: False)():
+            frame = '\x1b[H\x1b[J' + frame
+        self.stream.write(frame)
+        self.stream.flush()
+        self.frames += 1
+        self._last_draw = self.clock() if now is None else now
+
+    def close(self):
+        """Desenha o quadro final"""
+        if self.position:
+            self.draw()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Cache binário (.npy) de tabelas observacionais em texto do Modelo X Framework
+
+Na primeira leitura a tabela de texto é convertida para .npy, com um arquivo
+.json ao lado que guarda o mtime, o tamanho e o SHA-256 da fonte. Nas leituras
+seguintes, se mtime e tamanho conferem, o .npy é mapeado em memória sem
+reprocessar o texto; se só o mtime mudou (cópia, checkout), o hash decide se o
+cache ainda vale. Qualquer outra mudança na fonte reconstrói o cache.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'data'))
+PLANCK_TT = os.path.join(DATA_DIR, 'planck_tt.txt')
+VALIDATION_TABLE = os.path.join(DATA_DIR, 'validation_data.csv')
+
+
+def file_sha256(path, block_size=1 << 20):
+    """SHA-256 do conteúdo de um arquivo, lido em blocos"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_csv_table(path):
+    """CSV com cabeçalho → array estruturado com um campo por coluna"""
+    return np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8')
+
+
+class ArrayCache:
+    """Conversão única de tabelas de texto para .npy mapeado em memória
+
+    `cache_dir` padrão: data/cache/arrays (ignorado pelo git). O nome de cada
+    entrada combina o arquivo de origem com o parser e seus argumentos, então
+    leituras diferentes da mesma fonte não se sobrescrevem.
+    """
+
+    def __init__(self, cache_dir=None, mmap=True):
+        self.cache_dir = cache_dir or os.path.join(DATA_DIR, 'cache', 'arrays')
+        self.mmap = mmap
+        self.hits = 0
+        self.misses = 0
+
+    def paths(self, source, parser, kwargs):
+        """Caminhos (.npy, .json) da entrada de cache de uma leitura"""
+        signature = repr((os.path.abspath(source), getattr(parser, '__qualname__', repr(parser)),
+                          sorted(kwargs.items())))
+        tag = hashlib.sha256(signature.encode('utf-8')).hexdigest()[:16]
+        base = os.path.join(self.cache_dir, f'{os.path.basename(source)}.{tag}')
+        return base + '.npy', base + '.json'
+
+    @staticmethod
+    def _write_atomic(path, write):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _valid(self, source, stat, npy_path, meta_path):
+        """Confere o cache contra a fonte (mtime/tamanho e, se preciso, hash)"""
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not os.path.exists(npy_path) or meta.get('size') != stat.st_size:
+            return False
+        if meta.get('mtime_ns') == stat.st_mtime_ns:
+            return True
+        if meta.get('sha256') != file_sha256(source):
+            return False
+        meta['mtime_ns'] = stat.st_mtime_ns
+        self._write_atomic(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+        return True
+
+    def load(self, source, parser=np.loadtxt, **kwargs):
+        """Array de `parser(source, **kwargs)`, servido pelo cache quando válido"""
+        stat = os.stat(source)
+        npy_path, meta_path = self.paths(source, parser, kwargs)
+
+        if self._valid(source, stat, npy_path, meta_path):
+            self.hits += 1
+        else:
+            self.misses += 1
+            array = np.asarray(parser(source, **kwargs))
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write_atomic(npy_path, lambda f: np.save(f, array))
+            meta = {
+                'source': os.path.abspath(source),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': file_sha256(source),
+            }
+            self._write_atomic(meta_path, lambda f: f.write(json.dumps(meta, indent=2).encode('utf-8')))
+
+        return np.load(npy_path, mmap_mode='r' if self.mmap else None)
+
+    def clear(self):
+        """Remove todas as entradas do diretório de cache"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(('.npy', '.json')):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+_default_cache = None
+
+
+def default_cache():
+    """Instância compartilhada de ArrayCache com o diretório padrão"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ArrayCache()
+    return _default_cache
+
+
+def load_planck_tt(path=PLANCK_TT, cache=None):
+    """Espectro TT do Planck: (ℓ, D_ℓ, -ΔD_ℓ, +ΔD_ℓ) como colunas mapeadas em memória"""
+    table = (cache or default_cache()).load(path)
+    return tuple(table.T)
+
+
+def load_validation_table(path=VALIDATION_TABLE, cache=None):
+    """Tabela de validação (CSV com cabeçalho) como array estruturado"""
+    return (cache or default_cache()).load(path, parser=read_csv_table)
@@ -35,6 +35,44 @@ class EntropySyntropyCalculator:
         
         return max(0.0, min(1.0, normalized_entropy))
     
+    def calculate_shannon_entropy_batch(self, data):
+        """Calcula entropia de Shannon normalizada para cada linha de uma matriz 2-D
+
+        Equivalente a aplicar calculate_shannon_entropy linha a linha, mas sem
+        loop Python: cada linha é ordenada, as sequências de valores iguais são
+        contadas com np.bincount e as somas p·log2(p) são agregadas por linha.
+        """
+        data = np.asarray(data, dtype=float)
+        if data.ndim == 1:
+            data = data[np.newaxis, :]
+
+        n_rows, n_cols = data.shape
+        if n_rows == 0 or n_cols == 0:
+            return np.zeros(n_rows)
+
+        # Marcar início de cada sequência de valores iguais em cada linha ordenada
+        ordered = np.sort(data, axis=1)
+        run_start = np.ones(ordered.shape, dtype=bool)
+        run_start[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+
+        # Identificador global de sequência → contagem de cada valor único
+        run_id = np.cumsum(run_start.ravel()) - 1
+        counts = np.bincount(run_id)
+        run_row = np.nonzero(run_start.ravel())[0] // n_cols
+
+        probabilities = counts / n_cols
+        entropy_bits = -np.bincount(
+            run_row,
+            weights=probabilities * np.log2(probabilities + 1e-15),
+            minlength=n_rows
+        )
+
+        num_unique_values = run_start.sum(axis=1)
+        max_entropy = np.log2(np.maximum(num_unique_values, 2))
+        normalized_entropy = np.where(num_unique_values > 1, entropy_bits / max_entropy, 0.0)
+
+        return np.clip(normalized_entropy, 0.0, 1.0)
+
     def calculate_syntropy(self, data, method="complement"):
         """Calcula sintropia como complemento organizacional da entropia"""
         entropy = self.calculate_shannon_entropy(data)
@@ -45,3 +83,16 @@ class EntropySyntropyCalculator:
             return 1 / (1 + np.exp(-5 * (0.5 - entropy)))
         else:
             return max(0.0, 1.0 - entropy)
+
+    def calculate_syntropy_batch(self, data, method="complement", entropy=None):
+        """Versão vetorizada de calculate_syntropy para cada linha de uma matriz 2-D
+
+        Se `entropy` já tiver sido calculada (calculate_shannon_entropy_batch),
+        ela é reutilizada em vez de recalculada.
+        """
+        if entropy is None:
+            entropy = self.calculate_shannon_entropy_batch(data)
+
+        if method == "logistic":
+            return 1 / (1 + np.exp(-5 * (0.5 - entropy)))
+        return np.maximum(0.0, 1.0 - entropy)
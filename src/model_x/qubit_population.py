@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Populações sintéticas de qubits e regressão T2 × X em blocos
+
+Cada qubit recebe T1 = T1_min + Exp(escala), T2 = T1·U(r_min, r_max) e
+fidelidade 1 - Exp(ε); o indicador do Modelo X é
+
+    X = fidelidade - (1 - min(T2/T1, 1))
+
+e só qubits com X > 0 entram na análise. A geração é vetorizada em blocos
+de `chunk_size` qubits, e a reta T2 = a + b·X é ajustada em forma fechada a
+partir de co-momentos acumulados bloco a bloco (combinação de Chan), global e
+por backend, sem materializar a população inteira.
+"""
+
+import numpy as np
+
+
+class QubitPopulation:
+    """Gerador vetorizado de qubits simulados distribuídos em vários backends"""
+
+    def __init__(self, n_qubits=50, n_backends=1, t1_min=100.0, t1_scale=100.0,
+                 t2_ratio=(0.5, 1.0), infidelity=0.001, seed=42, backend_prefix='mock_backend'):
+        if n_qubits < 1 or n_backends < 1:
+            raise ValueError("n_qubits e n_backends devem ser positivos")
+        self.n_qubits = int(n_qubits)
+        self.n_backends = int(n_backends)
+        self.t1_min = t1_min
+        self.t1_scale = t1_scale
+        self.t2_ratio = t2_ratio
+        self.infidelity = infidelity
+        self.seed = seed
+        self.backend_prefix = backend_prefix
+
+    @property
+    def backend_names(self):
+        """Nomes dos backends, indexados pelo campo 'backend' dos blocos"""
+        return [f'{self.backend_prefix}_{i}' for i in range(self.n_backends)]
+
+    def _draw(self, streams, start, size):
+        """Sorteia um bloco de qubits a partir do índice global `start`"""
+        t1_rng, t2_rng, fidelity_rng = streams
+        index = np.arange(start, start + size)
+        T1 = t1_rng.exponential(self.t1_scale, size)
+        T1 += self.t1_min
+        T2 = t2_rng.uniform(*self.t2_ratio, size)
+        T2 *= T1
+        fidelity = 1.0 - fidelity_rng.exponential(self.infidelity, size)
+
+        X = np.divide(T2, T1)
+        np.minimum(X, 1.0, out=X)
+        X -= 1.0
+        X += fidelity
+
+        keep = X > 0
+        return {
+            'backend': (index % self.n_backends)[keep],
+            'qubit': (index // self.n_backends)[keep],
+            'T1': T1[keep],
+            'T2': T2[keep],
+            'fidelity': fidelity[keep],
+            'X': X[keep],
+        }
+
+    def chunks(self, chunk_size=1_000_000):
+        """Gera blocos (dict de arrays) de no máximo `chunk_size` qubits sorteados
+
+        Os qubits são distribuídos em rodízio entre os backends. T1, T2 e a
+        fidelidade vêm de fluxos aleatórios independentes, então a população
+        depende só da semente, não de `chunk_size`.
+        """
+        streams = [np.random.default_rng(seed) for seed in np.random.SeedSequence(self.seed).spawn(3)]
+        chunk_size = max(1, int(chunk_size))
+        for start in range(0, self.n_qubits, chunk_size):
+            yield self._draw(streams, start, min(chunk_size, self.n_qubits - start))
+
+    def generate(self, chunk_size=1_000_000):
+        """População filtrada completa como dict de arrays"""
+        blocks = list(self.chunks(chunk_size))
+        return {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
+
+
+class StreamingRegression:
+    """Regressão linear y = a + b·x por grupo a partir de co-momentos acumulados
+
+    update() recebe blocos (x, y, grupo) e combina contagens, médias e
+    co-momentos com os acumulados (algoritmo de Chan), o que mantém a
+    precisão para milhões de pontos sem guardar os dados.
+    """
+
+    def __init__(self, n_groups=1):
+        self.n_groups = int(n_groups)
+        self.count = np.zeros(self.n_groups)
+        self.mean_x = np.zeros(self.n_groups)
+        self.mean_y = np.zeros(self.n_groups)
+        self.m_xx = np.zeros(self.n_groups)
+        self.m_xy = np.zeros(self.n_groups)
+        self.m_yy = np.zeros(self.n_groups)
+
+    def update(self, x, y, groups=None):
+        """Incorpora um bloco; `groups` são índices inteiros em [0, n_groups)"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        groups = np.zeros(x.size, dtype=int) if groups is None else np.asarray(groups)
+
+        n = np.bincount(groups, minlength=self.n_groups).astype(float)
+        safe = np.maximum(n, 1)
+        mx = np.bincount(groups, x, self.n_groups) / safe
+        my = np.bincount(groups, y, self.n_groups) / safe
+        dx = x - mx[groups]
+        dy = y - my[groups]
+        cxx = np.bincount(groups, dx * dx, self.n_groups)
+        cxy = np.bincount(groups, dx * dy, self.n_groups)
+        cyy = np.bincount(groups, dy * dy, self.n_groups)
+
+        total = self.count + n
+        weight = np.divide(self.count * n, total, out=np.zeros_like(total), where=total > 0)
+        delta_x = mx - self.mean_x
+        delta_y = my - self.mean_y
+        self.m_xx += cxx + weight * delta_x**2
+        self.m_xy += cxy + weight * delta_x * delta_y
+        self.m_yy += cyy + weight * delta_y**2
+        fraction = np.divide(n, total, out=np.zeros_like(total), where=total > 0)
+        self.mean_x += fraction * delta_x
+        self.mean_y += fraction * delta_y
+        self.count = total
+        return self
+
+    @staticmethod
+    def _fit(count, mean_x, mean_y, m_xx, m_xy, m_yy):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = m_xy / m_xx
+            intercept = mean_y - slope * mean_x
+            r2 = m_xy**2 / (m_xx * m_yy)
+        return {'n': count, 'intercept': intercept, 'slope': slope, 'r2': r2}
+
+    def fit(self):
+        """Coeficientes por grupo (arrays de n_groups; NaN em grupos vazios)"""
+        return self._fit(self.count, self.mean_x, self.mean_y, self.m_xx, self.m_xy, self.m_yy)
+
+    def fit_total(self):
+        """Coeficientes da população inteira (combinação de todos os grupos)"""
+        count = self.count.sum()
+        weights = self.count / count
+        mean_x = weights @ self.mean_x
+        mean_y = weights @ self.mean_y
+        dx = self.mean_x - mean_x
+        dy = self.mean_y - mean_y
+        result = self._fit(count, mean_x, mean_y,
+                           self.m_xx.sum() + self.count @ dx**2,
+                           self.m_xy.sum() + self.count @ (dx * dy),
+                           self.m_yy.sum() + self.count @ dy**2)
+        return {name: float(value) for name, value in result.items()}
+
+
+def fit_t2_vs_x(population, chunk_size=1_000_000):
+    """Ajusta T2 = a + b·X bloco a bloco: (regressão acumulada, qubits retidos)"""
+    regression = StreamingRegression(population.n_backends)
+    kept = 0
+    for block in population.chunks(chunk_size):
+        regression.update(block['X'], block['T2'], block['backend'])
+        kept += block['X'].size
+    return regression, kept
@@ -10,6 +10,23 @@ class SimulationEngine:
         self.dt = dt
         self.max_steps = max_steps
         self.history = []
+        self.subscribers = []
+    
+    def subscribe(self, callback):
+        """Registra callback chamado com cada registro do histórico durante a simulação"""
+        self.subscribers.append(callback)
+        return callback
+    
+    def unsubscribe(self, callback):
+        """Remove callback registrado com subscribe"""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+    
+    def _record(self, entry):
+        """Adiciona registro ao histórico e notifica os assinantes"""
+        self.history.append(entry)
+        for callback in self.subscribers:
+            callback(entry)
     
     def run_simulation(self, initial_state, simulation_type="deterministic"):
         """Executa simulação temporal"""
@@ -26,7 +43,7 @@ class SimulationEngine:
         # Registrar estado inicial exato
         initial_dilation = state['energy'] * (1.0 + state['syntropy'] - state['entropy'])
         
-        self.history.append({
+        self._record({
             'step': 0,
             'time': 0,
             'state': state.copy(),
@@ -48,7 +65,7 @@ class SimulationEngine:
             state['syntropy'] = max(0.0, min(1.0, state['syntropy']))
             state['energy'] = max(0.1, state['energy'])
             
-            self.history.append({
+            self._record({
                 'step': step,
                 'time': step * self.dt,
                 'state': state.copy(),
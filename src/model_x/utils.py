@@ -129,10 +129,23 @@ class ValidationUtils:
         }
 
         # Score de validação (0-100)
-        max_allowed_error = 0.3
-        entropy_score = max(0, 100 * (1 - metrics['entropy_error'] / max_allowed_error))
-        syntropy_score = max(0, 100 * (1 - metrics['syntropy_error'] / max_allowed_error))
-
-        metrics['validation_score'] = (entropy_score + syntropy_score) / 2
+        metrics['validation_score'] = ValidationUtils.validation_score(
+            metrics['entropy_error'], metrics['syntropy_error']
+        )
 
         return metrics
+
+    @staticmethod
+    def validation_score(entropy_error, syntropy_error, max_allowed_error=0.3):
+        """Score de validação (0-100) a partir dos erros de entropia e sintropia
+
+        Aceita escalares ou arrays NumPy (avaliação vetorizada de reamostragens).
+        """
+        if np.ndim(entropy_error) == 0 and np.ndim(syntropy_error) == 0:
+            entropy_score = max(0, 100 * (1 - entropy_error / max_allowed_error))
+            syntropy_score = max(0, 100 * (1 - syntropy_error / max_allowed_error))
+        else:
+            entropy_score = np.maximum(0, 100 * (1 - np.asarray(entropy_error) / max_allowed_error))
+            syntropy_score = np.maximum(0, 100 * (1 - np.asarray(syntropy_error) / max_allowed_error))
+
+        return (entropy_score + syntropy_score) / 2
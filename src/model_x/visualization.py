@@ -5,14 +5,23 @@ import os
 import json
 from datetime import datetime
 
+import numpy as np
+
+from .dashboard import LiveDashboard
+
 class ModelXVisualizer:
     """Cria visualizações texto e exporta dados para plotagem externa"""
     
     def __init__(self):
         self.data_export = []
     
-    def export_simulation_data(self, simulation_history, filename='simulation_data.json'):
-        """Exporta dados da simulação para visualização externa"""
+    def export_simulation_data(self, simulation_history, filename='simulation_data.json',
+                               max_points=None, method='minmax', downsample_by='dilation'):
+        """Exporta dados da simulação para visualização externa
+
+        Com `max_points`, históricos maiores são reduzidos antes da exportação
+        (ver downsample), usando a série `downsample_by` para escolher os pontos.
+        """
         export_data = {
             'time': [h['time'] for h in simulation_history],
             'dilation': [h['dilation'] for h in simulation_history],
@@ -20,6 +29,13 @@ class ModelXVisualizer:
             'syntropy': [h['state']['syntropy'] for h in simulation_history],
             'energy': [h['state']['energy'] for h in simulation_history]
         }
+
+        if max_points is not None and len(simulation_history) > max_points:
+            indices = self.downsample(export_data[downsample_by], max_points, method)
+            export_data = {
+                key: np.asarray(values)[indices].tolist()
+                for key, values in export_data.items()
+            }
         
         # Usar caminho absoluto e garantir diretório
         full_path = os.path.abspath(filename)
@@ -31,25 +47,106 @@ class ModelXVisualizer:
         print(f"✅ Dados exportados para {filename}")
         return filename
     
+    @staticmethod
+    def _minmax_indices(values, bucket_ids):
+        """Índices (ordenados) do mínimo e do máximo de cada bucket contíguo"""
+        starts = np.flatnonzero(np.r_[True, bucket_ids[1:] != bucket_ids[:-1]])
+        counts = np.diff(np.r_[starts, len(values)])
+        bucket_of = np.repeat(np.arange(len(starts)), counts)
+
+        selected = []
+        for reducer in (np.minimum, np.maximum):
+            extreme = reducer.reduceat(values, starts)
+            hits = np.flatnonzero(values == extreme[bucket_of])
+            first = np.r_[True, bucket_of[hits[1:]] != bucket_of[hits[:-1]]]
+            selected.append(hits[first])
+
+        return np.union1d(*selected)
+
+    @staticmethod
+    def _lttb_indices(values, n_out):
+        """Índices escolhidos por Largest-Triangle-Three-Buckets"""
+        n = len(values)
+        edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+        x = np.arange(n, dtype=float)
+
+        indices = np.empty(n_out, dtype=int)
+        indices[0], indices[-1] = 0, n - 1
+        for k in range(n_out - 2):
+            start, stop = edges[k], edges[k + 1]
+            if k + 2 < len(edges):
+                next_start, next_stop = edges[k + 1], edges[k + 2]
+            else:
+                next_start, next_stop = n - 1, n
+
+            # Vértice do triângulo: média do bucket seguinte
+            avg_x = x[next_start:next_stop].mean()
+            avg_y = values[next_start:next_stop].mean()
+
+            prev = indices[k]
+            area = np.abs((x[prev] - avg_x) * (values[start:stop] - values[prev])
+                          - (x[prev] - x[start:stop]) * (avg_y - values[prev]))
+            indices[k + 1] = start + int(np.argmax(area))
+
+        return indices
+
+    @staticmethod
+    def downsample(data, n_out, method='minmax'):
+        """Seleciona no máximo `n_out` índices representativos de uma série
+
+        - 'minmax': mínimo e máximo de cada um de n_out//2 buckets (preserva picos)
+        - 'lttb': Largest-Triangle-Three-Buckets (preserva a forma visual)
+
+        Custo O(n) em NumPy; retorna os índices ordenados, que podem ser usados
+        para reduzir todas as séries paralelas (tempo, entropia, ...).
+        """
+        values = np.asarray(data, dtype=float)
+        n = len(values)
+        if n <= n_out or n_out < 2:
+            return np.arange(n)
+
+        if method == 'lttb':
+            return ModelXVisualizer._lttb_indices(values, n_out)
+
+        n_buckets = max(1, n_out // 2)
+        bucket_ids = np.arange(n) * n_buckets // n
+        return ModelXVisualizer._minmax_indices(values, bucket_ids)
+
     def ascii_plot(self, data, title="Gráfico ASCII", width=60, height=15):
-        """Cria gráfico ASCII simples"""
-        if not data:
+        """Cria gráfico ASCII simples
+
+        Séries com mais de 2×width pontos são reduzidas ao mínimo e máximo de
+        cada coluna antes de plotar, mantendo os picos visíveis.
+        """
+        if data is None or len(data) == 0:
             return "Sem dados"
         
+        values = np.asarray(data, dtype=float)
+        n = len(values)
+        
+        # Coluna de cada ponto; em séries longas mantém só extremos por coluna
+        indices = np.arange(n)
+        if n > 1:
+            columns = (indices * (width-1) / (n-1)).astype(int)
+        else:
+            columns = np.zeros(1, dtype=int)
+        if n > 2 * width:
+            indices = self._minmax_indices(values, columns)
+            columns = columns[indices]
+        
         # Normalizar dados para 0-altura
-        min_val = min(data)
-        max_val = max(data)
+        min_val = float(values.min())
+        max_val = float(values.max())
         if max_val == min_val:
-            normalized = [height//2] * len(data)
+            normalized = np.full(len(indices), height//2)
         else:
-            normalized = [int((val - min_val) / (max_val - min_val) * (height-1)) for val in data]
+            normalized = ((values[indices] - min_val) / (max_val - min_val) * (height-1)).astype(int)
         
         # Criar grid
         grid = [[' ' for _ in range(width)] for _ in range(height)]
         
         # Plotar pontos
-        for i, val in enumerate(normalized):
-            x = int(i * (width-1) / (len(data)-1)) if len(data) > 1 else 0
+        for x, val in zip(columns.tolist(), normalized.tolist()):
             y = height - 1 - val
             if 0 <= y < height and 0 <= x < width:
                 grid[y][x] = '*'
@@ -101,6 +198,130 @@ class ModelXVisualizer:
         ascii_chart = self.ascii_plot(dilations, "τ/τ₀ ao longo do tempo")
         print(ascii_chart)
     
+    ENSEMBLE_FIELDS = (
+        ('dilation', '📈 Dilatação Temporal', 'τ/τ₀'),
+        ('entropy', '🧮 Entropia', 'Entropia'),
+        ('syntropy', '🎯 Sintropia', 'Sintropia'),
+    )
+    
+    @staticmethod
+    def ensemble_arrays(histories):
+        """Converte N históricos de simulação em arrays (N, passos) por campo
+
+        Históricos mais curtos são completados com NaN, ignorados nos percentis.
+        """
+        n_steps = max((len(h) for h in histories), default=0)
+        arrays = {name: np.full((len(histories), n_steps), np.nan)
+                  for name, _, _ in ModelXVisualizer.ENSEMBLE_FIELDS}
+        
+        for row, history in enumerate(histories):
+            if not history:
+                continue
+            arrays['dilation'][row, :len(history)] = [h['dilation'] for h in history]
+            arrays['entropy'][row, :len(history)] = [h['state']['entropy'] for h in history]
+            arrays['syntropy'][row, :len(history)] = [h['state']['syntropy'] for h in history]
+        
+        return arrays
+    
+    @staticmethod
+    def ensemble_bands(arrays, percentiles=(5, 50, 95)):
+        """Percentis por passo de cada campo: dict campo → array (len(percentiles), passos)"""
+        bands = {}
+        for name, values in arrays.items():
+            values = np.asarray(values, dtype=float)
+            # nanpercentile é bem mais lento; só usar quando há trajetórias incompletas
+            percentile = np.nanpercentile if np.isnan(values).any() else np.percentile
+            bands[name] = percentile(values, percentiles, axis=0)
+        return bands
+    
+    def ascii_band_plot(self, lower, median, upper, title="Banda de Percentis", width=60, height=15):
+        """Gráfico ASCII de banda: ':' entre os percentis inferior/superior, '*' na mediana"""
+        lower, median, upper = (np.asarray(v, dtype=float) for v in (lower, median, upper))
+        n = len(median)
+        if n == 0:
+            return "Sem dados"
+        
+        # Agregar passos por coluna: envelope da banda e média da mediana
+        columns = (np.arange(n) * (width-1) / (n-1)).astype(int) if n > 1 else np.zeros(1, dtype=int)
+        starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+        counts = np.diff(np.r_[starts, n])
+        col_low = np.fmin.reduceat(lower, starts)
+        col_high = np.fmax.reduceat(upper, starts)
+        col_mid = np.add.reduceat(median, starts) / counts
+        
+        min_val = float(np.nanmin(col_low))
+        max_val = float(np.nanmax(col_high))
+        span = max_val - min_val
+        
+        def to_row(values):
+            if span == 0:
+                return np.full(len(values), height//2)
+            return ((values - min_val) / span * (height-1)).astype(int)
+        
+        y_low, y_high, y_mid = (height - 1 - to_row(v) for v in (col_low, col_high, col_mid))
+        rows = np.arange(height)[:, np.newaxis]
+        
+        grid = np.full((height, width), ' ')
+        band = grid[:, columns[starts]]
+        band[(rows <= y_low) & (rows >= y_high)] = ':'
+        band[rows == y_mid] = '*'
+        grid[:, columns[starts]] = band
+        
+        result = f"\n{title}\n"
+        result += f"Min: {min_val:.3f} | Max: {max_val:.3f}\n"
+        result += '+' + '-'*width + '+\n'
+        for row in grid:
+            result += '|' + ''.join(row) + '|\n'
+        result += '+' + '-'*width + '+\n'
+        return result
+    
+    def print_ensemble_summary(self, ensemble, percentiles=(5, 50, 95), width=60, height=10):
+        """Imprime, numa única tela, bandas de percentis de um ensemble de simulações
+
+        `ensemble` pode ser uma lista de N históricos ou um dict campo → array
+        (N, passos). Os percentis são calculados de forma vetorizada por passo.
+        """
+        arrays = ensemble if isinstance(ensemble, dict) else self.ensemble_arrays(ensemble)
+        if not arrays or any(np.size(arrays.get(name, [])) == 0 for name, _, _ in self.ENSEMBLE_FIELDS):
+            print("⚠️  Sem dados de simulação")
+            return None
+        
+        arrays = {name: np.asarray(arrays[name], dtype=float) for name, _, _ in self.ENSEMBLE_FIELDS}
+        bands = self.ensemble_bands(arrays, percentiles)
+        labels = '/'.join(f"p{p:g}" for p in percentiles)
+        n_runs, n_steps = arrays['dilation'].shape
+        
+        print("\n" + "="*60)
+        print(f"📊 RESUMO DO ENSEMBLE ({n_runs} trajetórias, {n_steps} passos)")
+        print("="*60)
+        
+        for name, header, _ in self.ENSEMBLE_FIELDS:
+            run_means = np.nanmean(arrays[name], axis=1)
+            final = bands[name][:, -1]
+            print(f"{header}:")
+            print(f"   Média ({labels}): " + " / ".join(f"{v:.4f}" for v in np.percentile(run_means, percentiles)))
+            print(f"   Final ({labels}): " + " / ".join(f"{v:.4f}" for v in final))
+        print("="*60)
+        
+        for name, _, short in self.ENSEMBLE_FIELDS:
+            band = bands[name]
+            print(self.ascii_band_plot(band[0], band[len(percentiles)//2], band[-1],
+                                       f"{short} - banda {labels}", width, height))
+        
+        return bands
+    
+    def live_dashboard(self, simulation_engine=None, buffer_size=60, refresh_interval=0.25, stream=None):
+        """Cria painel ASCII ao vivo (LiveDashboard)
+
+        Se `simulation_engine` for informado, o painel assina o progresso da
+        simulação e é atualizado a cada passo; caso contrário, chame
+        `dashboard.update(registro)` manualmente.
+        """
+        dashboard = LiveDashboard(buffer_size=buffer_size, refresh_interval=refresh_interval, stream=stream)
+        if simulation_engine is not None:
+            simulation_engine.subscribe(dashboard)
+        return dashboard
+    
     def generate_report(self, domains_data, output_file='validation_report.txt'):
         """Gera relatório de validação para múltiplos domínios"""
         report = []
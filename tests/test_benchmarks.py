@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Testes da suite de benchmarks (execução mínima e comparação com baseline)"""
+
+import sys
+sys.path.insert(0, 'benchmarks')
+import unittest
+import bench_model_x
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_run_benchmarks_minimal(self):
+        """Testa execução com tamanho e repetição mínimos"""
+        results = bench_model_x.run_benchmarks(
+            sizes=[100], names=['calculate_shannon_entropy', 'get_statistics', 'pipeline'],
+            repeat=1, number=1, verbose=False
+        )
+
+        self.assertIn('metadata', results)
+        self.assertEqual(results['metadata']['seed'], bench_model_x.SEED)
+        self.assertEqual(len(results['results']), 3)
+        for entry in results['results']:
+            self.assertEqual(entry['size'], 100)
+            self.assertGreater(entry['best'], 0)
+
+    def test_max_size_skips_large_inputs(self):
+        """Testa que tamanhos acima do limite do benchmark são ignorados"""
+        results = bench_model_x.run_benchmarks(
+            sizes=[100, 10**6], names=['export_simulation_data'],
+            repeat=1, number=1, verbose=False
+        )
+        self.assertEqual([r['size'] for r in results['results']], [100])
+
+    def test_unknown_benchmark(self):
+        """Testa erro para benchmark inexistente"""
+        with self.assertRaises(ValueError):
+            bench_model_x.run_benchmarks(names=['inexistente'], verbose=False)
+
+    def test_compare_results_flags_regressions(self):
+        """Testa detecção de regressões acima do limiar"""
+        baseline = {'results': [
+            {'benchmark': 'ascii_plot', 'size': 100, 'best': 1.0},
+            {'benchmark': 'get_statistics', 'size': 100, 'best': 1.0}
+        ]}
+        current = {'results': [
+            {'benchmark': 'ascii_plot', 'size': 100, 'best': 1.5},
+            {'benchmark': 'get_statistics', 'size': 100, 'best': 1.1},
+            {'benchmark': 'pipeline', 'size': 100, 'best': 9.0}
+        ]}
+
+        regressions = bench_model_x.compare_results(baseline, current, threshold=0.2)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]['benchmark'], 'ascii_plot')
+        self.assertAlmostEqual(regressions[0]['ratio'], 1.5)
+
+    def test_compare_command_exit_code(self):
+        """Testa código de saída do comando compare"""
+        import json
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, 'baseline.json')
+            current = os.path.join(tmp, 'current.json')
+            with open(baseline, 'w') as f:
+                json.dump({'results': [{'benchmark': 'ascii_plot', 'size': 100, 'best': 1.0}]}, f)
+            with open(current, 'w') as f:
+                json.dump({'results': [{'benchmark': 'ascii_plot', 'size': 100, 'best': 3.0}]}, f)
+
+            self.assertEqual(bench_model_x.main(['compare', baseline, current]), 1)
+            self.assertEqual(bench_model_x.main(['compare', baseline, baseline]), 0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para BootstrapValidator"""
+
+import sys
+sys.path.insert(0, 'src')
+import unittest
+import numpy as np
+from model_x import BootstrapValidator, EntropySyntropyCalculator, ValidationUtils
+
+class TestBootstrapValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.bootstrap = BootstrapValidator(n_resamples=500, seed=7, batch_size=128)
+        self.calc = EntropySyntropyCalculator()
+
+    def test_resample_metrics_shape(self):
+        """Testa que todas as reamostragens são avaliadas"""
+        data = np.random.default_rng(0).integers(0, 6, 80)
+        samples = self.bootstrap.resample_metrics(
+            data, {'expected_entropy': 0.9, 'expected_syntropy': 0.1}
+        )
+
+        for name in ('entropy', 'syntropy', 'validation_score'):
+            self.assertEqual(samples[name].shape, (500,))
+        self.assertTrue(np.all((samples['entropy'] >= 0) & (samples['entropy'] <= 1)))
+        self.assertTrue(np.all((samples['validation_score'] >= 0) & (samples['validation_score'] <= 100)))
+
+    def test_resamples_match_scalar_path(self):
+        """Testa que o caminho em lote reproduz calculate_shannon_entropy"""
+        data = np.random.default_rng(1).poisson(5, 60)
+        rng = np.random.default_rng(self.bootstrap.seed)
+        indices = rng.integers(0, len(data), size=(self.bootstrap.n_resamples, len(data)))
+        expected = [self.calc.calculate_shannon_entropy(data[row]) for row in indices[:128]]
+
+        samples = self.bootstrap.resample_metrics(data)
+        np.testing.assert_allclose(samples['entropy'][:128], expected, atol=1e-12)
+
+    def test_confidence_interval_contains_point(self):
+        """Testa que o IC contém a estimativa pontual"""
+        datasets = ValidationUtils.create_default_datasets()
+        results = self.bootstrap.bootstrap_dataset(datasets['network']['data'], datasets['network'])
+
+        for name in ('entropy', 'syntropy', 'validation_score'):
+            self.assertLessEqual(results[name]['lower'], results[name]['upper'])
+        self.assertLessEqual(results['syntropy']['lower'], results['syntropy']['point'] + 1e-9)
+        self.assertEqual(results['n_resamples'], 500)
+
+    def test_reproducible_with_seed(self):
+        """Testa reprodutibilidade com semente fixa"""
+        data = list(range(10)) * 5
+        first = self.bootstrap.bootstrap_dataset(data)
+        second = self.bootstrap.bootstrap_dataset(data)
+        self.assertEqual(first, second)
+
+    def test_bootstrap_datasets(self):
+        """Testa bootstrap de múltiplos domínios"""
+        datasets = ValidationUtils.create_default_datasets()
+        results = self.bootstrap.bootstrap_datasets(datasets)
+        self.assertEqual(set(results), set(datasets))
+        self.assertIn('validation_score', results['finance'])
+
+    def test_invalid_parameters(self):
+        """Testa validação de parâmetros"""
+        with self.assertRaises(ValueError):
+            BootstrapValidator(n_resamples=0)
+        with self.assertRaises(ValueError):
+            BootstrapValidator(confidence=1.5)
+        self.assertIn('error', self.bootstrap.bootstrap_dataset([]))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Testes de concorrência do /chat (busca web e memória em paralelo, lock por conversa)"""
+
+import sys
+sys.path.insert(0, 'modelx-agent')
+import asyncio
+import importlib.util
+import threading
+import time
+import unittest
+from unittest import mock
+from backend.web_tools import WebSearchEngine
+
+HAS_FASTAPI = all(importlib.util.find_spec(m) is not None for m in ('fastapi', 'httpx'))
+
+
+class TestRateLimit(unittest.TestCase):
+
+    def test_concurrent_searches_are_spaced(self):
+        """Testa que buscas em threads diferentes respeitam o intervalo mínimo"""
+        engine = WebSearchEngine()
+        engine.min_request_interval = 0.05
+        times = []
+
+        def search():
+            engine._rate_limit()
+            times.append(time.time())
+
+        threads = [threading.Thread(target=search) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        gaps = [b - a for a, b in zip(sorted(times), sorted(times)[1:])]
+        self.assertEqual(len(gaps), 3)
+        self.assertTrue(all(gap >= 0.045 for gap in gaps), gaps)
+
+
+@unittest.skipUnless(HAS_FASTAPI, "fastapi/httpx não instalados")
+class TestChatConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        from backend import main
+        from backend.conversation_store import ConversationStore
+
+        self.main = main
+        self.calls = []
+        self.store = ConversationStore(db_path=None)
+
+        def timed(name, seconds, result):
+            def call(*args, **kwargs):
+                start = time.monotonic()
+                time.sleep(seconds)
+                self.calls.append((name, args[0], start, time.monotonic()))
+                return result(*args)
+            return call
+
+        for patcher in (
+            mock.patch.object(main, 'CONVERSATIONS', self.store),
+            mock.patch.object(main, 'WEB_AND_LEARNING_AVAILABLE', True),
+            mock.patch.object(main, 'needs_web', lambda message: True),
+            mock.patch.object(main, 'smart_search', timed('web', 0.2, lambda message: {
+                'searched': True, 'sources': ['https://example.org'], 'content': 'contexto web'})),
+            mock.patch.object(main, 'load_learning_context', timed('memory', 0.2, lambda cid, message: ('', ''))),
+            mock.patch.object(main, 'generate_answer', timed('llm', 0.1, lambda message, E, sigma_S_X, state:
+                                                              main.build_answer('resposta', E, sigma_S_X))),
+            mock.patch.object(main, 'save_interaction', lambda **kwargs: None),
+            mock.patch.object(main, 'update_parameters', lambda *a, **k: None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def post_all(self, *bodies):
+        import httpx
+
+        async def run():
+            transport = httpx.ASGITransport(app=self.main.app)
+            async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+                return await asyncio.gather(*(client.post('/chat', json=body) for body in bodies))
+
+        responses = asyncio.run(run())
+        for response in responses:
+            self.assertEqual(response.status_code, 200, response.text)
+        return [response.json() for response in responses]
+
+    def interval(self, name, key):
+        [(start, end)] = [(s, e) for n, k, s, e in self.calls if n == name and k == key]
+        return start, end
+
+    def test_web_and_memory_run_concurrently(self):
+        """Testa que busca web e memória se sobrepõem dentro de um turno"""
+        [answer] = self.post_all({'conversation_id': 'c1', 'message': 'notícias de hoje'})
+        self.assertTrue(answer['web_search_used'])
+
+        web = self.interval('web', 'notícias de hoje')
+        memory = self.interval('memory', 'c1')
+        self.assertLess(max(web[0], memory[0]), min(web[1], memory[1]))
+
+    def test_same_conversation_is_serialized(self):
+        """Testa que turnos da mesma conversa rodam um depois do outro"""
+        self.post_all(
+            {'conversation_id': 'c1', 'message': 'primeira'},
+            {'conversation_id': 'c1', 'message': 'segunda'},
+            {'conversation_id': 'c2', 'message': 'outra conversa'},
+        )
+        earlier, later = sorted(('primeira', 'segunda'), key=lambda m: self.interval('llm', m)[0])
+        earlier_end = self.interval('llm', earlier)[1]
+        self.assertGreaterEqual(self.interval('web', later)[0], earlier_end)
+        self.assertGreaterEqual(self.interval('llm', later)[0], earlier_end)
+
+        # Conversas diferentes não esperam uma pela outra
+        other = self.interval('memory', 'c2')
+        self.assertLess(other[0], earlier_end)
+        self.assertEqual([m.role for m in self.store.get('c1').messages], ['user', 'assistant'] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o modelo de espectro TT da CMB"""
+
+import sys
+sys.path.insert(0, 'src')
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from model_x import CMBSpectrumModel, CMBLikelihood
+from model_x.cmb import (FIDUCIAL, camb_spectrum, SpectrumEmulator, initial_walkers,
+                         likelihood_pool, run_sampler, verify_exact, _pool_log_prob)
+
+try:
+    import camb
+except ImportError:
+    camb = None
+
+try:
+    import emcee
+except ImportError:
+    emcee = None
+
+
+class CountingSolver:
+    """Espectro analítico barato que conta as soluções pedidas"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, cosmology, lmax):
+        self.calls += 1
+        H0, ombh2, omch2, tau, As, ns = cosmology
+        ell = np.arange(lmax + 1)
+        return As * 1e9 * H0 * (1 + np.cos(ell * omch2)) * np.exp(-2 * tau) * (ell + 1.0)**(ns - 1)
+
+
+class FileCountingSolver(CountingSolver):
+    """CountingSolver que registra cada solução num arquivo (conta entre processos)"""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def __call__(self, cosmology, lmax):
+        with open(self.path, 'a') as f:
+            f.write(f'{os.getpid()}\n')
+        return super().__call__(cosmology, lmax)
+
+    def pids(self):
+        with open(self.path) as f:
+            return f.read().split()
+
+
+class TestCMBSpectrumModel(unittest.TestCase):
+
+    def setUp(self):
+        self.ell = np.arange(2, 300, dtype=float)
+        self.solver = CountingSolver()
+        self.model = CMBSpectrumModel(self.ell, cache_size=3, solver=self.solver)
+
+    def test_l0_only_changes_skip_solver(self):
+        """Testa que mudar só l0 reaproveita o espectro base"""
+        theta = np.array(FIDUCIAL)
+        first = self.model.Dl(theta)
+        for l0 in (20.0, 80.0, 400.0):
+            theta[-1] = l0
+            Dl = self.model.Dl(theta)
+            np.testing.assert_allclose(Dl, self.model.base_spectrum(theta[:-1]) * np.exp(-self.ell**2 / (2 * l0**2)))
+        self.assertEqual(self.solver.calls, 1)
+        self.assertEqual(first.shape, self.ell.shape)
+        self.assertGreater(self.model.cache_info()['hit_rate'], 0.5)
+
+    def test_spectrum_indexed_by_multipole(self):
+        """Testa que o espectro é lido nos ℓ observados (não a partir de ℓ = 0)"""
+        full = self.solver(FIDUCIAL[:-1], int(self.ell.max()))
+        np.testing.assert_array_equal(self.model.base_spectrum(FIDUCIAL[:-1]), full[2:])
+
+    def test_lru_eviction(self):
+        """Testa que o cache em memória guarda só os últimos cache_size espectros"""
+        cosmologies = [(67.0 + i, 0.022, 0.12, 0.06, 2e-9, 0.96) for i in range(4)]
+        for cosmology in cosmologies:
+            self.model.base_spectrum(cosmology)
+        self.model.base_spectrum(cosmologies[-1])
+        self.assertEqual(self.solver.calls, 4)
+        self.model.base_spectrum(cosmologies[0])
+        self.assertEqual(self.solver.calls, 5)
+        self.assertEqual(self.model.cache_info()['size'], 3)
+
+    def test_cached_spectra_are_read_only(self):
+        """Testa que espectros do cache não podem ser alterados por quem os recebe"""
+        with self.assertRaises(ValueError):
+            self.model.base_spectrum(FIDUCIAL[:-1])[0] = 0.0
+
+    def test_disk_cache_shared_between_instances(self):
+        """Testa o reaproveitamento de espectros gravados em disco"""
+        with tempfile.TemporaryDirectory() as tmp:
+            first = CMBSpectrumModel(self.ell, cache_dir=tmp, solver=self.solver)
+            expected = first.base_spectrum(FIDUCIAL[:-1])
+            second = CMBSpectrumModel(self.ell, cache_dir=tmp, solver=self.solver)
+            np.testing.assert_array_equal(second.base_spectrum(FIDUCIAL[:-1]), expected)
+            self.assertEqual(self.solver.calls, 1)
+            self.assertEqual(second.cache_info()['disk_hits'], 1)
+            self.assertEqual(len(os.listdir(tmp)), 1)
+
+    def test_rejects_wrong_parameter_count(self):
+        """Testa que cosmologias sem seis parâmetros levantam ValueError"""
+        with self.assertRaises(ValueError):
+            self.model.base_spectrum(FIDUCIAL)
+
+    @unittest.skipUnless(camb is not None, "camb não instalado")
+    def test_camb_spectrum(self):
+        """Testa o espectro do CAMB para a cosmologia fiducial"""
+        spectrum = camb_spectrum(FIDUCIAL[:-1], 300)
+        self.assertEqual(spectrum.shape, (301,))
+        self.assertTrue(1000 < spectrum[220] < 10000)
+
+
+def smooth_spectrum(cosmology, lmax):
+    """Espectro suave nos parâmetros, como os do CAMB dentro de uma caixa estreita"""
+    H0, ombh2, omch2, tau, As, ns = cosmology
+    ell = np.arange(lmax + 1.0)
+    oscillation = 1 + 0.3 * np.sin(ell / 200 * (1 + omch2) + H0 / 50)
+    return As * 1e12 * np.exp(-2 * tau) * (ell + 1)**(ns - 1) * oscillation * np.exp(-ell * ombh2 / 50) + 1
+
+
+TRUTH = (67.0, 0.022, 0.12, 0.06, 1.9e-9, 0.96, 70.0)
+
+
+class TestCMBLikelihood(unittest.TestCase):
+
+    def setUp(self):
+        self.ell = np.arange(2, 300, dtype=float)
+        self.model = CMBSpectrumModel(self.ell, solver=CountingSolver())
+        self.likelihood = CMBLikelihood(self.ell, self.model.Dl(TRUTH), model=self.model)
+
+    def test_maximum_at_truth(self):
+        """Testa que a verossimilhança é máxima nos parâmetros geradores"""
+        self.assertEqual(self.likelihood(TRUTH), 0.0)
+        shifted = np.array(TRUTH)
+        shifted[-1] = 90.0
+        self.assertLess(self.likelihood(shifted), 0.0)
+
+    def test_prior_bounds(self):
+        """Testa que θ fora dos priors dá -inf sem chamar o modelo"""
+        outside = np.array(TRUTH)
+        outside[0] = 95.0
+        self.assertEqual(self.likelihood(outside), -np.inf)
+        self.assertEqual(self.model.cache_info()['misses'], 1)
+
+    def test_pool_workers_keep_their_cache(self):
+        """Testa que cada worker do pool resolve a cosmologia uma vez só"""
+        with tempfile.TemporaryDirectory() as tmp:
+            solver = FileCountingSolver(os.path.join(tmp, 'calls'))
+            model = CMBSpectrumModel(self.ell, solver=solver)
+            likelihood = CMBLikelihood(self.ell, self.likelihood.Dl_obs, model=model)
+            thetas = [TRUTH[:-1] + (l0,) for l0 in np.linspace(20, 400, 40)]
+            with likelihood_pool(likelihood, 2) as pool:
+                values = pool.map(_pool_log_prob, thetas, chunksize=1)
+            self.assertEqual(values, [likelihood(theta) for theta in thetas])
+            pids = [pid for pid in solver.pids() if pid != str(os.getpid())]
+            self.assertLessEqual(len(pids), 2)
+            self.assertEqual(len(pids), len(set(pids)))
+
+    def test_picklable(self):
+        """Testa que a verossimilhança pode ser enviada a processos filhos"""
+        clone = pickle.loads(pickle.dumps(self.likelihood))
+        self.assertEqual(clone(TRUTH), self.likelihood(TRUTH))
+
+BOX = [(60, 75), (0.02, 0.024), (0.11, 0.13), (0.05, 0.08), (1.5e-9, 2e-9), (0.94, 0.99)]
+
+
+class TestSpectrumEmulator(unittest.TestCase):
+
+    def setUp(self):
+        self.ell = np.arange(2, 1000, dtype=float)
+        self.model = CMBSpectrumModel(self.ell, solver=smooth_spectrum)
+
+    def test_latin_hypercube_strata(self):
+        """Testa que cada dimensão tem exatamente uma amostra por estrato"""
+        design = SpectrumEmulator.latin_hypercube(BOX, 40, seed=3)
+        bounds = np.array(BOX)
+        unit = (design - bounds[:, 0]) / (bounds[:, 1] - bounds[:, 0])
+        for column in unit.T:
+            np.testing.assert_array_equal(np.sort(np.floor(column * 40)), np.arange(40))
+
+    def test_emulator_accuracy(self):
+        """Testa o erro relativo do emulador em pontos fora do treino"""
+        emulator = SpectrumEmulator.train(self.model, 150, BOX, degree=3)
+        design = SpectrumEmulator.latin_hypercube(BOX, 20, seed=1)
+        spectra = np.array([self.model.base_spectrum(row) for row in design])
+        self.assertLess(emulator.max_relative_error(design, spectra), 1e-3)
+        self.assertEqual(emulator.base_spectrum(design).shape, (20, self.ell.size))
+        np.testing.assert_allclose(emulator.base_spectrum(design[0]), emulator.base_spectrum(design)[0])
+
+    def test_emulator_as_likelihood_model(self):
+        """Testa que o emulador substitui o modelo exato na verossimilhança"""
+        theta = (67.0, 0.022, 0.12, 0.06, 1.9e-9, 0.96, 70.0)
+        emulator = SpectrumEmulator.train(self.model, 150, BOX)
+        exact = CMBLikelihood(self.ell, self.model.Dl(theta), model=self.model)
+        surrogate = CMBLikelihood(self.ell, self.model.Dl(theta), model=emulator)
+        self.assertGreater(surrogate(theta), -1.0)
+
+        samples = initial_walkers(40, center=theta, scale=1e-3, seed=0)
+        check = verify_exact(samples, surrogate, exact, n_check=8, seed=0)
+        self.assertEqual(check['lnL_exact'].shape, (9,))
+        self.assertLess(check['max_abs_delta'], 0.01 * np.max(np.abs(check['lnL_exact'])))
+
+    def test_parallel_training_matches_serial(self):
+        """Testa que o treino num pool de processos dá os mesmos coeficientes"""
+        serial = SpectrumEmulator.train(self.model, 100, BOX, degree=2)
+        parallel = SpectrumEmulator.train(self.model, 100, BOX, degree=2, processes=2)
+        np.testing.assert_allclose(parallel.coefficients, serial.coefficients)
+
+    def test_untrained_and_undersized(self):
+        """Testa erros de emulador não treinado e de desenho pequeno demais"""
+        emulator = SpectrumEmulator(self.ell, BOX, degree=3)
+        with self.assertRaises(RuntimeError):
+            emulator.base_spectrum(FIDUCIAL[:-1])
+        design = SpectrumEmulator.latin_hypercube(BOX, 10)
+        with self.assertRaises(ValueError):
+            emulator.fit(design, np.ones((10, self.ell.size)))
+
+    def test_initial_walkers_relative_scale(self):
+        """Testa que a bola inicial respeita a escala de cada parâmetro"""
+        walkers = initial_walkers(32, seed=1)
+        self.assertEqual(walkers.shape, (32, 7))
+        np.testing.assert_allclose(walkers / np.array(FIDUCIAL), 1, atol=5e-3)
+
+    @unittest.skipUnless(emcee is not None, "emcee não instalado")
+    def test_parallel_sampler(self):
+        """Testa o emcee com pool de processos sobre o emulador"""
+        theta = (67.0, 0.022, 0.12, 0.06, 1.9e-9, 0.96, 70.0)
+        emulator = SpectrumEmulator.train(self.model, 150, BOX)
+        likelihood = CMBLikelihood(self.ell, self.model.Dl(theta), model=emulator)
+        sampler = run_sampler(likelihood, 16, 20, initial=initial_walkers(16, theta, seed=0), processes=2)
+        self.assertEqual(sampler.get_chain().shape, (20, 16, 7))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""Testes do ConversationStore (LRU com TTL, limite de bytes e SQLite)"""
+
+import sys
+sys.path.insert(0, 'modelx-agent')
+import importlib.util
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from unittest import mock
+from backend.conversation_state import ConversationState, append_message, MAX_MESSAGES
+from backend.conversation_store import ConversationStore, estimate_size
+
+HAS_FASTAPI = all(importlib.util.find_spec(m) is not None for m in ('fastapi', 'httpx'))
+
+
+def make_state(conversation_id, n_messages=2, content="mensagem"):
+    state = ConversationState(id=conversation_id, root_question="pergunta", root_question_vector=None)
+    for i in range(n_messages):
+        append_message(state, "user" if i % 2 == 0 else "assistant", content, 1000.0 + i)
+    return state
+
+
+class TestConversationStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = os.path.join(self.tmp.name, 'conversations.sqlite3')
+
+    def make_store(self, **kwargs):
+        kwargs.setdefault('db_path', self.db_path)
+        store = ConversationStore(**kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_lru_evicts_and_reloads_from_sqlite(self):
+        """Testa despejo LRU para o SQLite e recarga sob demanda"""
+        store = self.make_store(max_conversations=2, ttl=None)
+        for name in ('a', 'b'):
+            store.put(make_state(name))
+        store.get('a')                      # 'b' passa a ser a menos usada
+        store.put(make_state('c'))
+
+        self.assertEqual(len(store), 2)
+        self.assertNotIn('b', store)
+        self.assertEqual(store.metrics['evictions'], 1)
+
+        reloaded = store.get('b')
+        self.assertEqual(reloaded.id, 'b')
+        self.assertEqual([m.content for m in reloaded.messages], ['mensagem', 'mensagem'])
+        self.assertIsNone(store.get('inexistente'))
+
+        stats = store.stats()
+        self.assertEqual((stats['memory_hits'], stats['disk_hits'], stats['misses']), (1, 1, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+        self.assertAlmostEqual(stats['memory_hit_rate'], 1 / 3)
+
+    def test_byte_limit(self):
+        """Testa que o total estimado em memória respeita max_bytes"""
+        size = estimate_size(make_state('x', n_messages=10, content='y' * 1000))
+        store = self.make_store(max_bytes=int(2.5 * size), ttl=None)
+        for i in range(5):
+            store.put(make_state(f'c{i}', n_messages=10, content='y' * 1000))
+        self.assertEqual(len(store), 2)
+        self.assertLessEqual(store.stats()['memory_bytes'], 2.5 * size)
+        self.assertEqual(store.get('c0').id, 'c0')
+
+    def test_put_updates_size_of_mutated_state(self):
+        """Testa que put() remede uma conversa alterada in-place"""
+        store = self.make_store(ttl=None)
+        state = make_state('a')
+        store.put(state)
+        before = store.stats()['memory_bytes']
+        append_message(state, 'assistant', 'z' * 5000)
+        store.put(state)
+        self.assertEqual(store.stats()['memory_bytes'], before + 5000 + 120)
+
+    def test_ttl_expiration(self):
+        """Testa que conversas ociosas saem da memória e voltam do SQLite"""
+        store = self.make_store(ttl=0.05)
+        store.put(make_state('a'))
+        time.sleep(0.1)
+        store.put(make_state('b'))
+        self.assertNotIn('a', store)
+        self.assertEqual(store.metrics['expirations'], 1)
+        self.assertEqual(store.get('a').id, 'a')
+
+    def test_eviction_pass_spills_in_one_transaction(self):
+        """Testa que um passe que despeja várias conversas faz um só commit"""
+        size = estimate_size(make_state('x', n_messages=10, content='y' * 1000))
+        store = self.make_store(max_bytes=int(3.5 * size), ttl=None)
+        for i in range(3):
+            store.put(make_state(f'c{i}', n_messages=10, content='y' * 1000))
+
+        commits = []
+        store._db.set_trace_callback(lambda sql: commits.append(sql) if sql.strip().upper() == 'COMMIT' else None)
+        store.put(make_state('grande', n_messages=10, content='y' * 3000))   # despeja as 3 de uma vez
+        store._db.set_trace_callback(None)
+
+        self.assertEqual(store.metrics['evictions'], 3)
+        self.assertEqual(store.metrics['spilled'], 3)
+        self.assertEqual(len(commits), 1)
+        self.assertEqual([store.get(f'c{i}').id for i in range(3)], ['c0', 'c1', 'c2'])
+
+    def db_ids(self, store):
+        return sorted(row[0] for row in store._db.execute("SELECT id FROM conversations"))
+
+    def test_sqlite_row_cap(self):
+        """Testa que o SQLite guarda só as max_db_rows conversas gravadas por último"""
+        store = self.make_store(max_conversations=1, ttl=None, max_db_rows=2)
+        for name in ('a', 'b', 'c', 'd'):
+            store.put(make_state(name))
+        self.assertEqual(self.db_ids(store), ['b', 'c'])
+        self.assertEqual(store.metrics['pruned'], 1)
+        self.assertIsNone(store.get('a'))
+
+    def test_sqlite_ttl(self):
+        """Testa que linhas mais antigas que db_ttl saem do SQLite na próxima gravação"""
+        store = self.make_store(max_conversations=1, ttl=None, db_ttl=0.05)
+        store.put(make_state('a'))
+        store.put(make_state('b'))          # grava 'a'
+        time.sleep(0.1)
+        store.put(make_state('c'))          # grava 'b' e poda 'a'
+        self.assertEqual(self.db_ids(store), ['b'])
+
+    def test_failed_spill_keeps_conversations(self):
+        """Testa que um erro do SQLite não descarta as conversas nem levanta exceção"""
+        store = self.make_store(max_conversations=1, ttl=None)
+        store._db.execute("DROP TABLE conversations")
+        store.put(make_state('a'))
+        store.put(make_state('b'))
+        self.assertIn('a', store)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.metrics['evictions'], 0)
+        self.assertGreaterEqual(store.metrics['spill_errors'], 1)
+
+    def test_without_sqlite_evicted_are_dropped(self):
+        """Testa db_path=None: despejo descarta a conversa"""
+        store = self.make_store(max_conversations=1, ttl=None, db_path=None)
+        store.put(make_state('a'))
+        store.put(make_state('b'))
+        self.assertIsNone(store.get('a'))
+
+    def test_close_flushes_to_sqlite(self):
+        """Testa que close() grava as conversas em memória para o próximo processo"""
+        store = ConversationStore(ttl=None, db_path=self.db_path)
+        store.put(make_state('a', n_messages=3))
+        store.close()
+        reopened = self.make_store(ttl=None)
+        self.assertEqual(len(reopened.get('a').messages), 3)
+
+    def test_message_history_is_bounded(self):
+        """Testa que append_message mantém só as MAX_MESSAGES mais recentes"""
+        state = make_state('a', n_messages=MAX_MESSAGES + 10)
+        self.assertEqual(len(state.messages), MAX_MESSAGES)
+        self.assertEqual(state.messages[-1].timestamp, 1000.0 + MAX_MESSAGES + 9)
+
+
+
+@unittest.skipUnless(HAS_FASTAPI, "fastapi/httpx não instalados")
+class TestStoreLifecycle(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_import_creates_no_files(self):
+        """Testa que importar o backend não cria o SQLite no diretório atual"""
+        agent_dir = os.path.abspath('modelx-agent')
+        subprocess.run([sys.executable, '-c', f'import sys; sys.path.insert(0, {agent_dir!r}); import backend.main'],
+                       cwd=self.tmp.name, check=True)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_lifespan_opens_and_flushes_store(self):
+        """Testa que o store abre no startup e grava as conversas no shutdown"""
+        from fastapi.testclient import TestClient
+        from backend import main
+
+        db_path = os.path.join(self.tmp.name, 'conversations.sqlite3')
+        with mock.patch.object(main, 'CONVERSATIONS', None), \
+                mock.patch.object(main, 'ConversationStore', lambda: ConversationStore(ttl=None, db_path=db_path)):
+            with TestClient(main.app) as client:
+                store = main.CONVERSATIONS
+                self.assertIsNotNone(store)
+                store.put(make_state('a'))
+                self.assertEqual(client.get('/status').json()['conversation_store']['conversations_in_memory'], 1)
+            self.assertIsNone(main.CONVERSATIONS)
+
+        reopened = ConversationStore(ttl=None, db_path=db_path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get('a').id, 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
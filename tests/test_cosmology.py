@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o ensemble de Friedmann e a decoerência de qubit"""
+
+import sys
+sys.path.insert(0, 'src')
+import unittest
+import numpy as np
+from scipy.integrate import odeint
+from model_x.cosmology import KAPPA, FriedmannEnsemble, qubit_decoherence
+
+
+def legacy_friedmann(y, t, rho0=1.0, G=1.0, amplitude=0.1):
+    """RHS de legacy/v1/o.py (amplitude 0 = friedmann_orig)"""
+    a = y[0]
+    X_t = amplitude * np.sin(10 * t)
+    H = np.sqrt((8 * np.pi * G / 3) * (rho0 / a**3) * (1 + X_t / KAPPA))
+    return [a * H]
+
+
+class TestFriedmannEnsemble(unittest.TestCase):
+
+    def setUp(self):
+        self.t = np.linspace(0.001, 5, 100)
+
+    def test_matches_legacy_odeint(self):
+        """Testa o ensemble contra as integrações odeint da v1 (modificada e original)"""
+        solution = FriedmannEnsemble(amplitude=[0.1, 0.0]).solve(self.t)
+        for row, amplitude in enumerate((0.1, 0.0)):
+            legacy = odeint(legacy_friedmann, [0.001], self.t, args=(1.0, 1.0, amplitude)).ravel()
+            np.testing.assert_allclose(solution['a'][row], legacy, rtol=1e-6)
+        self.assertAlmostEqual(solution['a'][0, -1], 7.7742, places=3)
+
+    def test_parameter_ensemble(self):
+        """Testa muitos (ρ₀, G, A) numa chamada contra odeint membro a membro"""
+        rng = np.random.default_rng(0)
+        rho0, G, amplitude = rng.uniform(0.5, 2, 50), rng.uniform(0.5, 1.5, 50), rng.uniform(0, 0.2, 50)
+        solution = FriedmannEnsemble(rho0, G, amplitude).solve(self.t)
+        self.assertEqual(solution['a'].shape, (50, 100))
+        for i in (0, 17, 49):
+            legacy = odeint(legacy_friedmann, [0.001], self.t, args=(rho0[i], G[i], amplitude[i])).ravel()
+            np.testing.assert_allclose(solution['a'][i], legacy, rtol=1e-6)
+
+    def test_closed_form_without_x(self):
+        """Testa A = 0 contra a solução de poeira em forma fechada"""
+        ensemble = FriedmannEnsemble(rho0=[0.5, 1.0, 3.0], amplitude=0.0)
+        np.testing.assert_allclose(ensemble.solve(self.t)['a'], ensemble.matter_dominated(self.t), rtol=1e-12)
+
+    def test_hubble_and_dense_output(self):
+        """Testa H = ȧ/a e a saída densa entre os pontos da grade"""
+        ensemble = FriedmannEnsemble(rho0=[1.0, 2.0], amplitude=[0.1, 0.05])
+        solution = ensemble.solve(self.t, dense_output=True)
+        h = 1e-6
+        t_mid = 2.5
+        a_mid = solution['interpolant'](t_mid)
+        derivative = (solution['interpolant'](t_mid + h) - solution['interpolant'](t_mid - h)) / (2 * h)
+        np.testing.assert_allclose(derivative / a_mid, ensemble.hubble(t_mid, a_mid[:, None])[:, 0], rtol=1e-5)
+        np.testing.assert_allclose(solution['interpolant'](self.t), solution['a'], rtol=1e-8)
+        self.assertIsNone(ensemble.solve(self.t)['interpolant'])
+
+    def test_invalid_parameter_shape(self):
+        """Testa que parâmetros 2-D levantam ValueError"""
+        with self.assertRaises(ValueError):
+            FriedmannEnsemble(rho0=np.ones((2, 2)))
+
+
+class TestQubitDecoherence(unittest.TestCase):
+
+    def test_legacy_values(self):
+        """Testa X(t) e dτ/dt contra os valores impressos pela v1"""
+        t = np.linspace(0, 1, 100)
+        X, dtau = qubit_decoherence(t)
+        self.assertAlmostEqual(X[0], np.log(2))
+        self.assertAlmostEqual(X[-1], np.log(2) * (2 * np.exp(-1) - 1))
+        self.assertAlmostEqual(np.mean(X), 0.184, places=3)
+        np.testing.assert_allclose(dtau, np.exp(-KAPPA * X))
+
+    def test_kappa_ensemble(self):
+        """Testa o eixo extra para um array de κ"""
+        t = np.linspace(0, 1, 20)
+        X, dtau = qubit_decoherence(t, kappa=[0.5, 1.0, 2.0])
+        self.assertEqual(dtau.shape, (3, 20))
+        np.testing.assert_allclose(dtau[2], qubit_decoherence(t, kappa=2.0)[1])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o painel ao vivo (LiveDashboard)"""
+
+import sys
+sys.path.insert(0, 'src')
+import io
+import unittest
+import numpy as np
+from model_x import ModelXVisualizer, SimulationEngine
+from model_x.dashboard import LiveDashboard, RunningStats
+
+class FakeClock:
+    """Relógio controlado manualmente"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_entry(step, dilation, entropy=0.4, syntropy=0.6):
+    return {'step': step, 'time': step * 0.01, 'dilation': dilation,
+            'state': {'entropy': entropy, 'syntropy': syntropy, 'energy': 1.0}}
+
+class TestRunningStats(unittest.TestCase):
+
+    def test_matches_numpy(self):
+        """Testa agregados incrementais contra NumPy"""
+        values = np.random.default_rng(0).normal(2.0, 0.5, 1000)
+        stats = RunningStats()
+        for value in values:
+            stats.update(value)
+
+        self.assertEqual(stats.count, 1000)
+        self.assertAlmostEqual(stats.mean, values.mean(), places=10)
+        self.assertAlmostEqual(stats.std, values.std(), places=10)
+        self.assertEqual(stats.min, values.min())
+        self.assertEqual(stats.max, values.max())
+        self.assertEqual(stats.last, values[-1])
+
+class TestLiveDashboard(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.stream = io.StringIO()
+        self.dashboard = LiveDashboard(buffer_size=10, refresh_interval=1.0,
+                                       stream=self.stream, clock=self.clock)
+
+    def test_ring_buffer_keeps_latest_samples(self):
+        """Testa que o buffer circular mantém apenas as últimas amostras"""
+        for step in range(25):
+            self.dashboard.update(make_entry(step, float(step)))
+
+        np.testing.assert_array_equal(self.dashboard.window('dilation'), np.arange(15, 25))
+        self.assertEqual(self.dashboard.stats['dilation'].count, 25)
+        self.assertEqual(self.dashboard.stats['dilation'].min, 0.0)
+
+    def test_refresh_rate_is_capped(self):
+        """Testa limitação da taxa de redesenho"""
+        for step in range(100):
+            self.dashboard.update(make_entry(step, 1.0))
+        self.assertEqual(self.dashboard.frames, 1)
+
+        self.clock.now = 1.5
+        self.dashboard.update(make_entry(100, 1.0))
+        self.assertEqual(self.dashboard.frames, 2)
+
+    def test_render_size_independent_of_steps(self):
+        """Testa que o quadro não cresce com o número de passos"""
+        for step in range(20):
+            self.dashboard.update(make_entry(step, np.sin(step)))
+        short_frame = self.dashboard.render()
+
+        for step in range(20, 5000):
+            self.dashboard.update(make_entry(step, np.sin(step)))
+        long_frame = self.dashboard.render()
+
+        self.assertEqual(len(short_frame.splitlines()), len(long_frame.splitlines()))
+        self.assertIn('τ/τ₀', long_frame)
+        self.assertIn('Sintropia', long_frame)
+
+    def test_sparkline(self):
+        """Testa conversão para sparkline"""
+        self.assertEqual(LiveDashboard.sparkline(np.array([0.0, 1.0])), '▁█')
+        self.assertEqual(len(LiveDashboard.sparkline(np.ones(5))), 5)
+        self.assertEqual(LiveDashboard.sparkline(np.array([])), '')
+
+    def test_subscribes_to_simulation(self):
+        """Testa painel alimentado por SimulationEngine em andamento"""
+        sim = SimulationEngine(max_steps=50)
+        viz = ModelXVisualizer()
+        dashboard = viz.live_dashboard(sim, buffer_size=16, stream=self.stream)
+
+        history = sim.run_simulation({'entropy': 0.3, 'syntropy': 0.7, 'energy': 1.5})
+        dashboard.close()
+
+        self.assertEqual(dashboard.position, len(history))
+        self.assertAlmostEqual(dashboard.stats['dilation'].mean,
+                               np.mean([h['dilation'] for h in history]), places=10)
+        self.assertIn('PAINEL AO VIVO', self.stream.getvalue())
+
+        sim.unsubscribe(dashboard)
+        sim.run_simulation({'entropy': 0.3, 'syntropy': 0.7, 'energy': 1.5})
+        self.assertEqual(dashboard.position, len(history))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o cache binário de tabelas observacionais"""
+
+import sys
+sys.path.insert(0, 'src')
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from model_x.data_cache import (ArrayCache, PLANCK_TT, VALIDATION_TABLE, load_planck_tt,
+                                load_validation_table)
+
+
+class TestArrayCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = ArrayCache(os.path.join(self.tmp, 'cache'))
+        self.source = os.path.join(self.tmp, 'tabela.txt')
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write("# x y\n1 2\n3 4\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_second_load_is_memory_mapped_hit(self):
+        """Testa que a segunda leitura vem do .npy mapeado em memória"""
+        first = self.cache.load(self.source)
+        second = self.cache.load(self.source)
+        np.testing.assert_array_equal(second, [[1, 2], [3, 4]])
+        np.testing.assert_array_equal(first, second)
+        self.assertIsInstance(second, np.memmap)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_content_change_rebuilds(self):
+        """Testa que alterar a fonte invalida o cache"""
+        self.cache.load(self.source)
+        with open(self.source, 'a', encoding='utf-8') as f:
+            f.write("5 6\n")
+        self.assertEqual(self.cache.load(self.source).shape, (3, 2))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_touch_with_same_content_keeps_cache(self):
+        """Testa que só o mtime diferente, com o mesmo hash, mantém o cache"""
+        self.cache.load(self.source)
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.cache.load(self.source)
+        self.cache.load(self.source)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_same_size_edit_detected_by_hash(self):
+        """Testa que uma edição de mesmo tamanho é detectada pelo hash"""
+        self.cache.load(self.source)
+        stat = os.stat(self.source)
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write("# x y\n1 2\n3 9\n")
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        np.testing.assert_array_equal(self.cache.load(self.source)[1], [3, 9])
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_parser_arguments_get_separate_entries(self):
+        """Testa que leituras com argumentos diferentes não se sobrescrevem"""
+        full = self.cache.load(self.source)
+        column = self.cache.load(self.source, usecols=(1,))
+        np.testing.assert_array_equal(column, [2, 4])
+        self.assertEqual(full.shape, (2, 2))
+        self.assertEqual(len([n for n in os.listdir(self.cache.cache_dir) if n.endswith('.npy')]), 2)
+
+    def test_clear(self):
+        """Testa a remoção das entradas de cache"""
+        self.cache.load(self.source)
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.cache.cache_dir), [])
+
+
+class TestObservationalTables(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = ArrayCache(self.tmp)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_planck_tt_matches_loadtxt(self):
+        """Testa que o espectro do Planck em cache é igual ao np.loadtxt"""
+        ell, Dl, lower, upper = load_planck_tt(cache=self.cache)
+        expected = np.loadtxt(PLANCK_TT, unpack=True)
+        np.testing.assert_array_equal(ell, expected[0])
+        np.testing.assert_array_equal(Dl, expected[1])
+        self.assertEqual(ell[0], 2.0)
+
+    def test_validation_table_columns(self):
+        """Testa a tabela de validação como array estruturado"""
+        table = load_validation_table(cache=self.cache)
+        self.assertIn('temporal_dilation', table.dtype.names)
+        self.assertEqual(len(table), sum(1 for _ in open(VALIDATION_TABLE, encoding='utf-8')) - 1)
+        self.assertEqual(load_validation_table(cache=self.cache).shape, table.shape)
+        self.assertEqual(self.cache.hits, 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -65,5 +65,22 @@ class TestEntropySyntropyCalculator(unittest.TestCase):
         
         self.assertEqual(entropy1, entropy2)
 
+    def test_shannon_entropy_batch_matches_scalar(self):
+        """Testa que a entropia em lote coincide com o cálculo linha a linha"""
+        rng = np.random.default_rng(3)
+        data = np.vstack([
+            rng.integers(0, 4, 50),
+            rng.normal(0, 1, 50),
+            np.ones(50),
+            rng.poisson(10, 50)
+        ])
+
+        batch = self.calc.calculate_shannon_entropy_batch(data)
+        expected = [self.calc.calculate_shannon_entropy(row) for row in data]
+        np.testing.assert_allclose(batch, expected, atol=1e-12)
+
+        syntropy = self.calc.calculate_syntropy_batch(data)
+        np.testing.assert_allclose(syntropy, [self.calc.calculate_syntropy(row) for row in data], atol=1e-12)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
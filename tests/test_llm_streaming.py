@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""Testes do streaming de respostas (provedores LLM, executor e /chat/stream)"""
+
+import sys
+sys.path.insert(0, 'modelx-agent')
+import asyncio
+import importlib.util
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+from backend.blocking_io import iterate_blocking
+from backend.llm_providers import (
+    BaseLLMProvider, LLMProvider, LLMResponse, LLMStreamError, UnifiedLLMProvider,
+    _iter_chat_completions_stream, _iter_ollama_stream, _stream_request
+)
+
+HAS_REQUESTS = importlib.util.find_spec('requests') is not None
+HAS_FASTAPI = all(importlib.util.find_spec(m) is not None for m in ('fastapi', 'httpx'))
+
+
+class FakeResponse:
+    """Resposta de requests.post(..., stream=True) com linhas já em bytes"""
+
+    def __init__(self, lines, status_code=200, text=''):
+        self.lines = lines
+        self.status_code = status_code
+        self.text = text
+        self.consumed = 0
+        self.closed = False
+
+    def iter_lines(self, chunk_size=None):
+        for line in self.lines:
+            self.consumed += 1
+            yield line
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+def ndjson(*chunks):
+    return [json.dumps(c).encode('utf-8') for c in chunks]
+
+
+def sse(*deltas):
+    return [b'data: ' + json.dumps({'choices': [{'delta': d}]}).encode('utf-8') for d in deltas]
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provedor que produz `chunks` e, com `fail_after`, falha depois de n trechos"""
+
+    def __init__(self, chunks, fail_after=None, available=True, kind=LLMProvider.OLLAMA):
+        super().__init__(model_name='fake')
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.available = available
+        self.kind = kind
+        self.calls = 0
+
+    def generate(self, prompt, config=None):
+        return LLMResponse(text=''.join(self.chunks), provider=self.kind, model='fake')
+
+    def generate_stream(self, prompt, config=None):
+        self.calls += 1
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise LLMStreamError(f'{self.kind.value} caiu')
+            yield chunk
+        if self.fail_after is not None and self.fail_after >= len(self.chunks):
+            raise LLMStreamError(f'{self.kind.value} caiu')
+
+    def is_available(self):
+        return self.available
+
+    @property
+    def provider_type(self):
+        return self.kind
+
+
+def unified(**providers):
+    """UnifiedLLMProvider com prioridade groq → ollama → together"""
+    kinds = {'groq': LLMProvider.GROQ, 'ollama': LLMProvider.OLLAMA, 'together': LLMProvider.TOGETHER}
+    return UnifiedLLMProvider(
+        providers={kinds[name]: p for name, p in providers.items()},
+        priority=[LLMProvider.GROQ, LLMProvider.OLLAMA, LLMProvider.TOGETHER]
+    )
+
+
+class TestStreamParsers(unittest.TestCase):
+
+    def test_ollama_ndjson(self):
+        """Testa que o parser NDJSON ignora linhas vazias e para no done"""
+        response = FakeResponse(
+            ndjson({'response': 'Olá'}, {'response': ''}) + [b''] +
+            ndjson({'response': ' mundo', 'done': True}, {'response': 'depois do fim'})
+        )
+        self.assertEqual(list(_iter_ollama_stream(response)), ['Olá', ' mundo'])
+        self.assertEqual(response.consumed, 4)
+
+    def test_ollama_error_chunk(self):
+        """Testa que um chunk com 'error' vira LLMStreamError"""
+        response = FakeResponse(ndjson({'response': 'a'}, {'error': 'model not found'}))
+        stream = _iter_ollama_stream(response)
+        self.assertEqual(next(stream), 'a')
+        with self.assertRaisesRegex(LLMStreamError, 'model not found'):
+            next(stream)
+
+    def test_chat_completions_sse(self):
+        """Testa o parser SSE: comentários, deltas vazios e [DONE]"""
+        response = FakeResponse(
+            [b': keep-alive', b''] + sse({'role': 'assistant'}, {'content': 'X = '}, {'content': 'σ − S'}) +
+            [b'data: [DONE]'] + sse({'content': 'ignorado'})
+        )
+        self.assertEqual(list(_iter_chat_completions_stream(response)), ['X = ', 'σ − S'])
+
+
+@unittest.skipUnless(HAS_REQUESTS, "requests não instalado")
+class TestStreamRequest(unittest.TestCase):
+
+    def stream(self, response, parser=_iter_ollama_stream):
+        with mock.patch('requests.post', return_value=response) as post:
+            chunks = list(_stream_request('http://llm/api', {'prompt': 'p'}, parser, timeout=5))
+        self.assertTrue(post.call_args.kwargs['stream'])
+        return chunks
+
+    def test_yields_and_closes_response(self):
+        """Testa que os trechos passam e a resposta é fechada no fim"""
+        response = FakeResponse(sse({'content': 'a'}, {'content': 'b'}) + [b'data: [DONE]'])
+        self.assertEqual(self.stream(response, _iter_chat_completions_stream), ['a', 'b'])
+        self.assertTrue(response.closed)
+
+    def test_http_error(self):
+        """Testa que status != 200 vira LLMStreamError antes de qualquer trecho"""
+        with self.assertRaisesRegex(LLMStreamError, 'HTTP 503'):
+            self.stream(FakeResponse([], status_code=503, text='overloaded'))
+
+    def test_error_and_malformed_chunks(self):
+        """Testa chunk de erro do provedor e JSON inválido no meio do stream"""
+        with self.assertRaisesRegex(LLMStreamError, 'sem memória'):
+            self.stream(FakeResponse(ndjson({'error': 'sem memória'})))
+        with self.assertRaisesRegex(LLMStreamError, 'Stream interrompido'):
+            self.stream(FakeResponse(ndjson({'response': 'a'}) + [b'{quebrado']))
+
+    def test_timeout(self):
+        """Testa que o timeout de conexão vira LLMStreamError"""
+        import requests
+        with mock.patch('requests.post', side_effect=requests.exceptions.Timeout()):
+            with self.assertRaisesRegex(LLMStreamError, 'Timeout'):
+                list(_stream_request('http://llm/api', {}, _iter_ollama_stream, timeout=5))
+
+
+@unittest.skipUnless(HAS_REQUESTS, "requests não instalado")
+class TestCallLLMStream(unittest.TestCase):
+
+    def stream(self, response):
+        from backend.coding_engineering.generator import call_llm_stream
+
+        with mock.patch('requests.post', return_value=response):
+            return list(call_llm_stream('prompt'))
+
+    def test_tokens_until_done(self):
+        """Testa os trechos do Ollama até o chunk done"""
+        response = FakeResponse(ndjson({'response': 'Olá'}, {'response': ' mundo', 'done': True}))
+        self.assertEqual(self.stream(response), ['Olá', ' mundo'])
+
+    def test_error_chunk_yields_message(self):
+        """Testa que um erro no meio do stream vira a mensagem de erro, não uma resposta vazia"""
+        response = FakeResponse(ndjson({'response': 'Olá'}, {'error': 'model requires more memory'}))
+        chunks = self.stream(response)
+        self.assertEqual(chunks[0], 'Olá')
+        self.assertEqual(len(chunks), 2)
+        self.assertIn('model requires more memory', chunks[1])
+
+
+class TestUnifiedStreaming(unittest.TestCase):
+
+    def test_fallback_before_first_chunk(self):
+        """Testa que uma falha antes do primeiro trecho passa ao próximo provedor"""
+        groq = FakeProvider(['nunca'], fail_after=0, kind=LLMProvider.GROQ)
+        ollama = FakeProvider(['a'], available=False)
+        together = FakeProvider(['b', 'c'], kind=LLMProvider.TOGETHER)
+        provider = unified(groq=groq, ollama=ollama, together=together)
+
+        self.assertEqual(list(provider.generate_stream('p')), ['b', 'c'])
+        self.assertEqual(ollama.calls, 0)
+        self.assertEqual(provider.metrics['successful_requests'], 1)
+        self.assertEqual(provider.metrics['provider_usage']['together'], 1)
+
+    def test_error_after_first_chunk_propagates(self):
+        """Testa que depois do primeiro trecho não há fallback"""
+        groq = FakeProvider(['a', 'b'], fail_after=1, kind=LLMProvider.GROQ)
+        ollama = FakeProvider(['outro'])
+        provider = unified(groq=groq, ollama=ollama)
+
+        received = []
+        with self.assertRaisesRegex(LLMStreamError, 'groq caiu'):
+            for chunk in provider.generate_stream('p'):
+                received.append(chunk)
+        self.assertEqual(received, ['a'])
+        self.assertEqual(ollama.calls, 0)
+        self.assertEqual(provider.metrics['failed_requests'], 1)
+
+    def test_all_providers_fail(self):
+        """Testa a mensagem quando todos os provedores falham"""
+        provider = unified(
+            groq=FakeProvider([], fail_after=0, kind=LLMProvider.GROQ),
+            ollama=FakeProvider([], fail_after=0)
+        )
+        with self.assertRaisesRegex(LLMStreamError, 'Todos os provedores falharam.*ollama caiu'):
+            list(provider.generate_stream('p'))
+
+    def test_base_generate_stream(self):
+        """Testa o fallback de BaseLLMProvider: resposta inteira num trecho"""
+        provider = FakeProvider(['Olá', ' mundo'])
+        self.assertEqual(list(BaseLLMProvider.generate_stream(provider, 'p')), ['Olá mundo'])
+
+
+class TestIterateBlocking(unittest.TestCase):
+
+    def collect(self, iterator):
+        async def run():
+            return [item async for item in iterate_blocking(iterator)]
+        return asyncio.run(run())
+
+    def test_items_pass_through(self):
+        """Testa que os itens chegam em ordem, produzidos fora do event loop"""
+        threads = []
+
+        def produce():
+            for i in range(5):
+                threads.append(threading.current_thread())
+                yield i
+
+        self.assertEqual(self.collect(produce()), [0, 1, 2, 3, 4])
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_exception_after_items(self):
+        """Testa que a exceção do iterador chega ao consumidor depois dos itens"""
+        def produce():
+            yield 'a'
+            raise LLMStreamError('caiu')
+
+        received = []
+
+        async def run():
+            async for item in iterate_blocking(produce()):
+                received.append(item)
+
+        with self.assertRaisesRegex(LLMStreamError, 'caiu'):
+            asyncio.run(run())
+        self.assertEqual(received, ['a'])
+
+    def test_early_stop_closes_iterator(self):
+        """Testa que parar de consumir encerra o iterador no worker"""
+        closed = threading.Event()
+
+        def produce():
+            try:
+                i = 0
+                while True:
+                    time.sleep(0.001)
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        async def run():
+            stream = iterate_blocking(produce())
+            first = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return first, await asyncio.get_running_loop().run_in_executor(None, closed.wait, 2)
+
+        first, was_closed = asyncio.run(run())
+        self.assertEqual(first, [0, 1])
+        self.assertTrue(was_closed)
+
+
+class _Lines:
+    """Adapta o corpo de uma resposta do TestClient para iter_sse_events"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def iter_lines(self, chunk_size=None):
+        return iter(self.text.split('\n'))
+
+
+@unittest.skipUnless(HAS_FASTAPI, "fastapi/httpx não instalados")
+class TestChatStreamEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from backend import main
+        from backend.conversation_store import ConversationStore
+
+        self.main = main
+        self.store = ConversationStore(db_path=None)
+        for patcher in (
+            mock.patch.object(main, 'CONVERSATIONS', self.store),
+            mock.patch.object(main, 'update_parameters', lambda *a, **k: None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def events(self, stream):
+        from sse_client import iter_sse_events
+
+        with mock.patch.object(self.main, 'generate_answer_stream', lambda *a: stream()):
+            response = self.client.post('/chat/stream', json={
+                'conversation_id': 'c1', 'message': 'Explique o Modelo X',
+                'is_new_conversation': True, 'enable_web_search': False, 'enable_learning': False
+            })
+        self.assertEqual(response.status_code, 200)
+        return list(iter_sse_events(_Lines(response.text)))
+
+    def test_meta_tokens_done(self):
+        """Testa a ordem meta → token* → done e o registro da resposta"""
+        def stream():
+            yield 'Olá'
+            yield ' mundo'
+
+        events = self.events(stream)
+        self.assertEqual([e for e, _ in events], ['meta', 'token', 'token', 'done'])
+        self.assertIn('X', events[0][1])
+        self.assertEqual([d['text'] for e, d in events if e == 'token'], ['Olá', ' mundo'])
+        self.assertEqual(events[-1][1]['answer_text'], 'Olá mundo')
+        self.assertEqual([m.role for m in self.store.get('c1').messages], ['user', 'assistant'])
+
+    def test_error_closes_turn(self):
+        """Testa o evento de erro e que a mensagem do usuário não fica sem resposta"""
+        def stream():
+            yield 'Olá'
+            raise LLMStreamError('provedor caiu')
+
+        events = self.events(stream)
+        self.assertEqual([e for e, _ in events], ['meta', 'token', 'error'])
+        self.assertIn('provedor caiu', events[-1][1]['detail'])
+        messages = self.store.get('c1').messages
+        self.assertEqual([m.role for m in messages], ['user', 'assistant'])
+        self.assertIn('provedor caiu', messages[-1].content)
+
+    def interrupt(self, stop):
+        """Abre o corpo do /chat/stream, lê o evento meta e interrompe com `stop(body)`"""
+        def stream():
+            time.sleep(0.3)
+            yield 'tarde demais'
+
+        async def run():
+            request = self.main.ChatRequest(conversation_id='c1', message='Explique o Modelo X',
+                                            is_new_conversation=True, enable_web_search=False,
+                                            enable_learning=False)
+            with mock.patch.object(self.main, 'generate_answer_stream', lambda *a: stream()):
+                body = (await self.main.chat_stream(request)).body_iterator
+                self.assertTrue((await body.__anext__()).startswith('event: meta'))
+                await stop(body)
+
+        asyncio.run(run())
+        messages = self.store.get('c1').messages
+        self.assertEqual([m.role for m in messages], ['user', 'assistant'])
+        self.assertIn('conexão encerrada', messages[-1].content)
+
+    def test_disconnect_closes_turn(self):
+        """Testa que fechar o stream (GeneratorExit) não deixa a mensagem do usuário pendurada"""
+        async def close(body):
+            await body.aclose()
+
+        self.interrupt(close)
+
+    def test_cancel_closes_turn(self):
+        """Testa o mesmo para o cancelamento da tarefa que lê o stream"""
+        async def cancel(body):
+            task = asyncio.ensure_future(body.__anext__())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.interrupt(cancel)
+
+
+if __name__ == '__main__':
+    unittest.main()
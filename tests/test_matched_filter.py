@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o filtro casado com banco de templates κ"""
+
+import sys
+sys.path.insert(0, 'src')
+import gzip
+import os
+import tempfile
+import unittest
+import numpy as np
+from model_x.matched_filter import MatchedFilter, kappa_bank, load_strain
+
+FS = 1024
+
+
+def chirp_template(duration=0.5):
+    """Chirp amortecido com potência no início, onde o fator κ atua"""
+    t = np.arange(int(duration * FS)) / FS
+    return np.sin(2 * np.pi * (60 * t + 150 * t**2)) * np.exp(-t / 0.15)
+
+
+class TestMatchedFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 8 * FS
+        self.psd = np.full(self.n // 2 + 1, 2.0 / FS)
+        self.template = chirp_template()
+        self.kappas = np.linspace(0, 40, 41)
+
+    def inject(self, kappa, snr, offset, noise):
+        signal = kappa_bank(self.template, [kappa], FS)[0]
+        reference = MatchedFilter(np.zeros(self.n), FS, psd=self.psd, f_low=20)
+        data = noise.copy()
+        data[offset:offset + signal.size] += signal * snr / reference.sigma(signal)[0]
+        return data, signal
+
+    def test_bank_matches_scalar_damping(self):
+        """Testa o banco 2-D contra o fator de amortecimento escalar original"""
+        bank = kappa_bank(self.template, self.kappas, FS)
+        t = np.arange(self.template.size) / FS
+        for i in (0, 7, 40):
+            np.testing.assert_allclose(bank[i], self.template * np.exp(-self.kappas[i] * 0.1 * np.exp(-t / 0.05)))
+
+    def test_noise_free_snr_is_exact(self):
+        """Testa que o template exato injetado sem ruído dá o SNR injetado"""
+        data, _ = self.inject(12.0, 10.0, 3000, np.zeros(self.n))
+        mf = MatchedFilter(data, FS, psd=self.psd, f_low=20)
+        series = mf.snr_series(kappa_bank(self.template, [12.0], FS))[0]
+        self.assertEqual(np.argmax(series), 3000)
+        self.assertAlmostEqual(series[3000], 10.0, places=6)
+
+    def test_batched_equals_per_template(self):
+        """Testa que o cálculo em blocos reproduz template a template"""
+        rng = np.random.default_rng(1)
+        mf = MatchedFilter(rng.standard_normal(self.n), FS, psd=self.psd, f_low=20, batch=7)
+        bank = kappa_bank(self.template, self.kappas, FS)
+        batched = mf.snr_series(bank)
+        for i in (0, 13, 40):
+            np.testing.assert_allclose(batched[i], mf.snr_series(bank[i])[0], rtol=1e-10)
+
+    def test_scan_recovers_kappa_and_time(self):
+        """Testa que a varredura recupera κ e o instante do pico em ruído gaussiano"""
+        rng = np.random.default_rng(2)
+        data, signal = self.inject(12.0, 40.0, 3000, rng.standard_normal(self.n))
+        mf = MatchedFilter(data, FS, start_time=100.0, psd=self.psd, f_low=20)
+        result = mf.scan(self.template, self.kappas)
+
+        self.assertEqual(result['snr_max'].shape, self.kappas.shape)
+        self.assertLessEqual(abs(result['best_kappa'] - 12.0), 3.0)
+        self.assertAlmostEqual(result['best_time'], 100.0 + (3000 + np.argmax(np.abs(signal))) / FS, delta=0.01)
+        self.assertGreater(result['best_snr'], 30.0)
+
+    def test_noise_snr_statistics(self):
+        """Testa que em ruído branco ⟨SNR²⟩ ≈ 2 (duas quadraturas)"""
+        rng = np.random.default_rng(3)
+        mf = MatchedFilter(rng.standard_normal(self.n), FS, psd=self.psd, f_low=20)
+        self.assertAlmostEqual(np.mean(mf.snr_series(self.template)**2), 2.0, delta=0.2)
+
+    def test_welch_psd_of_white_noise(self):
+        """Testa a PSD de Welch contra o valor teórico 2σ²/fs"""
+        rng = np.random.default_rng(5)
+        mf = MatchedFilter(rng.standard_normal(self.n), FS)
+        np.testing.assert_allclose(np.mean(mf.psd[10:-10]), 2.0 / FS, rtol=0.05)
+
+    def test_whiten_unit_variance(self):
+        """Testa que o strain branqueado tem variância unitária na banda"""
+        rng = np.random.default_rng(4)
+        mf = MatchedFilter(3.0 * rng.standard_normal(self.n), FS, f_low=0)
+        self.assertAlmostEqual(np.std(mf.whiten()), 1.0, delta=0.05)
+
+    def test_invalid_inputs(self):
+        """Testa erros de PSD com tamanho errado e template longo demais"""
+        with self.assertRaises(ValueError):
+            MatchedFilter(np.zeros(self.n), FS, psd=np.ones(10))
+        mf = MatchedFilter(np.zeros(256), FS, psd=np.full(129, 1.0))
+        with self.assertRaises(ValueError):
+            mf.snr_series(self.template)
+
+
+class TestLoadStrain(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.strain = np.random.default_rng(0).standard_normal(64)
+
+    def tearDown(self):
+        for name in os.listdir(self.tmp):
+            os.remove(os.path.join(self.tmp, name))
+        os.rmdir(self.tmp)
+
+    def test_gwosc_text_header(self):
+        """Testa o formato GWOSC (.txt.gz com taxa e GPS no cabeçalho)"""
+        path = os.path.join(self.tmp, 'H-H1.txt.gz')
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write("# Gravitational wave strain for H1 sampled at 4096 Hz\n")
+            f.write("# starting GPS 1126259446 duration 32\n")
+            f.writelines(f"{value!r}\n" for value in self.strain.tolist())
+        strain, rate, start = load_strain(path)
+        np.testing.assert_array_equal(strain, self.strain)
+        self.assertEqual((rate, start), (4096.0, 1126259446.0))
+
+    def test_two_column_text_and_npy(self):
+        """Testa o formato (tempo, strain) e arquivos .npy"""
+        path = os.path.join(self.tmp, 'strain.txt')
+        np.savetxt(path, np.column_stack([10 + np.arange(64) / 512, self.strain]))
+        strain, rate, start = load_strain(path)
+        self.assertAlmostEqual(rate, 512.0)
+        self.assertEqual(start, 10.0)
+
+        npy = os.path.join(self.tmp, 'strain.npy')
+        np.save(npy, self.strain)
+        with self.assertRaises(ValueError):
+            load_strain(npy)
+        self.assertEqual(load_strain(npy, sample_rate=512)[1], 512.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Testes do experimento de decoerência em lote (quantum/ibm_quantum_runner)"""
+
+import sys
+sys.path.insert(0, 'quantum')
+import importlib.util
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+import numpy as np
+import ibm_quantum_runner as runner
+from quantum_backends import CIRCUIT_SPEC, LocalStatevectorBackend, ResultCache, circuit_spec
+
+HAS_RUNTIME = (importlib.util.find_spec('qiskit') is not None
+               and importlib.util.find_spec('qiskit_ibm_runtime') is not None)
+
+
+class _Register:
+    def __init__(self, counts):
+        self.counts = counts
+
+    def get_counts(self):
+        return self.counts
+
+
+class _Job:
+    """Job com a mesma forma de resultado do SamplerV2: pub_result.data.<creg>"""
+
+    def __init__(self, counts, register='c'):
+        self.pubs = [SimpleNamespace(data=SimpleNamespace(**{register: _Register(c)})) for c in counts]
+
+    def result(self):
+        return self.pubs
+
+
+class TestDecoherenceMetrics(unittest.TestCase):
+
+    def test_theta_maps_t_to_p1(self):
+        """Testa θ = arccos√(1 - t): θ(0) = 0 e θ(1) = π/2"""
+        t = np.linspace(0, 1, 11)
+        theta = runner.theta_from_t(t)
+        self.assertEqual(theta.shape, t.shape)
+        self.assertAlmostEqual(theta[0], 0.0)
+        self.assertAlmostEqual(theta[-1], np.pi / 2)
+
+    def test_metrics_are_vectorized(self):
+        """Testa S, σ e X nos extremos e num ponto intermediário"""
+        S, sigma, X = runner.model_x_metrics([0.0, 0.5, 1.0, 0.25])
+        np.testing.assert_allclose(S[:3], [0.0, 1.0, 0.0])
+        np.testing.assert_allclose(sigma, 1 - S)
+        np.testing.assert_allclose(X, sigma - S)
+        self.assertAlmostEqual(S[3], -(0.25 * np.log2(0.25) + 0.75 * np.log2(0.75)))
+
+    def test_collect_and_build_results(self):
+        """Testa a leitura das contagens por PUB e o dicionário de resultados"""
+        counts = [{'0': 4096}, {'0': 2048, '1': 2048}, {'1': 1024, '0': 3072}]
+        job = _Job(counts, register='meas')
+        collected = runner.collect_counts(job, 'meas')
+        self.assertEqual(collected, counts)
+
+        results = runner.build_results('fake', [0.0, 0.5, 1.0], collected, 4096)
+        self.assertEqual([p['p1'] for p in results['data']], [0.0, 0.5, 0.25])
+        self.assertAlmostEqual(results['data'][0]['X'], 1.0)
+        self.assertAlmostEqual(results['data'][1]['X'], -1.0)
+        self.assertAlmostEqual(results['stats']['average_X'],
+                               np.mean([p['X'] for p in results['data']]))
+
+
+class _CountingBackend(LocalStatevectorBackend):
+    """Simulador local que registra quantos θ foram realmente executados"""
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.executed = 0
+
+    def run(self, thetas, shots=4096):
+        self.executed += len(thetas)
+        return super().run(thetas, shots)
+
+
+class TestLocalStatevectorBackend(unittest.TestCase):
+
+    def test_probabilities_match_closed_form(self):
+        """Testa p1 = sin²(π/4 + θ/2) e normalização do estado"""
+        thetas = runner.theta_from_t(np.linspace(0, 1, 11))
+        probabilities = LocalStatevectorBackend().probabilities(thetas)
+        np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+        np.testing.assert_allclose(probabilities[:, 1], np.sin(np.pi / 4 + thetas / 2)**2)
+
+    def test_shot_sampling_is_seeded_and_vectorized(self):
+        """Testa contagens somando shots, reprodutíveis pela semente e próximas de p1"""
+        thetas = runner.theta_from_t(np.linspace(0, 1, 6))
+        counts = LocalStatevectorBackend(seed=7).run(thetas, shots=200_000)
+        self.assertEqual(counts, LocalStatevectorBackend(seed=7).run(thetas, shots=200_000))
+        self.assertTrue(all(c['0'] + c['1'] == 200_000 for c in counts))
+        p1 = np.array([c['1'] for c in counts]) / 200_000
+        np.testing.assert_allclose(p1, np.sin(np.pi / 4 + thetas / 2)**2, atol=5e-3)
+
+    def test_load_backend_from_spec(self):
+        """Testa a escolha do backend pela especificação"""
+        backend = runner.load_backend('local:3')
+        self.assertIsInstance(backend, LocalStatevectorBackend)
+        self.assertEqual(backend.seed, 3)
+        with self.assertRaises(ValueError):
+            runner.load_backend('cloud')
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def run_quiet(self, **kwargs):
+        with redirect_stdout(io.StringIO()):
+            return runner.run_experiment(**kwargs)
+
+    def test_rerun_reuses_cached_counts(self):
+        """Testa que a segunda execução não reexecuta circuitos idênticos"""
+        cache = ResultCache(self.tmp.name)
+        backend = _CountingBackend(seed=1)
+        first = self.run_quiet(backend=backend, t_points=5, shots=1000, cache=cache)
+        second = self.run_quiet(backend=backend, t_points=5, shots=1000, cache=cache)
+        self.assertEqual(backend.executed, 5)
+        self.assertEqual((cache.hits, cache.misses), (5, 5))
+        self.assertEqual(first['data'], second['data'])
+
+        # Novos pontos, outros shots ou outro backend entram na chave
+        self.run_quiet(backend=backend, t_points=9, shots=1000, cache=cache)
+        self.assertEqual(backend.executed, 5 + 4)
+        self.run_quiet(backend=backend, t_points=5, shots=2000, cache=cache)
+        self.assertEqual(backend.executed, 9 + 5)
+        other = _CountingBackend(seed=2)
+        self.run_quiet(backend=other, t_points=5, shots=1000, cache=cache)
+        self.assertEqual(other.executed, 5)
+
+    def test_key_depends_on_circuit(self):
+        """Testa que circuitos diferentes não compartilham entradas"""
+        backend = LocalStatevectorBackend(seed=0)
+        a = ResultCache(self.tmp.name).key(backend, 0.5, 100)
+        b = ResultCache(self.tmp.name, circuit='x q[0]; ry(θ) q[0]').key(backend, 0.5, 100)
+        self.assertNotEqual(a, b)
+
+    def test_key_uses_backend_circuit(self):
+        """Testa que a chave vem do circuito que o backend executa"""
+        class Other(LocalStatevectorBackend):
+            circuit = 'x q[0]; ry(θ) q[0]; measure q[0] -> c[0]'
+
+        cache = ResultCache(self.tmp.name)
+        self.assertNotEqual(cache.key(LocalStatevectorBackend(seed=0), 0.5, 100),
+                            cache.key(Other(seed=0), 0.5, 100))
+
+    def test_unseeded_backend_is_not_cached(self):
+        """Testa que sem semente cada execução sorteia de novo e nada vai para o disco"""
+        cache = ResultCache(self.tmp.name)
+        backend = _CountingBackend()
+        self.run_quiet(backend=backend, t_points=3, shots=10, cache=cache)
+        self.run_quiet(backend=backend, t_points=3, shots=10, cache=cache)
+        self.assertEqual(backend.executed, 6)
+        self.assertEqual(list(cache.cache_dir.glob('*.json')), [])
+
+    def test_cache_disabled(self):
+        """Testa cache=False executando sempre"""
+        backend = _CountingBackend(seed=1)
+        self.run_quiet(backend=backend, t_points=3, shots=10, cache=False)
+        self.run_quiet(backend=backend, t_points=3, shots=10, cache=False)
+        self.assertEqual(backend.executed, 6)
+
+
+@unittest.skipUnless(HAS_RUNTIME, "qiskit e qiskit-ibm-runtime não instalados")
+class TestFakeBackendBatch(unittest.TestCase):
+
+    def test_single_parameterized_job(self):
+        """Testa que a varredura roda num fake backend, num só job, sem token"""
+        circuit = runner.create_decoherence_circuit()
+        self.assertEqual(len(circuit.parameters), 1)
+        self.assertEqual(circuit_spec(circuit), CIRCUIT_SPEC)
+
+        backend = runner.fake_backend('FakeManilaV2')
+        results = runner.run_experiment_async(backend=backend, t_points=5, shots=2000,
+                                              cache=False).result(timeout=300)
+        p1 = np.array([p['p1'] for p in results['data']])
+        expected = np.sin(np.pi / 4 + runner.theta_from_t(np.linspace(0, 1, 5)) / 2)**2
+        np.testing.assert_allclose(p1, expected, atol=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para a população sintética de qubits e a regressão em blocos"""
+
+import sys
+sys.path.insert(0, 'src')
+import unittest
+import numpy as np
+from model_x.qubit_population import QubitPopulation, StreamingRegression, fit_t2_vs_x
+
+
+class TestQubitPopulation(unittest.TestCase):
+
+    def test_fields_and_indicator(self):
+        """Testa os campos gerados e X = fidelidade - (1 - min(T2/T1, 1))"""
+        data = QubitPopulation(5000, n_backends=4, seed=1).generate(chunk_size=1000)
+        self.assertEqual(set(data), {'backend', 'qubit', 'T1', 'T2', 'fidelity', 'X'})
+        expected = data['fidelity'] - (1 - np.minimum(data['T2'] / data['T1'], 1))
+        np.testing.assert_allclose(data['X'], expected)
+        self.assertTrue(np.all(data['X'] > 0))
+        self.assertTrue(np.all(data['T1'] >= 100))
+        self.assertTrue(np.all((data['T2'] >= 0.5 * data['T1']) & (data['T2'] <= data['T1'])))
+        self.assertEqual(set(data['backend']), {0, 1, 2, 3})
+
+    def test_filter_drops_nonpositive_x(self):
+        """Testa que a máscara descarta qubits com X ≤ 0"""
+        population = QubitPopulation(2000, t2_ratio=(0.0, 0.2), infidelity=0.5, seed=2)
+        data = population.generate()
+        self.assertLess(data['X'].size, 2000)
+        self.assertTrue(np.all(data['X'] > 0))
+
+    def test_chunks_bounded_and_reproducible(self):
+        """Testa o tamanho dos blocos e que a população independe da divisão em blocos"""
+        population = QubitPopulation(2500, n_backends=3, seed=3)
+        sizes = [block['X'].size for block in population.chunks(1000)]
+        self.assertEqual(len(sizes), 3)
+        self.assertTrue(all(size <= 1000 for size in sizes))
+        np.testing.assert_array_equal(population.generate(1000)['T2'], population.generate(1000)['T2'])
+        np.testing.assert_array_equal(population.generate(333)['X'], population.generate(1000)['X'])
+        self.assertEqual(population.backend_names[2], 'mock_backend_2')
+
+    def test_invalid_sizes(self):
+        """Testa que populações vazias levantam ValueError"""
+        with self.assertRaises(ValueError):
+            QubitPopulation(0)
+
+
+class TestStreamingRegression(unittest.TestCase):
+
+    def setUp(self):
+        self.population = QubitPopulation(60000, n_backends=5, seed=4)
+        self.data = self.population.generate()
+
+    def test_total_fit_matches_polyfit(self):
+        """Testa a reta global acumulada em blocos contra np.polyfit"""
+        regression, kept = fit_t2_vs_x(self.population, chunk_size=7000)
+        slope, intercept = np.polyfit(self.data['X'], self.data['T2'], 1)
+        fit = regression.fit_total()
+        self.assertEqual(kept, self.data['X'].size)
+        self.assertAlmostEqual(fit['slope'], slope, places=6)
+        self.assertAlmostEqual(fit['intercept'], intercept, places=6)
+        self.assertAlmostEqual(fit['r2'], np.corrcoef(self.data['X'], self.data['T2'])[0, 1]**2, places=10)
+
+    def test_per_backend_fits(self):
+        """Testa os ajustes por backend contra ajustes separados"""
+        regression = StreamingRegression(5)
+        for start in range(0, self.data['X'].size, 9999):
+            stop = start + 9999
+            regression.update(self.data['X'][start:stop], self.data['T2'][start:stop],
+                              self.data['backend'][start:stop])
+        fit = regression.fit()
+        for backend in range(5):
+            mask = self.data['backend'] == backend
+            slope, intercept = np.polyfit(self.data['X'][mask], self.data['T2'][mask], 1)
+            self.assertAlmostEqual(fit['slope'][backend], slope, places=6)
+            self.assertAlmostEqual(fit['intercept'][backend], intercept, places=6)
+            self.assertEqual(fit['n'][backend], mask.sum())
+
+    def test_exact_line(self):
+        """Testa a recuperação exata de uma reta sem ruído"""
+        x = np.linspace(0, 1, 101)
+        fit = StreamingRegression().update(x[:40], 3 + 2 * x[:40]).update(x[40:], 3 + 2 * x[40:]).fit_total()
+        self.assertAlmostEqual(fit['intercept'], 3.0)
+        self.assertAlmostEqual(fit['slope'], 2.0)
+        self.assertAlmostEqual(fit['r2'], 1.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""Testes do backend vetorizado dos simuladores de problemas científicos"""
+
+import sys
+sys.path.insert(0, 'scripts')
+import math
+import unittest
+import warnings
+import numpy as np
+import scientific_problems_simulation as sps
+
+def assert_records_close(test, expected, actual, path=''):
+    """Compara recursivamente registros da trajetória (floats com tolerância)"""
+    if isinstance(expected, dict):
+        test.assertEqual(set(expected), set(actual), path)
+        for key in expected:
+            assert_records_close(test, expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, float):
+        test.assertTrue(math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-12),
+                        f"{path}: {expected} != {actual}")
+    else:
+        test.assertEqual(expected, actual, path)
+        test.assertIs(type(expected), type(actual), path)
+
+class TestVectorizedSimulators(unittest.TestCase):
+
+    def setUp(self):
+        self.simulators = sps.ScientificProblemsAnalyzer().simulators
+
+    def test_vectorized_matches_python_backend(self):
+        """Testa que o backend vetorizado reproduz a trajetória passo a passo"""
+        for steps in (24, 100, 333):
+            for simulator in self.simulators:
+                with self.subTest(problem=simulator.name, steps=steps):
+                    expected = simulator.simulate(steps=steps)
+                    actual = simulator.simulate_vectorized(steps=steps)
+
+                    self.assertEqual(len(expected.trajectory), len(actual.trajectory))
+                    for row_expected, row_actual in zip(expected.trajectory, actual.trajectory.to_records()):
+                        assert_records_close(self, row_expected, row_actual, simulator.name)
+                    assert_records_close(self, expected.metrics, actual.metrics, simulator.name)
+                    self.assertEqual(len(expected.predictions), len(actual.predictions))
+
+    def test_columnar_trajectory_view(self):
+        """Testa acesso por coluna e visão de lista de dicts"""
+        result = sps.NeurodegenerationSimulator().simulate_vectorized(steps=50)
+        trajectory = result.trajectory
+
+        self.assertIsInstance(trajectory, sps.ColumnarTrajectory)
+        self.assertEqual(len(trajectory), 50)
+        self.assertIsInstance(trajectory['mean_syntropy'], np.ndarray)
+        self.assertEqual(trajectory[-1], result.final_state)
+        self.assertEqual(set(trajectory[0]['regions']), set(sps.NeurodegenerationSimulator.REGIONS))
+        self.assertEqual(len(trajectory[10:20]), 10)
+        with self.assertRaises(IndexError):
+            trajectory[50]
+
+    def test_large_runs_without_overflow(self):
+        """Testa trajetórias longas sem overflow numérico"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for simulator in self.simulators:
+                result = simulator.simulate_vectorized(steps=200000)
+                self.assertEqual(len(result.trajectory), 200000 - 200000 % 5)
+
+    def test_clipped_cumsum(self):
+        """Testa varredura com limites contra o laço sequencial"""
+        rng = np.random.default_rng(0)
+        for increments in (rng.uniform(0, 0.1, 200), -rng.uniform(0, 0.1, 200), rng.normal(0, 0.1, 200)):
+            expected, x = [], 0.5
+            for inc in increments:
+                x = min(0.9, max(0.1, x + inc))
+                expected.append(x)
+            np.testing.assert_allclose(sps.clipped_cumsum(0.5, increments, 0.1, 0.9), expected, atol=1e-12)
+
+class TestParallelAnalyzer(unittest.TestCase):
+
+    @staticmethod
+    def _report_body(analyzer):
+        """Relatório sem a linha de data"""
+        return [line for line in analyzer.generate_report().splitlines() if not line.startswith('Data:')]
+
+    def test_parallel_matches_serial(self):
+        """Testa que o modo paralelo preserva ordem, resultados e relatório"""
+        serial = sps.ScientificProblemsAnalyzer()
+        serial.run_all(steps=60, verbose=False)
+
+        parallel = sps.ScientificProblemsAnalyzer()
+        parallel.run_all(steps=60, parallel=True, max_workers=2, verbose=False)
+
+        self.assertEqual([r.problem_name for r in parallel.results],
+                         [s.name for s in parallel.simulators])
+        self.assertEqual([r.metrics for r in parallel.results], [r.metrics for r in serial.results])
+        self.assertEqual(self._report_body(parallel), self._report_body(serial))
+
+    def test_timings_recorded(self):
+        """Testa tempo de parede e passos/s por problema"""
+        analyzer = sps.ScientificProblemsAnalyzer()
+        analyzer.run_all(steps=40, verbose=False)
+
+        self.assertEqual(len(analyzer.timings), 10)
+        for timing in analyzer.timings:
+            self.assertGreater(timing['wall_time'], 0)
+            self.assertGreater(timing['steps_per_second'], 0)
+        self.assertIn('TOTAL', analyzer.timing_report())
+
+    def test_run_batch_with_shared_executor(self):
+        """Testa variantes de parâmetros despachadas a um pool reutilizado"""
+        from concurrent.futures import ProcessPoolExecutor
+
+        variants = []
+        for spread_rate in (0.01, 0.05, 0.2):
+            simulator = sps.NeurodegenerationSimulator()
+            simulator.params['spread_rate'] = spread_rate
+            variants.append(simulator)
+
+        analyzer = sps.ScientificProblemsAnalyzer()
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            outputs = list(analyzer.run_batch(variants, steps=50, parallel=True,
+                                              executor=executor, backend='numpy'))
+
+        final = [result.metrics['final_syntropy'] for result, _ in outputs]
+        self.assertEqual(len(final), 3)
+        self.assertTrue(final[0] > final[1] > final[2])
+
+class TestModelConstants(unittest.TestCase):
+
+    def test_default_constants_match_globals(self):
+        """Testa que as constantes padrão reproduzem os valores universais"""
+        state = sps.SystemState(0.3, 0.7, 2.0)
+        self.assertEqual(state.phi, state.phi_with(sps.ModelConstants()))
+        self.assertEqual(sps.ModelConstants().as_dict(),
+                         {'alpha': sps.ALPHA, 'beta': sps.BETA, 'gamma': sps.GAMMA, 'E0': sps.E0})
+
+    def test_constants_per_run(self):
+        """Testa que cada execução usa suas próprias constantes"""
+        constants = sps.ModelConstants(alpha=0.5, beta=0.2, gamma=1.0, E0=2.0)
+        analyzer = sps.ScientificProblemsAnalyzer(constants)
+        self.assertTrue(all(s.constants is constants for s in analyzer.simulators))
+
+        default = sps.QuantumGravitySimulator().simulate(steps=50)
+        custom = sps.QuantumGravitySimulator(constants).simulate(steps=50)
+        self.assertNotEqual(default.metrics['mean_phi'], custom.metrics['mean_phi'])
+
+        state = custom.trajectory[-1]
+        expected = sps.compute_phi(state['entropy'], state['syntropy'], state['energy'], constants)
+        self.assertAlmostEqual(state['phi'], expected)
+
+    def test_vector_constants_broadcast(self):
+        """Testa constantes (n, 1) no backend vetorizado contra execuções individuais"""
+        alphas = np.array([0.2, 0.3, 0.4])
+        betas = np.array([0.5, 0.7, 0.9])
+        batched = sps.ModelConstants(alpha=alphas[:, None], beta=betas[:, None])
+
+        for simulator_class in (sps.DarkMatterEnergySimulator, sps.ConsciousnessSimulator):
+            phi = simulator_class(batched).trajectory_arrays(steps=50).column('phi')
+            self.assertEqual(phi.shape, (3, 50))
+            for k in range(3):
+                single = sps.ModelConstants(alpha=alphas[k], beta=betas[k])
+                expected = simulator_class(single).trajectory_arrays(steps=50).column('phi')
+                np.testing.assert_allclose(phi[k], expected)
+
+
+class TestSensitivityAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        import sensitivity_analysis
+        self.sa = sensitivity_analysis
+
+    def test_sobol_indices_additive_model(self):
+        """Testa S1/ST num modelo aditivo com índices analíticos"""
+        analyzer = self.sa.SobolSensitivityAnalyzer(n_samples=1024, n_resamples=200)
+        A, B, AB = analyzer.sample_design()
+        weights = np.array([1.0, 2.0, 0.0, 0.0])
+        # Normalizar para [0, 1] para que os pesos definam as variâncias
+        lower = np.array([analyzer.bounds[n][0] for n in analyzer.names])
+        width = np.array([analyzer.bounds[n][1] for n in analyzer.names]) - lower
+        model = lambda x: ((x - lower) / width) @ weights
+
+        indices = analyzer.analyze_outputs(model(A), model(B), model(AB))
+        self.assertAlmostEqual(indices['alpha']['S1']['point'], 0.2, delta=0.05)
+        self.assertAlmostEqual(indices['beta']['S1']['point'], 0.8, delta=0.05)
+        self.assertAlmostEqual(indices['beta']['ST']['point'], 0.8, delta=0.05)
+        self.assertEqual(indices['gamma']['ST']['point'], 0.0)
+        for name in analyzer.names:
+            ci = indices[name]['ST']
+            self.assertLessEqual(ci['lower'], ci['upper'])
+
+    def test_run_and_cache(self):
+        """Testa a análise completa dos dez problemas e o reaproveitamento do cache"""
+        analyzer = self.sa.SobolSensitivityAnalyzer(n_samples=64, n_resamples=50, steps=40)
+        results = analyzer.run(verbose=False)
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results['Resistência Antimicrobiana'], {})
+        self.assertIn('mean_consciousness', results['Consciência'])
+        self.assertEqual(analyzer.cache_hits, 0)
+
+        analyzer.run(verbose=False)
+        self.assertEqual(analyzer.cache_hits, analyzer.cache_misses)
+        self.assertIn('SOBOL', analyzer.generate_report())
+
+    def test_evaluate_matches_single_runs(self):
+        """Testa a avaliação em lote contra simulações com constantes escalares"""
+        analyzer = self.sa.SobolSensitivityAnalyzer(n_samples=8, steps=30)
+        simulator = sps.OriginOfLifeSimulator()
+        samples, _, _ = analyzer.sample_design()
+        outputs = analyzer.evaluate(simulator, samples)
+
+        for k, row in enumerate(samples):
+            constants = sps.ModelConstants(*row)
+            result = sps.OriginOfLifeSimulator(constants).simulate(steps=30)
+            self.assertAlmostEqual(outputs['phi_final'][k], result.trajectory[-1]['phi'])
+
+    def test_invalid_sample_count(self):
+        """Testa que n_samples precisa ser potência de 2"""
+        with self.assertRaises(ValueError):
+            self.sa.SobolSensitivityAnalyzer(n_samples=100)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
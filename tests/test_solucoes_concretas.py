@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""Testes do registro sob demanda de SOLUCOES_CONCRETAS"""
+
+import sys
+sys.path.insert(0, 'scripts')
+import io
+import os
+import json
+import subprocess
+import tempfile
+import unittest
+import numpy as np
+from contextlib import redirect_stdout
+import SOLUCOES_CONCRETAS as sc
+
+class TestSolutionRegistry(unittest.TestCase):
+
+    def test_import_is_side_effect_free(self):
+        """Testa que importar o módulo não imprime, não resolve e não carrega scipy"""
+        code = ("import sys; sys.path.insert(0, 'scripts'); import SOLUCOES_CONCRETAS as sc; "
+                "print(len(sc.SOLUTIONS), len(sc._RESULTS), 'scipy' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                check=True).stdout
+        self.assertEqual(output.strip(), '10 0 False')
+
+    def test_registry_lookup(self):
+        """Testa a busca por número, nome e chave JSON"""
+        self.assertEqual([entry.number for entry in sc.SOLUTIONS.values()], list(range(1, 11)))
+        entry = sc.get_entry('3')
+        self.assertIs(entry, sc.get_entry('origem_da_vida'))
+        self.assertIs(entry, sc.get_entry('3_origem_da_vida'))
+        self.assertIs(entry.solution_class, sc.OriginOfLifeSolution)
+        with self.assertRaises(KeyError):
+            sc.get_entry('inexistente')
+
+    def test_solve_on_demand(self):
+        """Testa que apenas os problemas pedidos são resolvidos e memorizados"""
+        sc._RESULTS.clear()
+        results = sc.solve_all(['envelhecimento', 1])
+        self.assertEqual(list(results), ['1_materia_escura_energia_escura', '6_envelhecimento'])
+        self.assertEqual(set(sc._RESULTS), {sc.cache_key('materia_escura_energia_escura'),
+                                            sc.cache_key('envelhecimento')})
+        self.assertIs(sc.solve(6), results['6_envelhecimento'])
+
+    def test_physical_constants_match_scipy(self):
+        """Testa as constantes fixadas contra scipy.constants"""
+        from scipy import constants
+        for name, reference in (('c', constants.c), ('G', constants.G), ('hbar', constants.hbar),
+                                ('k_B', constants.k), ('e', constants.e), ('m_e', constants.m_e),
+                                ('m_p', constants.m_p), ('epsilon_0', constants.epsilon_0),
+                                ('alpha', constants.alpha)):
+            self.assertAlmostEqual(getattr(sc, name) / reference, 1.0, places=8, msg=name)
+
+    def test_cli_selection(self):
+        """Testa a CLI resolvendo um subconjunto e gravando o JSON"""
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'solucoes.json')
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                self.assertEqual(sc.main(['10', '--output', filename, '--no-cache']), 0)
+
+            self.assertIn('PROBLEMA 10: FUSÃO NUCLEAR CONTROLADA', stdout.getvalue())
+            self.assertNotIn('PROBLEMA 1:', stdout.getvalue())
+            with open(filename, encoding='utf-8') as f:
+                data = json.load(f)
+            self.assertEqual(list(data['solucoes']), ['10_fusao_nuclear'])
+            self.assertEqual(data['constantes_modelo_x']['alpha'], sc.MX.alpha)
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = sc.ResultCache(self.tmp.name)
+        sc._RESULTS.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        sc._RESULTS.clear()
+
+    def test_cached_results_match_fresh(self):
+        """Testa que o resultado carregado do disco é igual ao recalculado"""
+        fresh = sc.solve_all(cache=self.cache)
+        self.assertEqual(self.cache.misses, 10)
+
+        sc._RESULTS.clear()
+        cached = sc.solve_all(cache=self.cache)
+        self.assertEqual(self.cache.hits, 10)
+        self.assertEqual(cached, fresh)
+
+    def test_key_invalidation(self):
+        """Testa que alterar alpha, beta, gamma ou E0 muda a chave"""
+        base = sc.cache_key('envelhecimento')
+        self.assertEqual(base, sc.cache_key('envelhecimento', sc.ModeloXParams()))
+        self.assertNotEqual(base, sc.cache_key('cancer'))
+        for field in ('alpha', 'beta', 'gamma', 'E0'):
+            params = sc.ModeloXParams(**{field: getattr(sc.MX, field) * 1.01})
+            self.assertNotEqual(base, sc.cache_key('envelhecimento', params), field)
+
+    def test_params_reach_solver(self):
+        """Testa que parâmetros diferentes são recalculados com os novos valores"""
+        default = sc.solve('gravidade_quantica', cache=self.cache)
+        custom = sc.solve('gravidade_quantica', sc.ModeloXParams(alpha=0.4), cache=self.cache)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertNotEqual(default['constante_unificacao']['energia_unificacao_GeV'],
+                            custom['constante_unificacao']['energia_unificacao_GeV'])
+
+    def test_atomic_store_and_corrupt_entry(self):
+        """Testa a gravação sem temporários residuais e a recuperação de entrada corrompida"""
+        key = sc.cache_key('cancer')
+        self.cache.store(key, {'valor': 1.5})
+        self.assertEqual(os.listdir(self.tmp.name), [f"{key}.json.gz"])
+        self.assertEqual(self.cache.load(key), {'valor': 1.5})
+
+        with open(self.cache.path(key), 'wb') as f:
+            f.write(b'corrompido')
+        self.assertIsNone(self.cache.load(key))
+        self.assertEqual(self.cache.clear(), 1)
+
+class TestBatchedRoots(unittest.TestCase):
+
+    def test_bracketed_roots_match_brentq(self):
+        """Testa o solver em lote contra scipy.optimize.brentq"""
+        from scipy.optimize import brentq
+        func = lambda x, c: np.cos(x) - c * x
+        coefficients = np.linspace(0.1, 5.0, 25)
+
+        roots, converged = sc.bracketed_roots(func, 0.0, 2.0, (coefficients,))
+        expected = [brentq(func, 0.0, 2.0, args=(c,)) for c in coefficients]
+        self.assertTrue(converged.all())
+        np.testing.assert_allclose(roots, expected, atol=1e-11)
+
+    def test_no_sign_change_is_nan(self):
+        """Testa que intervalos sem troca de sinal retornam NaN"""
+        roots, converged = sc.bracketed_roots(lambda x: x**2 + 1, [-1.0, 0.0], [1.0, 2.0])
+        self.assertTrue(np.isnan(roots).all())
+        self.assertFalse(converged.any())
+
+    def test_warm_started_grid(self):
+        """Testa a grade com partida a quente contra a solução exata"""
+        targets = np.linspace(1, 100, 300)[None, :] * np.linspace(0.5, 2.0, 40)[:, None]
+        roots = sc.solve_roots_grid(lambda x, c: x**3 - c, (targets,), 0.0, 10.0, stride=16)
+        self.assertEqual(roots.shape, targets.shape)
+        np.testing.assert_allclose(roots, np.cbrt(targets), atol=1e-10)
+
+        # Região sem raiz no intervalo
+        roots = sc.solve_roots_grid(lambda x, c: x**3 - c, (np.array([8.0, 2000.0]),), 0.0, 10.0)
+        self.assertAlmostEqual(roots[0], 2.0)
+        self.assertTrue(np.isnan(roots[1]))
+
+    def test_aging_intervention_grid(self):
+        """Testa a varredura de intervenções contra os ganhos de solve()"""
+        aging = sc.AgingSolution()
+        result = aging.solve()
+        lambda_effects = np.array([p['efeito_lambda'] for p in result['intervencoes'].values()])
+        mu_effects = np.array([p['efeito_mu'] for p in result['intervencoes'].values()])
+
+        gains = aging.intervention_gains(lambda_effects, mu_effects)
+        expected = [p['ganho_anos'] for p in result['intervencoes'].values()]
+        np.testing.assert_allclose(gains, expected, atol=1e-8)
+
+        grid = aging.intervention_gains(np.linspace(-0.3, 0, 31)[:, None], np.linspace(-0.3, 0, 21))
+        self.assertEqual(grid.shape, (31, 21))
+        self.assertAlmostEqual(grid[-1, -1], 0.0, places=8)
+        # Reduzir λ ou μ nunca encurta a vida
+        self.assertTrue((np.diff(grid, axis=0) <= 1e-9).all())
+
+    def test_origin_of_life_critical_energies(self):
+        """Testa ℰ crítica em lote contra brentq escalar e o fallback linear"""
+        from scipy.optimize import brentq
+        life = sc.OriginOfLifeSolution()
+        deltas = np.linspace(0.1, 2.0, 20)
+        energies = life.critical_energies(deltas)
+
+        for delta, energy in zip(deltas, energies):
+            residual = lambda e: sc.g_S(e) - sc.f_E(e) - delta
+            try:
+                expected = brentq(residual, 0.01, 10)
+            except ValueError:
+                expected = delta / (sc.MX.beta - sc.MX.alpha)
+            self.assertAlmostEqual(energy, expected, places=9)
+
+        grid = life.critical_energies(1.5, alpha=np.linspace(0.2, 0.4, 5)[:, None],
+                                      beta=np.linspace(0.5, 0.9, 7))
+        self.assertEqual(grid.shape, (5, 7))
+
+class TestNeurodegenerationEnsemble(unittest.TestCase):
+
+    def setUp(self):
+        self.neuro = sc.NeurodegenerationSolution()
+        self.t = np.linspace(0, 15, 31)
+
+    def test_closed_form_matches_ode_ensemble(self):
+        """Testa a solução exata contra a integração em lote com passo compartilhado"""
+        k = np.linspace(0.05, 0.3, 12)[:, None]
+        seeds = np.linspace(0.1, 0.6, 4)
+
+        exact = self.neuro.propagation_ensemble(k, seeds, self.t)
+        integrated = self.neuro.propagation_ensemble(k, seeds, self.t, method='ode')
+        self.assertEqual(exact.shape, (12, 4, 31))
+        np.testing.assert_allclose(integrated, exact, rtol=1e-6, atol=1e-6)
+
+    def test_closed_form_matches_single_solve_ivp(self):
+        """Testa um conjunto isolado contra solve_ivp escalar"""
+        from scipy.integrate import solve_ivp
+        solution = solve_ivp(lambda t, S: self.neuro.propagation_model(t, S, 0.15, 0.3),
+                             (0, 15), [0.9], t_eval=self.t, rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(self.neuro.propagation_closed_form(self.t, 0.15, 0.3),
+                                   solution.y[0], atol=1e-8)
+
+    def test_threshold_time_and_fit(self):
+        """Testa o tempo até o limiar e o ajuste vetorizado de k_spread"""
+        k = np.array([0.08, 0.15, 0.25])
+        t_half = self.neuro.time_to_threshold(0.5, k)
+        np.testing.assert_allclose(self.neuro.propagation_closed_form(t_half, k), 0.5)
+
+        rng = np.random.default_rng(42)
+        series = self.neuro.propagation_ensemble(k, 0.3, self.t)
+        noisy = 1 - (1 - series) * np.exp(rng.normal(0, 0.01, series.shape))
+        np.testing.assert_allclose(self.neuro.fit_spread_rate(self.t, noisy), k, rtol=0.02)
+
+    def test_unknown_method(self):
+        """Testa que métodos desconhecidos levantam ValueError"""
+        with self.assertRaises(ValueError):
+            self.neuro.propagation_ensemble(0.1, 0.3, self.t, method='euler')
+
+class TestVectorizedModulation(unittest.TestCase):
+    """Testa f_E, g_S e Phi vetorizados"""
+
+    def test_scalar_values_unchanged(self):
+        """Testa que escalares dão os mesmos valores da forma fechada"""
+        p = sc.MX
+        for energy in (0.1, 1.0, 2.5, 40.0):
+            self.assertEqual(sc.f_E(energy), 1 + p.alpha * np.log(energy / p.E0))
+            self.assertEqual(sc.g_S(energy), 1 + p.beta * (energy / p.E0)**p.gamma)
+        self.assertEqual(sc.f_E(0.0), 1.0)
+        self.assertEqual(sc.g_S(-3.0), 1.0)
+        self.assertEqual(np.ndim(sc.Phi(0.4, 0.6, 2.0)), 0)
+
+    def test_nonpositive_energies_masked(self):
+        """Testa que ℰ ≤ 0 dá 1 sem avisos dentro de um array"""
+        energy = np.array([-1.0, 0.0, 0.5, 2.0])
+        with np.errstate(all='raise'):
+            f = sc.f_E(energy)
+            g = sc.g_S(energy)
+        np.testing.assert_array_equal(f[:2], 1.0)
+        np.testing.assert_array_equal(g[:2], 1.0)
+        self.assertEqual(f[3], sc.f_E(2.0))
+        self.assertEqual(g[2], sc.g_S(0.5))
+
+    def test_params_sequence_broadcast(self):
+        """Testa o eixo extra para uma sequência de ModeloXParams"""
+        params = [sc.ModeloXParams(alpha=a, beta=1 - a) for a in (0.2, 0.3, 0.4)]
+        energy = np.linspace(0.1, 5, 20).reshape(4, 5)
+        phi = sc.Phi(0.4, 0.6, energy, params)
+        self.assertEqual(phi.shape, (3, 4, 5))
+        for i, p in enumerate(params):
+            np.testing.assert_allclose(phi[i], sc.Phi(0.4, 0.6, energy, p))
+        self.assertEqual(sc.f_E(1.5, params).shape, (3,))
+
+    def test_million_point_grid(self):
+        """Testa uma grade de 10⁶ pontos (E, S, ℰ) em uma única chamada"""
+        E, S = np.meshgrid(np.linspace(0, 1, 100), np.linspace(0, 1, 100), indexing='ij')
+        energy = np.linspace(-1, 10, 100)
+        phi = sc.Phi(E[..., None], S[..., None], energy)
+        self.assertEqual(phi.shape, (100, 100, 100))
+        self.assertTrue(np.all(np.isfinite(phi)))
+        self.assertAlmostEqual(phi[50, 20, 70], sc.Phi(E[50, 20], S[50, 20], energy[70]))
+
+class TestFusionGridExplorer(unittest.TestCase):
+    """Testa a varredura em blocos do fator Q de fusão"""
+
+    def setUp(self):
+        self.fusion = sc.NuclearFusionSolution
+        self.n = np.logspace(19, 21, 30)
+        self.T = np.linspace(2, 60, 40)
+        self.tau = np.logspace(-1, 2, 120)
+
+    def test_linear_contour_matches_closed_form(self):
+        """Testa o contorno Q = 1 do modelo de Lawson contra τ = limiar/(10 n T)"""
+        explorer = sc.FusionGridExplorer(self.n, self.T, self.tau, chunk_points=10000)
+        self.assertGreater(sum(1 for _ in explorer.chunks()), 1)
+        result = explorer.explore(levels=(1.0,))
+        expected = self.fusion.lawson_threshold / (10 * self.n[:, None] * self.T[None, :])
+        inside = (expected >= self.tau[0]) & (expected <= self.tau[-1])
+        np.testing.assert_allclose(result['tau_contorno'][1.0][inside], expected[inside], rtol=1e-12)
+        self.assertTrue(np.isnan(result['tau_contorno'][1.0][expected > self.tau[-1]]).all())
+
+    def test_energy_balance_contours_and_ignition(self):
+        """Testa o contorno Q = 10 e a fronteira de ignição do balanço de energia"""
+        explorer = sc.FusionGridExplorer(self.n, self.T, self.tau,
+                                         q_func=self.fusion.Q_energy_balance, chunk_points=10000)
+        result = explorer.explore(levels=(10.0,))
+
+        T_joule = self.T * 1e3 * sc.e
+        P_fusion = self.n[:, None]**2 / 4 * self.fusion.dt_reactivity(self.T) * 17.59e6 * sc.e
+        P_alpha = P_fusion * 3.52 / 17.59
+        contour = result['tau_contorno'][10.0]
+        found = ~np.isnan(contour)
+        self.assertTrue(found.any())
+        np.testing.assert_allclose(contour[found],
+                                   (3 * self.n[:, None] * T_joule / (P_fusion / 10 + P_alpha))[found],
+                                   rtol=1e-10)
+
+        ignition = result['tau_ignicao']
+        ignited = ~np.isnan(ignition)
+        tau_exact = (3 * self.n[:, None] * T_joule / P_alpha)[ignited]
+        self.assertTrue(np.all(ignition[ignited] >= tau_exact * (1 - 1e-12)))
+        self.assertTrue(np.all(ignition[ignited] <= tau_exact * self.tau[1] / self.tau[0] * (1 + 1e-12)))
+
+    def test_ridge_and_beta_limit(self):
+        """Testa a crista de operação sob limite β e o T ótimo perto de 13 keV"""
+        explorer = sc.FusionGridExplorer(self.n, self.T, self.tau,
+                                         q_func=self.fusion.Q_energy_balance, B=5.3)
+        result = explorer.explore()
+        self.assertLess(result['pontos_viaveis'], result['pontos'])
+
+        ridge = result['crista']
+        pressure = ridge['n'] * ridge['T'] * 1e3 * sc.e
+        self.assertTrue(np.all(pressure <= 0.05 * 5.3**2 / (2 * 4 * np.pi * 1e-7) * (1 + 1e-12)))
+        self.assertTrue(10 <= ridge['T'][0] <= 16)
+        np.testing.assert_array_equal(ridge['Q'][0], np.nanmax(result['Q_max'][:, 0]))
+
+    def test_stream_to_disk(self):
+        """Testa a gravação da malha completa em .npy mapeado em memória"""
+        explorer = sc.FusionGridExplorer(self.n[:5], self.T[:6], self.tau[:7], chunk_points=42)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'q.npy')
+            explorer.explore(output=path)
+            stored = np.load(path)
+        expected = self.fusion.Q_factor(self.n[:5, None, None], self.T[None, :6, None], self.tau[:7])
+        np.testing.assert_allclose(stored, expected, rtol=1e-6)
+
+    def test_rejects_unsorted_tau(self):
+        """Testa que eixos τ fora de ordem levantam ValueError"""
+        with self.assertRaises(ValueError):
+            sc.FusionGridExplorer(self.n, self.T, self.tau[::-1])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -6,6 +6,7 @@ sys.path.insert(0, 'src')
 import unittest
 import json
 import os
+import numpy as np
 from model_x import ModelXVisualizer, SimulationEngine
 
 class TestModelXVisualizer(unittest.TestCase):
@@ -51,6 +52,113 @@ class TestModelXVisualizer(unittest.TestCase):
         self.assertIn("+", ascii_chart)  # Bordas
         self.assertIn("|", ascii_chart)  # Bordas verticais
     
+    def test_ascii_plot_long_series_keeps_peaks(self):
+        """Testa que séries longas são reduzidas sem perder picos"""
+        data = np.sin(np.linspace(0, 20 * np.pi, 200000))
+        data[123457] = 5.0
+        data[7] = -5.0
+        ascii_chart = self.viz.ascii_plot(data, "Longa", width=60, height=15)
+
+        self.assertIn("Min: -5.000 | Max: 5.000", ascii_chart)
+        rows = [line for line in ascii_chart.splitlines() if line.startswith('|')]
+        self.assertEqual(len(rows), 15)
+        self.assertIn('*', rows[0])   # pico máximo na linha superior
+        self.assertIn('*', rows[-1])  # pico mínimo na linha inferior
+
+    def test_downsample_minmax(self):
+        """Testa redução min/max por bucket"""
+        data = np.random.default_rng(0).normal(size=10000)
+        data[4321] = 100.0
+        indices = ModelXVisualizer.downsample(data, 100)
+
+        self.assertLessEqual(len(indices), 100)
+        self.assertIn(4321, indices)
+        self.assertIn(int(np.argmin(data)), indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_downsample_lttb(self):
+        """Testa redução Largest-Triangle-Three-Buckets"""
+        data = np.random.default_rng(1).normal(size=5000)
+        data[2500] = 50.0
+        indices = ModelXVisualizer.downsample(data, 200, method='lttb')
+
+        self.assertEqual(len(indices), 200)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 4999)
+        self.assertIn(2500, indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_downsample_short_series_unchanged(self):
+        """Testa que séries curtas não são reduzidas"""
+        np.testing.assert_array_equal(ModelXVisualizer.downsample([3, 1, 2], 10), [0, 1, 2])
+
+    def test_export_simulation_data_downsampled(self):
+        """Testa exportação JSON já reduzida"""
+        history = [
+            {'step': i, 'time': i * 0.01, 'state': {'entropy': 0.5, 'syntropy': 0.5, 'energy': 1.0},
+             'dilation': 10.0 if i == 777 else float(np.sin(i / 50))}
+            for i in range(5000)
+        ]
+
+        filename = 'test_export_downsampled.json'
+        self.viz.export_simulation_data(history, filename, max_points=100)
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        os.remove(filename)
+
+        self.assertLessEqual(len(data['time']), 100)
+        self.assertEqual(len(data['time']), len(data['energy']))
+        self.assertIn(10.0, data['dilation'])
+        self.assertAlmostEqual(data['time'][data['dilation'].index(10.0)], 7.77)
+
+    def test_ensemble_bands(self):
+        """Testa percentis vetorizados sobre array (N, passos)"""
+        rng = np.random.default_rng(2)
+        arrays = {'dilation': rng.normal(1.0, 0.1, (500, 40))}
+        bands = self.viz.ensemble_bands(arrays)
+
+        self.assertEqual(bands['dilation'].shape, (3, 40))
+        np.testing.assert_allclose(bands['dilation'][1], np.median(arrays['dilation'], axis=0))
+        self.assertTrue(np.all(bands['dilation'][0] <= bands['dilation'][2]))
+
+    def test_ensemble_arrays_pads_shorter_runs(self):
+        """Testa conversão de históricos de comprimentos diferentes"""
+        histories = [
+            self.sim.run_simulation({'entropy': 0.3, 'syntropy': 0.7, 'energy': 1.5}),
+            self.sim.run_simulation({'entropy': 0.6, 'syntropy': 0.4, 'energy': 1.0})[:10]
+        ]
+        arrays = self.viz.ensemble_arrays(histories)
+
+        self.assertEqual(arrays['entropy'].shape, (2, len(histories[0])))
+        self.assertTrue(np.isnan(arrays['entropy'][1, 10:]).all())
+        bands = self.viz.ensemble_bands(arrays)
+        self.assertFalse(np.isnan(bands['entropy']).any())
+
+    def test_ascii_band_plot(self):
+        """Testa gráfico ASCII de banda"""
+        steps = np.linspace(0, 1, 1000)
+        chart = self.viz.ascii_band_plot(steps - 0.1, steps, steps + 0.1, "Banda", width=30, height=8)
+
+        self.assertIn("Banda", chart)
+        self.assertIn("Min: -0.100 | Max: 1.100", chart)
+        rows = [line for line in chart.splitlines() if line.startswith('|')]
+        self.assertEqual(len(rows), 8)
+        self.assertTrue(all(len(row) == 32 for row in rows))
+        self.assertIn('*', chart)
+        self.assertIn(':', chart)
+
+    def test_print_ensemble_summary(self):
+        """Testa resumo único para ensemble de trajetórias"""
+        histories = [
+            self.sim.run_simulation({'entropy': e, 'syntropy': 1 - e, 'energy': 1.0})
+            for e in np.linspace(0.2, 0.8, 8)
+        ]
+        bands = self.viz.print_ensemble_summary(histories)
+
+        self.assertEqual(set(bands), {'dilation', 'entropy', 'syntropy'})
+        self.assertEqual(bands['syntropy'].shape, (3, len(histories[0])))
+        self.assertIsNone(self.viz.print_ensemble_summary([]))
+
     def test_simulation_summary(self):
         """Testa geração de resumo da simulação"""
         # Criar histórico de teste